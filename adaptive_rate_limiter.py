@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Adaptive Rate Limiting for Adobe PDF Batch Processing
+AIMD concurrency and rate controller driven by observed job latency and throttling responses
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    from exceptions import TemporaryAPIError, APIQuotaExceededError
+except ImportError:
+    TemporaryAPIError = APIQuotaExceededError = None
+
+logger = logging.getLogger(__name__)
+
+# Error message fragments that indicate the API is throttling us
+THROTTLING_MARKERS = ('429', 'too many requests', 'rate limit', 'throttl')
+
+
+@dataclass
+class AdaptiveRateConfig:
+    """Configuration for adaptive rate control"""
+    initial_rate_per_minute: float = 30.0
+    min_rate_per_minute: float = 5.0
+    max_rate_per_minute: float = 120.0
+    initial_concurrency: int = 5
+    min_concurrency: int = 1
+    max_concurrency: int = 5
+    rate_increase_step: float = 2.0  # Additive increase per stable round (jobs/min)
+    decrease_factor: float = 0.5  # Multiplicative decrease on throttling
+    latency_tolerance: float = 0.25  # Allowed p95 rise over baseline before backing off
+    latency_window: int = 20  # Recent job latencies used for p95
+    adaptive: bool = True  # False keeps the initial rate and concurrency fixed
+
+
+class AdaptiveRateController:
+    """
+    Async rate and concurrency limiter with AIMD adjustment
+
+    Used as an async context manager around each job, like ``asyncio_throttle.Throttler``.
+    Job starts are paced at the current rate and the number of jobs inside the
+    context is capped at the current concurrency limit. After every round of
+    successful jobs the limits grow additively while p95 latency stays near its
+    baseline; throttling responses cut them multiplicatively.
+    """
+
+    def __init__(self, config: Optional[AdaptiveRateConfig] = None):
+        self.config = config or AdaptiveRateConfig()
+        self.rate_per_minute = self.config.initial_rate_per_minute
+        self.concurrency_limit = self.config.initial_concurrency
+
+        self.in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._next_start = 0.0
+
+        self._latencies: deque = deque(maxlen=self.config.latency_window)
+        self._successes_since_adjustment = 0
+        self._baseline_p95: Optional[float] = None
+        self._last_decrease = 0.0
+
+        self.stats = {
+            'increases': 0,
+            'decreases': 0,
+            'throttle_events': 0,
+            'jobs_observed': 0
+        }
+
+    async def acquire(self):
+        """Wait for a free concurrency slot and the next paced start time"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.concurrency_limit)
+            self.in_flight += 1
+
+            # Reserve the next start slot while holding the lock so starts stay evenly spaced
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + 60.0 / self.rate_per_minute
+
+        delay = start_at - now
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # The caller never enters the context, so __aexit__ would not free the slot
+                await self.release()
+                raise
+
+    async def release(self):
+        """Free a concurrency slot"""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+    @staticmethod
+    def is_throttling_error(error: Any) -> bool:
+        """Check whether an exception or error message indicates API throttling"""
+        if error is None:
+            return False
+        if TemporaryAPIError is not None and isinstance(error, (TemporaryAPIError, APIQuotaExceededError)):
+            return True
+        message = str(error).lower()
+        return any(marker in message for marker in THROTTLING_MARKERS)
+
+    def record_outcome(self, latency: float, throttled: bool = False):
+        """
+        Feed a finished job back into the controller
+
+        Args:
+            latency: Job wall-clock time in seconds
+            throttled: Whether the job hit a throttling response
+        """
+        self.stats['jobs_observed'] += 1
+        if not self.config.adaptive:
+            return
+
+        if throttled:
+            self.stats['throttle_events'] += 1
+            self._decrease(self.config.decrease_factor, "throttling response")
+            return
+
+        self._latencies.append(latency)
+        self._successes_since_adjustment += 1
+
+        # Adjust once per round, i.e. after a full concurrency window of jobs
+        if self._successes_since_adjustment < self.concurrency_limit:
+            return
+        self._successes_since_adjustment = 0
+
+        p95 = self._latency_p95()
+        if self._baseline_p95 is None:
+            self._baseline_p95 = p95
+
+        if p95 <= self._baseline_p95 * (1 + self.config.latency_tolerance):
+            self._increase()
+            self._baseline_p95 = min(self._baseline_p95, p95)
+        else:
+            # Latency gradient is rising: back off gently and let the baseline drift
+            self._decrease(1 - (1 - self.config.decrease_factor) / 5, f"p95 latency {p95:.1f}s")
+            self._baseline_p95 = 0.9 * self._baseline_p95 + 0.1 * p95
+
+    def _latency_p95(self) -> float:
+        """95th percentile of recent job latencies"""
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def _increase(self):
+        """Additive increase of rate and concurrency"""
+        new_rate = min(self.config.max_rate_per_minute, self.rate_per_minute + self.config.rate_increase_step)
+        new_concurrency = min(self.config.max_concurrency, self.concurrency_limit + 1)
+
+        if new_rate != self.rate_per_minute or new_concurrency != self.concurrency_limit:
+            self.rate_per_minute = new_rate
+            self._set_concurrency(new_concurrency)
+            self.stats['increases'] += 1
+            logger.debug(f"Rate limit raised to {self.rate_per_minute:.1f}/min, concurrency {self.concurrency_limit}")
+
+    def _decrease(self, factor: float, reason: str):
+        """Multiplicative decrease of rate and concurrency"""
+        now = time.monotonic()
+
+        # A burst of throttled jobs from one round should only cut the limits once
+        cooldown = self._latency_p95() if self._latencies else 1.0
+        if now - self._last_decrease < cooldown:
+            return
+        self._last_decrease = now
+
+        self.rate_per_minute = max(self.config.min_rate_per_minute, self.rate_per_minute * factor)
+        self._set_concurrency(max(self.config.min_concurrency, int(self.concurrency_limit * factor)))
+        self._successes_since_adjustment = 0
+        self.stats['decreases'] += 1
+        logger.info(f"⬇️  Backing off ({reason}): {self.rate_per_minute:.1f}/min, concurrency {self.concurrency_limit}")
+
+    def _set_concurrency(self, limit: int):
+        """Change the concurrency limit and wake waiters if slots opened up"""
+        grew = limit > self.concurrency_limit
+        self.concurrency_limit = limit
+        if grew and self._condition is not None:
+            asyncio.ensure_future(self._notify_waiters())
+
+    async def _notify_waiters(self):
+        async with self._condition:
+            self._condition.notify_all()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get current limits and adjustment counters"""
+        return {
+            'rate_limit_per_minute': round(self.rate_per_minute, 2),
+            'concurrency_limit': self.concurrency_limit,
+            'in_flight': self.in_flight,
+            'p95_latency': self._latency_p95() if self._latencies else None,
+            'baseline_p95_latency': self._baseline_p95,
+            'adaptive': self.config.adaptive,
+            **self.stats
+        }
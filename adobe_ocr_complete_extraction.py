@@ -7,13 +7,15 @@ and get exact securities data with names, ISINs, prices, and values
 
 import os
 import json
-import requests
-import time
+import asyncio
 import zipfile
 import pandas as pd
 import re
 import logging
 
+from adobe_rest_client import AdobeRESTClient
+from token_manager import FileTokenStore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -27,11 +29,19 @@ class AdobeOCRCompleteExtractor:
         self.output_dir = "adobe_ocr_complete_results"
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # OCR can take 5-15 minutes for complete text extraction
+        self.client = AdobeRESTClient(self.client_id, self.client_secret, job_timeout=900,
+                                      token_store=FileTokenStore())
+        
         self.all_securities = []
         self.all_text_data = []
     
     def extract_all_securities_with_adobe_ocr(self):
         """Extract ALL securities using Adobe's dedicated OCR API"""
+        return asyncio.run(self.extract_all_securities_with_adobe_ocr_async())
+    
+    async def extract_all_securities_with_adobe_ocr_async(self):
+        """Extract ALL securities over the shared async REST client"""
         
         print("🔍 **ADOBE OCR COMPLETE SECURITIES EXTRACTION**")
         print("=" * 70)
@@ -44,94 +54,58 @@ class AdobeOCRCompleteExtractor:
             print(f"❌ PDF not found: {pdf_path}")
             return None
         
-        # Get access token
-        access_token = self.get_access_token()
-        if not access_token:
-            print("❌ Failed to get Adobe access token")
-            return None
-        
-        print("✅ Adobe authentication successful")
-        
-        try:
-            # Step 1: Upload PDF
-            asset_id = self.upload_pdf(pdf_path, access_token)
-            if not asset_id:
-                return None
-            
-            # Step 2: Submit OCR job
-            job_url = self.submit_ocr_job(asset_id, access_token)
-            if not job_url:
+        async with self.client:
+            # Get access token
+            access_token = await self.get_access_token()
+            if not access_token:
+                print("❌ Failed to get Adobe access token")
                 return None
             
-            # Step 3: Wait for completion and get results
-            results = self.get_ocr_results(job_url, access_token)
+            print("✅ Adobe authentication successful")
             
-            return results
-            
-        except Exception as e:
-            print(f"❌ Adobe OCR extraction failed: {e}")
-            return None
+            try:
+                # Step 1: Upload PDF
+                asset_id = await self.upload_pdf(pdf_path)
+                if not asset_id:
+                    return None
+                
+                # Step 2: Submit OCR job
+                job_url = await self.submit_ocr_job(asset_id)
+                if not job_url:
+                    return None
+                
+                # Step 3: Wait for completion and get results
+                results = await self.get_ocr_results(job_url)
+                
+                return results
+                
+            except Exception as e:
+                print(f"❌ Adobe OCR extraction failed: {e}")
+                return None
     
-    def get_access_token(self):
+    async def get_access_token(self):
         """Get Adobe access token"""
-        auth_url = "https://ims-na1.adobelogin.com/ims/token/v1"
-        auth_data = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'grant_type': 'client_credentials',
-            'scope': 'openid,AdobeID,read_organizations,additional_info.projectedProductContext'
-        }
-        
         try:
-            response = requests.post(auth_url, data=auth_data, timeout=30)
-            response.raise_for_status()
-            return response.json().get('access_token')
+            return await self.client.get_token()
         except Exception as e:
             logger.error(f"Failed to get access token: {e}")
             return None
     
-    def upload_pdf(self, pdf_path, access_token):
+    async def upload_pdf(self, pdf_path):
         """Upload PDF to Adobe"""
         
         print("📤 Uploading PDF to Adobe...")
         
-        # Step 1: Create upload URI
-        upload_url = "https://pdf-services.adobe.io/assets"
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id,
-            'Content-Type': 'application/json'
-        }
-        
-        upload_payload = {"mediaType": "application/pdf"}
-        upload_response = requests.post(upload_url, headers=headers, json=upload_payload)
-        upload_response.raise_for_status()
-        upload_data = upload_response.json()
-        
-        asset_id = upload_data.get('assetID')
-        upload_uri = upload_data.get('uploadUri')
-        
-        # Step 2: Upload PDF
-        with open(pdf_path, 'rb') as pdf_file:
-            put_headers = {'Content-Type': 'application/pdf'}
-            put_response = requests.put(upload_uri, headers=put_headers, data=pdf_file)
-            put_response.raise_for_status()
+        asset_id = await self.client.upload(pdf_path)
         
         print(f"✅ PDF uploaded (Asset ID: {asset_id})")
         return asset_id
     
-    def submit_ocr_job(self, asset_id, access_token):
+    async def submit_ocr_job(self, asset_id):
         """Submit Adobe OCR job with optimal settings for financial documents"""
         
         print("🔄 Submitting Adobe OCR job for complete text extraction...")
         
-        ocr_url = "https://pdf-services.adobe.io/operation/ocr"
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id,
-            'Content-Type': 'application/json'
-        }
-        
         # OCR payload optimized for financial documents
         ocr_payload = {
             "assetID": asset_id,
@@ -139,199 +113,111 @@ class AdobeOCRCompleteExtractor:
         }
         
         try:
-            ocr_response = requests.post(ocr_url, headers=headers, json=ocr_payload)
-            ocr_response.raise_for_status()
-            
-            job_url = ocr_response.headers.get('location')
+            job_url = await self.client.submit("ocr", ocr_payload)
             print(f"✅ OCR job submitted successfully")
             return job_url
             
-        except requests.exceptions.HTTPError as e:
+        except Exception as e:
             print(f"❌ OCR job submission failed: {e}")
-            print(f"Response: {e.response.text}")
             return None
     
-    def get_ocr_results(self, job_url, access_token):
+    async def get_ocr_results(self, job_url):
         """Wait for OCR completion and get results"""
         
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id
-        }
-        
-        max_attempts = 60  # Wait up to 15 minutes for OCR
-        attempt = 0
-        
         print("⏳ Waiting for Adobe OCR to complete...")
         print("💡 OCR processing can take 5-15 minutes for complete text extraction")
         
-        while attempt < max_attempts:
-            try:
-                response = requests.get(job_url, headers=headers)
-                response.raise_for_status()
-                job_status = response.json()
-                
-                status = job_status.get('status')
-                print(f"📊 OCR Status: {status} (attempt {attempt + 1}/60)")
-                
-                if status == 'done':
-                    # Get download URL
-                    download_url = self.get_download_url(job_status)
-                    if download_url:
-                        return self.download_and_process_ocr_results(download_url)
-                    else:
-                        print("❌ No download URL found")
-                        return None
-                        
-                elif status == 'failed':
-                    error_msg = job_status.get('error', 'Unknown error')
-                    print(f"❌ Adobe OCR job failed: {error_msg}")
-                    return None
-                
-                time.sleep(15)  # Wait 15 seconds between checks
-                attempt += 1
-                
-            except Exception as e:
-                print(f"❌ Error polling OCR job: {e}")
-                return None
+        try:
+            job_status = await self.client.poll(job_url)
+        except Exception as e:
+            print(f"❌ Adobe OCR job failed: {e}")
+            return None
         
-        print("❌ OCR job timed out after 15 minutes")
-        return None
+        # Get download URL
+        download_url = self.get_download_url(job_status)
+        if download_url:
+            return await self.download_and_process_ocr_results(download_url)
+        else:
+            print("❌ No download URL found")
+            return None
     
     def get_download_url(self, job_status):
         """Extract download URL from job status"""
-        
-        # Try different response structures
-        if 'resource' in job_status and 'downloadUri' in job_status['resource']:
-            return job_status['resource']['downloadUri']
-        elif 'asset' in job_status and 'downloadUri' in job_status['asset']:
-            return job_status['asset']['downloadUri']
-        elif 'downloadUri' in job_status:
-            return job_status['downloadUri']
-        else:
+        download_url = self.client.get_download_url(job_status)
+        if not download_url:
             print(f"❌ No download URL found in response: {list(job_status.keys())}")
-            return None
+        return download_url
     
-    def download_and_process_ocr_results(self, download_url):
+    async def download_and_process_ocr_results(self, download_url):
         """Download and process OCR results"""
         
         print("📥 Downloading OCR results...")
         
         try:
-            response = requests.get(download_url)
-            response.raise_for_status()
-            
             # Save the OCR'd PDF
             ocr_pdf_path = os.path.join(self.output_dir, "messos_ocr_processed.pdf")
-            with open(ocr_pdf_path, 'wb') as f:
-                f.write(response.content)
+            await self.client.download(download_url, ocr_pdf_path)
             
             print(f"✅ OCR'd PDF saved: {ocr_pdf_path}")
             
             # Now extract text from the OCR'd PDF using PDF Extract API
-            return self.extract_text_from_ocr_pdf(ocr_pdf_path)
+            return await self.extract_text_from_ocr_pdf(ocr_pdf_path)
             
         except Exception as e:
             print(f"❌ Error downloading OCR results: {e}")
             return None
     
-    def extract_text_from_ocr_pdf(self, ocr_pdf_path):
+    async def extract_text_from_ocr_pdf(self, ocr_pdf_path):
         """Extract text from the OCR'd PDF using PDF Extract API"""
         
         print("📝 Extracting text from OCR'd PDF...")
         
-        # Get new access token
-        access_token = self.get_access_token()
-        if not access_token:
-            return None
-        
         try:
             # Upload OCR'd PDF
-            asset_id = self.upload_pdf(ocr_pdf_path, access_token)
+            asset_id = await self.upload_pdf(ocr_pdf_path)
             if not asset_id:
                 return None
             
             # Submit extract job
-            extract_url = "https://pdf-services.adobe.io/operation/extractpdf"
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'X-API-Key': self.client_id,
-                'Content-Type': 'application/json'
-            }
-            
             extract_payload = {
                 "assetID": asset_id
             }
             
-            extract_response = requests.post(extract_url, headers=headers, json=extract_payload)
-            extract_response.raise_for_status()
-            
-            extract_job_url = extract_response.headers.get('location')
+            extract_job_url = await self.client.submit("extractpdf", extract_payload)
             
             # Wait for extract completion
-            return self.get_extract_results(extract_job_url, access_token)
+            return await self.get_extract_results(extract_job_url)
             
         except Exception as e:
             print(f"❌ Error extracting text from OCR'd PDF: {e}")
             return None
     
-    def get_extract_results(self, job_url, access_token):
+    async def get_extract_results(self, job_url):
         """Get text extraction results"""
         
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id
-        }
-        
-        max_attempts = 40
-        attempt = 0
-        
         print("⏳ Extracting text from OCR'd PDF...")
         
-        while attempt < max_attempts:
-            try:
-                response = requests.get(job_url, headers=headers)
-                response.raise_for_status()
-                job_status = response.json()
-                
-                status = job_status.get('status')
-                print(f"📊 Extract Status: {status} (attempt {attempt + 1}/40)")
-                
-                if status == 'done':
-                    download_url = self.get_download_url(job_status)
-                    if download_url:
-                        return self.process_final_extraction_results(download_url)
-                    else:
-                        return None
-                        
-                elif status == 'failed':
-                    error_msg = job_status.get('error', 'Unknown error')
-                    print(f"❌ Text extraction failed: {error_msg}")
-                    return None
-                
-                time.sleep(10)
-                attempt += 1
-                
-            except Exception as e:
-                print(f"❌ Error polling extract job: {e}")
-                return None
+        try:
+            job_status = await self.client.poll(job_url)
+        except Exception as e:
+            print(f"❌ Text extraction failed: {e}")
+            return None
         
-        print("❌ Text extraction timed out")
-        return None
+        download_url = self.get_download_url(job_status)
+        if download_url:
+            return await self.process_final_extraction_results(download_url)
+        else:
+            return None
     
-    def process_final_extraction_results(self, download_url):
+    async def process_final_extraction_results(self, download_url):
         """Process final extraction results with complete text"""
         
         print("📥 Downloading final extraction results...")
         
         try:
-            response = requests.get(download_url)
-            response.raise_for_status()
-            
             # Save and extract ZIP
             zip_path = os.path.join(self.output_dir, "final_extraction.zip")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            await self.client.download(download_url, zip_path)
             
             extract_dir = os.path.join(self.output_dir, "final_extracted")
             os.makedirs(extract_dir, exist_ok=True)
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Async Adobe PDF Services REST Client
+One pooled aiohttp session for token fetch, asset upload, job submit, polling and download
+"""
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+from token_manager import TokenManager
+from job_poller import JobPoller, PollPolicy, parse_retry_after
+from exceptions import (
+    APIError, APIAuthenticationError, APIConnectionError, APITimeoutError,
+    TemporaryAPIError, ExtractionError, CredentialsNotFoundError, InvalidCredentialsFormatError
+)
+
+logger = logging.getLogger(__name__)
+
+IMS_TOKEN_URL = "https://ims-na1.adobelogin.com/ims/token/v1"
+PDF_SERVICES_URL = "https://pdf-services.adobe.io"
+DEFAULT_SCOPE = "openid,AdobeID,read_organizations,additional_info.projectedProductContext"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class AdobeRESTClient:
+    """
+    Async client for the Adobe PDF Services REST API
+
+    All requests go through one ``aiohttp.ClientSession`` whose connector
+    keeps connections alive and caps sockets in total and per host, so any
+    number of concurrent jobs share a small, fixed pool.
+    """
+
+    def __init__(self, client_id: str, client_secret: str,
+                 base_url: str = PDF_SERVICES_URL,
+                 max_connections: int = 20,
+                 max_connections_per_host: int = 10,
+                 keepalive_timeout: float = 60.0,
+                 connect_timeout: float = 10.0,
+                 request_timeout: float = 120.0,
+                 poll_policy: Optional[PollPolicy] = None,
+                 job_timeout: Optional[float] = None,
+                 token_store: Optional[object] = None,
+                 token_refresh_margin: float = 300.0):
+        """
+        Initialize REST client
+
+        Args:
+            client_id: Adobe API client ID
+            client_secret: Adobe API client secret
+            base_url: PDF Services API base URL
+            max_connections: Socket limit across all hosts
+            max_connections_per_host: Socket limit per host
+            keepalive_timeout: Seconds an idle connection stays open for reuse
+            connect_timeout: Seconds allowed to establish a connection
+            request_timeout: Seconds allowed for a whole request
+            poll_policy: Backoff and limits for job status checks
+            job_timeout: Seconds to wait for a job, overriding the poll policy
+            token_store: Optional FileTokenStore or RedisTokenStore to share
+                access tokens between processes
+            token_refresh_margin: Seconds before expiry at which tokens are renewed
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.base_url = base_url.rstrip('/')
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=request_timeout, connect=connect_timeout)
+        # Uploads and downloads of large files are bounded per read, not in total
+        self.transfer_timeout = aiohttp.ClientTimeout(
+            total=None, connect=connect_timeout, sock_read=request_timeout
+        )
+        poll_policy = poll_policy or PollPolicy()
+        if job_timeout is not None:
+            poll_policy = replace(poll_policy, timeout=job_timeout)
+        # One poller multiplexes the status checks of every job on this client
+        self.poller = JobPoller(poll_policy, done_states=('done',), failed_states=('failed',))
+
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.token_manager = TokenManager(
+            client_id, self._fetch_token, store=token_store, refresh_margin=token_refresh_margin
+        )
+
+    @classmethod
+    def from_credentials_file(cls, credentials_path: str, **kwargs) -> 'AdobeRESTClient':
+        """
+        Create a client from a PDF Services credentials JSON file
+
+        Args:
+            credentials_path: Path to the credentials file used by PDFExtractor
+            **kwargs: Additional client settings
+
+        Returns:
+            Configured client
+        """
+        if not os.path.exists(credentials_path):
+            raise CredentialsNotFoundError(credentials_path)
+
+        with open(credentials_path, 'r') as f:
+            creds_data = json.load(f)
+
+        client_credentials = creds_data.get("client_credentials", {})
+        missing_fields = [name for name in ("client_id", "client_secret") if not client_credentials.get(name)]
+        if missing_fields:
+            raise InvalidCredentialsFormatError(credentials_path, missing_fields)
+
+        return cls(client_credentials["client_id"], client_credentials["client_secret"], **kwargs)
+
+    async def start(self):
+        """Open the pooled session if it is not open"""
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=300
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self):
+        """Close the session and its pooled connections"""
+        await self.token_manager.close()
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(self, method: str, url: str, operation: str, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Send a request through the pooled session and map failures to API errors
+
+        The caller must release the returned response.
+        """
+        await self.start()
+        try:
+            response = await self.session.request(method, url, **kwargs)
+        except asyncio.TimeoutError:
+            raise APITimeoutError(self.timeout.total, operation)
+        except aiohttp.ClientConnectionError as e:
+            raise APIConnectionError(url, e)
+
+        if response.status < 400:
+            return response
+
+        body = await response.text()
+        response.release()
+
+        if response.status in (401, 403):
+            self.token_manager.invalidate()
+            raise APIAuthenticationError(self.client_id[:8])
+        if response.status == 429 or response.status >= 500:
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            raise TemporaryAPIError(
+                f"{operation} failed with HTTP {response.status}: {body[:200]}",
+                retry_after=retry_after if retry_after is not None else 30
+            )
+        raise APIError(
+            f"{operation} failed with HTTP {response.status}: {body[:200]}",
+            error_code=f"HTTP_{response.status}",
+            context={"url": url, "status": response.status}
+        )
+
+    async def get_token(self) -> str:
+        """
+        Get an IMS access token for the API
+
+        Tokens are cached until shortly before they expire and shared through
+        the token store when one is configured.
+
+        Returns:
+            Bearer access token
+        """
+        return await self.token_manager.get_token()
+
+    async def _fetch_token(self) -> Dict[str, Any]:
+        """Request a new token from IMS"""
+        response = await self._request('POST', IMS_TOKEN_URL, "token request", data={
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'grant_type': 'client_credentials',
+            'scope': DEFAULT_SCOPE
+        })
+        async with response:
+            token_data = await response.json()
+
+        if not token_data.get('access_token'):
+            raise APIAuthenticationError(self.client_id[:8])
+        return token_data
+
+    async def _api_headers(self) -> Dict[str, str]:
+        """Authorization headers for PDF Services endpoints"""
+        return {
+            'Authorization': f'Bearer {await self.get_token()}',
+            'X-API-Key': self.client_id
+        }
+
+    async def upload(self, pdf_path: str, media_type: str = "application/pdf") -> str:
+        """
+        Upload a file as a PDF Services asset
+
+        Args:
+            pdf_path: Path to the file
+            media_type: MIME type of the file
+
+        Returns:
+            Asset ID
+        """
+        response = await self._request(
+            'POST', f"{self.base_url}/assets", "asset upload",
+            headers=await self._api_headers(), json={"mediaType": media_type}
+        )
+        async with response:
+            upload_data = await response.json()
+
+        # The file handle is streamed to the socket rather than read into memory
+        with open(pdf_path, 'rb') as pdf_file:
+            response = await self._request(
+                'PUT', upload_data['uploadUri'], "asset upload",
+                headers={'Content-Type': media_type}, data=pdf_file,
+                timeout=self.transfer_timeout
+            )
+            response.release()
+
+        return upload_data['assetID']
+
+    async def submit(self, operation: str, payload: Dict[str, Any]) -> str:
+        """
+        Submit a PDF Services job
+
+        Args:
+            operation: Operation endpoint name, e.g. "extractpdf" or "ocr"
+            payload: Job parameters including assetID
+
+        Returns:
+            Job status URL
+        """
+        response = await self._request(
+            'POST', f"{self.base_url}/operation/{operation}", f"{operation} submit",
+            headers=await self._api_headers(), json=payload
+        )
+        async with response:
+            job_url = response.headers.get('location')
+
+        if not job_url:
+            raise APIError(f"{operation} submit returned no job location", error_code="NO_JOB_LOCATION")
+        return job_url
+
+    async def poll(self, job_url: str) -> Dict[str, Any]:
+        """
+        Wait for a job to finish
+
+        Status checks back off exponentially, or follow the API's Retry-After
+        header, and are shared with every other job waiting on this client.
+
+        Args:
+            job_url: Job status URL returned by submit
+
+        Returns:
+            Final job status with the result download URI
+        """
+        job_status = await self.poller.wait(job_url, self._fetch_job_status)
+        if job_status.get('status') == 'failed':
+            error = job_status.get('error', 'Unknown error')
+            raise ExtractionError(f"Adobe job failed: {error}", error_code="JOB_FAILED",
+                                  context={"job_url": job_url})
+        return job_status
+
+    async def _fetch_job_status(self, job_url: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Fetch a job status and its Retry-After hint"""
+        response = await self._request('GET', job_url, "job poll", headers=await self._api_headers())
+        async with response:
+            return await response.json(), parse_retry_after(response.headers.get('Retry-After'))
+
+    @staticmethod
+    def get_download_url(job_status: Dict[str, Any]) -> Optional[str]:
+        """Find the result download URI in a job status response"""
+        for key in ('content', 'resource', 'asset'):
+            if isinstance(job_status.get(key), dict) and 'downloadUri' in job_status[key]:
+                return job_status[key]['downloadUri']
+        return job_status.get('downloadUri')
+
+    async def download(self, download_url: str, output_path: str,
+                       chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> str:
+        """
+        Stream a result to disk
+
+        Args:
+            download_url: Result download URI
+            output_path: Destination file
+            chunk_size: Bytes written per chunk
+
+        Returns:
+            Path of the written file
+        """
+        temp_path = output_path + ".part"
+        response = await self._request('GET', download_url, "result download",
+                                       timeout=self.transfer_timeout)
+        try:
+            async with response:
+                with open(temp_path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return output_path
+
+    async def run_job(self, pdf_path: str, operation: str, output_path: str,
+                      options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Upload a PDF, run one operation on it and download the result
+
+        Args:
+            pdf_path: Input PDF
+            operation: Operation endpoint name
+            output_path: Destination for the result
+            options: Job parameters besides assetID
+
+        Returns:
+            Path of the downloaded result
+        """
+        asset_id = await self.upload(pdf_path)
+        job_url = await self.submit(operation, {"assetID": asset_id, **(options or {})})
+        job_status = await self.poll(job_url)
+
+        download_url = self.get_download_url(job_status)
+        if not download_url:
+            raise APIError(f"No download URL in {operation} job status: {list(job_status.keys())}",
+                           error_code="NO_DOWNLOAD_URL")
+        return await self.download(download_url, output_path)
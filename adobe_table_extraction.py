@@ -6,11 +6,15 @@ Use Adobe's Document Intelligence to extract structured table data
 
 import os
 import json
-import requests
-import time
+import asyncio
+import zipfile
 import pandas as pd
 import logging
 
+from adobe_rest_client import AdobeRESTClient
+from token_manager import FileTokenStore
+from exceptions import APIError
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -24,8 +28,16 @@ class AdobeTableExtractor:
         self.output_dir = "adobe_table_extraction"
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Tokens are valid for hours; reuse them across runs instead of logging in every time
+        self.client = AdobeRESTClient(self.client_id, self.client_secret, job_timeout=600,
+                                      token_store=FileTokenStore())
+        
     def extract_tables_from_pdf(self):
         """Extract all tables from PDF using Adobe's table recognition"""
+        return asyncio.run(self.extract_tables_from_pdf_async())
+    
+    async def extract_tables_from_pdf_async(self):
+        """Extract all tables from PDF over the shared async REST client"""
         
         print("📊 **ADOBE ADVANCED TABLE EXTRACTION**")
         print("=" * 60)
@@ -38,94 +50,58 @@ class AdobeTableExtractor:
             print(f"❌ PDF not found: {pdf_path}")
             return None
         
-        # Get access token
-        access_token = self.get_access_token()
-        if not access_token:
-            print("❌ Failed to get Adobe access token")
-            return None
-        
-        print("✅ Adobe authentication successful")
-        
-        try:
-            # Upload PDF
-            asset_id = self.upload_pdf(pdf_path, access_token)
-            if not asset_id:
-                return None
-            
-            # Submit table extraction job
-            job_url = self.submit_table_extraction_job(asset_id, access_token)
-            if not job_url:
+        async with self.client:
+            # Get access token
+            access_token = await self.get_access_token()
+            if not access_token:
+                print("❌ Failed to get Adobe access token")
                 return None
             
-            # Wait for completion and get results
-            results = self.get_extraction_results(job_url, access_token)
+            print("✅ Adobe authentication successful")
             
-            return results
-            
-        except Exception as e:
-            print(f"❌ Adobe table extraction failed: {e}")
-            return None
+            try:
+                # Upload PDF
+                asset_id = await self.upload_pdf(pdf_path)
+                if not asset_id:
+                    return None
+                
+                # Submit table extraction job
+                job_url = await self.submit_table_extraction_job(asset_id)
+                if not job_url:
+                    return None
+                
+                # Wait for completion and get results
+                results = await self.get_extraction_results(job_url)
+                
+                return results
+                
+            except Exception as e:
+                print(f"❌ Adobe table extraction failed: {e}")
+                return None
     
-    def get_access_token(self):
+    async def get_access_token(self):
         """Get Adobe access token"""
-        auth_url = "https://ims-na1.adobelogin.com/ims/token/v1"
-        auth_data = {
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'grant_type': 'client_credentials',
-            'scope': 'openid,AdobeID,read_organizations,additional_info.projectedProductContext'
-        }
-        
         try:
-            response = requests.post(auth_url, data=auth_data, timeout=30)
-            response.raise_for_status()
-            return response.json().get('access_token')
+            return await self.client.get_token()
         except Exception as e:
             logger.error(f"Failed to get access token: {e}")
             return None
     
-    def upload_pdf(self, pdf_path, access_token):
+    async def upload_pdf(self, pdf_path):
         """Upload PDF to Adobe"""
         
         print("📤 Uploading PDF to Adobe...")
         
-        # Step 1: Create upload URI
-        upload_url = "https://pdf-services.adobe.io/assets"
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id,
-            'Content-Type': 'application/json'
-        }
-        
-        upload_payload = {"mediaType": "application/pdf"}
-        upload_response = requests.post(upload_url, headers=headers, json=upload_payload)
-        upload_response.raise_for_status()
-        upload_data = upload_response.json()
-        
-        asset_id = upload_data.get('assetID')
-        upload_uri = upload_data.get('uploadUri')
-        
-        # Step 2: Upload PDF
-        with open(pdf_path, 'rb') as pdf_file:
-            put_headers = {'Content-Type': 'application/pdf'}
-            put_response = requests.put(upload_uri, headers=put_headers, data=pdf_file)
-            put_response.raise_for_status()
+        asset_id = await self.client.upload(pdf_path)
         
         print(f"✅ PDF uploaded (Asset ID: {asset_id})")
         return asset_id
     
-    def submit_table_extraction_job(self, asset_id, access_token):
+    async def submit_table_extraction_job(self, asset_id):
         """Submit advanced table extraction job"""
         
         print("🔄 Submitting advanced table extraction job...")
         
-        extract_url = "https://pdf-services.adobe.io/operation/extractpdf"
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id,
-            'Content-Type': 'application/json'
-        }
-        
         # Advanced extraction payload focused on tables
         extract_payload = {
             "assetID": asset_id,
@@ -138,16 +114,12 @@ class AdobeTableExtractor:
         }
         
         try:
-            extract_response = requests.post(extract_url, headers=headers, json=extract_payload)
-            extract_response.raise_for_status()
-            
-            job_url = extract_response.headers.get('location')
+            job_url = await self.client.submit("extractpdf", extract_payload)
             print(f"✅ Table extraction job submitted")
             return job_url
             
-        except requests.exceptions.HTTPError as e:
+        except APIError as e:
             print(f"❌ HTTP Error: {e}")
-            print(f"Response: {e.response.text}")
             
             # Try with simpler payload
             print("🔄 Trying with simplified extraction options...")
@@ -160,89 +132,41 @@ class AdobeTableExtractor:
             }
             
             try:
-                extract_response = requests.post(extract_url, headers=headers, json=simple_payload)
-                extract_response.raise_for_status()
-                job_url = extract_response.headers.get('location')
+                job_url = await self.client.submit("extractpdf", simple_payload)
                 print(f"✅ Simplified extraction job submitted")
                 return job_url
             except Exception as e2:
                 print(f"❌ Simplified extraction also failed: {e2}")
                 return None
     
-    def get_extraction_results(self, job_url, access_token):
+    async def get_extraction_results(self, job_url):
         """Wait for job completion and get results"""
         
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': self.client_id
-        }
-        
-        max_attempts = 40
-        attempt = 0
-        
         print("⏳ Waiting for table extraction to complete...")
         
-        while attempt < max_attempts:
-            try:
-                response = requests.get(job_url, headers=headers)
-                response.raise_for_status()
-                job_status = response.json()
-                
-                status = job_status.get('status')
-                print(f"📊 Status: {status} (attempt {attempt + 1}/40)")
-                
-                if status == 'done':
-                    # Get download URL
-                    download_url = self.get_download_url(job_status)
-                    if download_url:
-                        return self.download_and_process_tables(download_url)
-                    else:
-                        print("❌ No download URL found")
-                        return None
-                        
-                elif status == 'failed':
-                    error_msg = job_status.get('error', 'Unknown error')
-                    print(f"❌ Adobe job failed: {error_msg}")
-                    return None
-                
-                time.sleep(15)
-                attempt += 1
-                
-            except Exception as e:
-                print(f"❌ Error polling job: {e}")
-                return None
+        try:
+            job_status = await self.client.poll(job_url)
+        except Exception as e:
+            print(f"❌ Adobe job failed: {e}")
+            return None
         
-        print("❌ Job timed out")
-        return None
-    
-    def get_download_url(self, job_status):
-        """Extract download URL from job status"""
-        
-        # Try different response structures
-        if 'resource' in job_status and 'downloadUri' in job_status['resource']:
-            return job_status['resource']['downloadUri']
-        elif 'asset' in job_status and 'downloadUri' in job_status['asset']:
-            return job_status['asset']['downloadUri']
-        elif 'downloadUri' in job_status:
-            return job_status['downloadUri']
-        else:
+        # Get download URL
+        download_url = self.client.get_download_url(job_status)
+        if not download_url:
             print(f"❌ No download URL found in response: {list(job_status.keys())}")
             return None
+        
+        return await self.download_and_process_tables(download_url)
     
-    def download_and_process_tables(self, download_url):
+    async def download_and_process_tables(self, download_url):
         """Download and process table extraction results"""
         
         print("📥 Downloading table extraction results...")
         
         try:
-            response = requests.get(download_url)
-            response.raise_for_status()
-            
             # Save ZIP file
-            import zipfile
             zip_path = os.path.join(self.output_dir, "adobe_tables.zip")
-            with open(zip_path, 'wb') as f:
-                f.write(response.content)
+            await self.client.download(download_url, zip_path)
             
             # Extract ZIP
             extract_dir = os.path.join(self.output_dir, "extracted")
@@ -8,7 +8,6 @@ import os
 import sys
 import json
 import argparse
-import zipfile
 import logging
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -28,6 +27,10 @@ except ImportError:
     print("Run: pip install pdfservices-sdk")
     sys.exit(1)
 
+from extraction_cache import ExtractionCache
+from result_archive import ExtractionArchive
+from pdf_extractor import SharedUpload
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -38,14 +41,21 @@ logger = logging.getLogger(__name__)
 class AdvancedPDFExtractor:
     """Advanced Adobe PDF Extract API wrapper with renditions support"""
     
-    def __init__(self, credentials_path: str = "credentials/pdfservices-api-credentials.json"):
+    def __init__(self, credentials_path: str = "credentials/pdfservices-api-credentials.json",
+                 cache: Optional[ExtractionCache] = None, extract_results: bool = False):
         """
         Initialize the advanced PDF extractor
         
         Args:
             credentials_path: Path to Adobe PDF Services API credentials JSON file
+            cache: Optional content-addressed result cache; repeat extractions
+                of the same PDF bytes and parameters skip the Adobe API
+            extract_results: Unpack the result ZIP to disk; by default results
+                are read straight from the ZIP
         """
         self.credentials_path = credentials_path
+        self.cache = cache
+        self.extract_results = extract_results
         self.pdf_services = None
         self._setup_credentials()
     
@@ -85,7 +95,8 @@ class AdvancedPDFExtractor:
         table_format: str = "csv",
         extract_text: bool = True,
         extract_figures: bool = True,
-        extract_tables: bool = True
+        extract_tables: bool = True,
+        input_asset=None
     ) -> Dict[str, Any]:
         """
         Advanced extraction with table and figure renditions
@@ -97,6 +108,8 @@ class AdvancedPDFExtractor:
             extract_text: Whether to extract text elements
             extract_figures: Whether to extract figure renditions
             extract_tables: Whether to extract table renditions
+            input_asset: Already uploaded asset for this PDF, or a SharedUpload
+                resolved only on a cache miss; skips the upload
             
         Returns:
             Dictionary with extraction results and file paths
@@ -107,11 +120,40 @@ class AdvancedPDFExtractor:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Create stream asset from file
-        with open(input_pdf_path, 'rb') as file:
-            input_stream = file.read()
+        # Generate output filename
+        pdf_name = Path(input_pdf_path).stem
+        output_zip_path = os.path.join(output_dir, f"{pdf_name}_advanced_extracted.zip")
         
-        input_asset = self.pdf_services.upload(input_stream, PDFServicesMediaType.PDF)
+        # Serve repeat extractions of the same bytes and parameters from the cache
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                input_pdf_path, "extract_with_renditions",
+                table_format=table_format,
+                extract_text=extract_text,
+                extract_figures=extract_figures,
+                extract_tables=extract_tables
+            )
+            if self.cache.fetch(cache_key, output_zip_path):
+                extracted_files = self._process_advanced_extraction_results(output_zip_path, output_dir, pdf_name)
+                return {
+                    "success": True,
+                    "input_file": input_pdf_path,
+                    "output_zip": output_zip_path,
+                    "extracted_files": extracted_files,
+                    "table_format": table_format,
+                    "renditions_extracted": extract_tables or extract_figures,
+                    "cache_hit": True
+                }
+        
+        # Create stream asset from file
+        if input_asset is None:
+            with open(input_pdf_path, 'rb') as file:
+                input_stream = file.read()
+            
+            input_asset = self.pdf_services.upload(input_stream, PDFServicesMediaType.PDF)
+        elif isinstance(input_asset, SharedUpload):
+            input_asset = input_asset()
         
         # Configure extraction elements
         elements_to_extract = []
@@ -154,16 +196,15 @@ class AdvancedPDFExtractor:
             result_asset = pdf_services_response.get_result().get_resource()
             stream_asset = self.pdf_services.get_content(result_asset)
             
-            # Generate output filename
-            pdf_name = Path(input_pdf_path).stem
-            output_zip_path = os.path.join(output_dir, f"{pdf_name}_advanced_extracted.zip")
-            
             # Save result
             with open(output_zip_path, "wb") as file:
                 file.write(stream_asset.get_input_stream())
             
             logger.info(f"✅ Advanced extraction completed: {output_zip_path}")
             
+            if cache_key:
+                self.cache.store(cache_key, output_zip_path)
+            
             # Extract and organize the ZIP contents
             extracted_files = self._process_advanced_extraction_results(output_zip_path, output_dir, pdf_name)
             
@@ -173,7 +214,8 @@ class AdvancedPDFExtractor:
                 "output_zip": output_zip_path,
                 "extracted_files": extracted_files,
                 "table_format": table_format,
-                "renditions_extracted": len(elements_to_extract_renditions) > 0
+                "renditions_extracted": len(elements_to_extract_renditions) > 0,
+                "cache_hit": False
             }
             
         except Exception as e:
@@ -187,6 +229,9 @@ class AdvancedPDFExtractor:
     def _process_advanced_extraction_results(self, zip_path: str, output_dir: str, pdf_name: str) -> Dict[str, Any]:
         """
         Process and organize advanced extraction results from ZIP file
+
+        Unless extract_results is set, nothing is unpacked and the returned
+        locations are archive references readable through result_archive.
         
         Args:
             zip_path: Path to the extraction results ZIP file
@@ -194,7 +239,7 @@ class AdvancedPDFExtractor:
             pdf_name: Name of the original PDF (without extension)
             
         Returns:
-            Dictionary mapping file types to their paths and counts
+            Dictionary mapping file types to their paths or archive references
         """
         extracted_files = {
             "json": None,
@@ -205,18 +250,12 @@ class AdvancedPDFExtractor:
         }
         
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Create subdirectory for this PDF's results
-                pdf_output_dir = os.path.join(output_dir, pdf_name)
-                os.makedirs(pdf_output_dir, exist_ok=True)
+            with ExtractionArchive(zip_path) as archive:
+                # Extract into a subdirectory for this PDF's results only when asked to
+                pdf_output_dir = os.path.join(output_dir, pdf_name) if self.extract_results else None
                 
-                # Extract all files
-                zip_ref.extractall(pdf_output_dir)
-                
-                # Organize extracted files
-                for file_name in zip_ref.namelist():
-                    file_path = os.path.join(pdf_output_dir, file_name)
-                    
+                # Organize result files
+                for file_name, file_path in archive.file_refs(pdf_output_dir):
                     if file_name.endswith('.json'):
                         extracted_files['json'] = file_path
                         logger.info(f"📄 JSON data: {file_path}")
@@ -289,12 +328,25 @@ def main():
         default="credentials/pdfservices-api-credentials.json",
         help="Path to Adobe PDF Services API credentials"
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse cached results for previously extracted PDFs from this directory"
+    )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Unpack the result ZIP to disk instead of reading results from it"
+    )
     
     args = parser.parse_args()
     
     try:
         # Initialize advanced extractor
-        extractor = AdvancedPDFExtractor(credentials_path=args.credentials)
+        extractor = AdvancedPDFExtractor(
+            credentials_path=args.credentials,
+            cache=ExtractionCache(args.cache_dir) if args.cache_dir else None,
+            extract_results=args.extract
+        )
         
         # Extract data with renditions
         result = extractor.extract_with_renditions(
@@ -6,22 +6,29 @@ Provides high-performance async processing for multiple PDF files with rate limi
 
 import asyncio
 import logging
+import threading
 import time
 from typing import List, Dict, Any, Optional, Callable, Union, AsyncGenerator
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from functools import partial
 from datetime import datetime
 import json
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import aiohttp
-from asyncio_throttle import Throttler
 from contextlib import asynccontextmanager
 
 # Import our custom modules
 try:
     from pdf_extractor import PDFExtractor
     from advanced_pdf_extractor import AdvancedPDFExtractor
+    from extraction_cache import ExtractionCache
+    from job_ledger import JobLedger
+    from adaptive_rate_limiter import AdaptiveRateController, AdaptiveRateConfig
+    from adobe_rest_client import AdobeRESTClient
+    from token_manager import FileTokenStore, RedisTokenStore
+    from batch_scheduler import SchedulingPolicy, CostMetric, plan_jobs, compare_to_fifo
     from exceptions import PDFNotFoundError, APIQuotaExceededError, TemporaryAPIError
     from performance_monitor import PerformanceMonitor, monitor_performance
     from retry_handler import with_retry, RetryConfig, RetryStrategy
@@ -37,14 +44,31 @@ perf_logger = get_performance_logger()
 class BatchJobConfig:
     """Configuration for batch processing jobs"""
     max_concurrent_jobs: int = 5
+    max_concurrent_jobs_ceiling: Optional[int] = None  # Adaptive concurrency upper bound; defaults to max_concurrent_jobs
     rate_limit_per_minute: int = 30
-    chunk_size: int = 10
+    chunk_size: int = 10  # Unused by the sliding-window scheduler, kept for config compatibility
     enable_caching: bool = True
+    cache_dir: str = "cache/extractions"
+    cache_max_size_gb: float = 2.0
     output_base_dir: str = "batch_output"
     table_format: str = "csv"
     extract_text: bool = True
     enable_ocr: bool = True
     advanced_extraction: bool = False
+    extract_results: bool = False  # Unpack result ZIPs to disk instead of reading results from them
+    retain_results: bool = False  # Keep every BatchJobResult in memory as well as in the JSONL stream
+    ledger_file: str = "batch_ledger.sqlite"  # Job ledger inside output_base_dir
+    max_attempts: int = 3  # Attempts per file across resumed runs
+    adaptive_rate_limit: bool = False  # Adjust rate and concurrency from observed latency and throttling
+    min_rate_per_minute: int = 5
+    max_rate_per_minute: int = 120
+    scheduling_policy: str = "fifo"  # fifo, largest_first, shortest_first or fair_share
+    scheduling_cost: str = "size"  # Job cost estimate: size or pages
+    use_rest_client: bool = False  # Run basic extractions over the shared async REST session
+    http_max_connections: int = 10  # Socket pool shared by all REST jobs
+    http_connections_per_host: int = 5
+    token_cache_file: Optional[str] = "~/.cache/adobe_pdf_services/ims_tokens.json"  # Share IMS tokens between this user's processes
+    token_redis_url: Optional[str] = None  # Share IMS tokens across hosts instead
     progress_callback: Optional[Callable] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -82,6 +106,68 @@ class BatchJobResult:
         return result
 
 
+class BatchStatistics:
+    """Incrementally updated aggregate statistics for a batch run"""
+    
+    def __init__(self):
+        self.total_results = 0
+        self.successful = 0
+        self.failed = 0
+        self.total_processing_time = 0.0
+        self.total_file_size_mb = 0.0
+        self.total_tables_found = 0
+        self.cache_hits = 0
+        self.errors_by_type: Dict[str, int] = {}
+    
+    def add(self, result: BatchJobResult, error_type: Optional[str] = None):
+        """
+        Fold a single job result into the aggregates
+        
+        Args:
+            result: Completed job result
+            error_type: Exception type name if the job raised instead of returning
+        """
+        self.total_results += 1
+        self.total_processing_time += result.processing_time
+        self.total_file_size_mb += result.file_size_mb
+        
+        if result.success:
+            self.successful += 1
+            self.total_tables_found += result.tables_found
+        else:
+            self.failed += 1
+        
+        if result.cache_hit:
+            self.cache_hits += 1
+        
+        if error_type is None and not result.success and result.error_message:
+            error_type = self._classify_error(result.error_message)
+        if error_type:
+            self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + 1
+    
+    @staticmethod
+    def _classify_error(error_message: str) -> str:
+        """Map an extraction error message to an error category"""
+        message = error_message.lower()
+        if "not found" in message:
+            return "FileNotFound"
+        elif "credentials" in message:
+            return "CredentialsError"
+        elif "api" in message:
+            return "APIError"
+        return "ExtractionError"
+    
+    @property
+    def avg_processing_time(self) -> float:
+        """Average processing time per completed job"""
+        return self.total_processing_time / self.total_results if self.total_results else 0.0
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        """Cache hit rate as percentage"""
+        return (self.cache_hits / self.total_results) * 100 if self.total_results else 0.0
+
+
 @dataclass
 class BatchProcessingReport:
     """Comprehensive report for batch processing session"""
@@ -98,6 +184,11 @@ class BatchProcessingReport:
     config: BatchJobConfig
     results: List[BatchJobResult]
     errors_by_type: Dict[str, int]
+    executor_stats: Dict[str, Any] = field(default_factory=dict)
+    results_file: Optional[str] = None
+    skipped_files: int = 0
+    rate_limit_stats: Dict[str, Any] = field(default_factory=dict)
+    scheduling_stats: Dict[str, Any] = field(default_factory=dict)
     
     def get_success_rate(self) -> float:
         """Get success rate as percentage"""
@@ -119,12 +210,13 @@ class BatchProcessingReport:
 class ProgressTracker:
     """Thread-safe progress tracker for batch operations"""
     
-    def __init__(self, total_items: int):
+    def __init__(self, total_items: int, status_provider: Optional[Callable[[], Dict[str, Any]]] = None):
         self.total_items = total_items
         self.completed_items = 0
         self.failed_items = 0
         self.lock = asyncio.Lock()
         self.callbacks: List[Callable] = []
+        self.status_provider = status_provider
     
     async def update(self, success: bool = True):
         """Update progress counters"""
@@ -145,7 +237,7 @@ class ProgressTracker:
     
     def get_progress_info(self) -> Dict[str, Any]:
         """Get current progress information"""
-        return {
+        progress_info = {
             'total': self.total_items,
             'completed': self.completed_items,
             'failed': self.failed_items,
@@ -153,21 +245,124 @@ class ProgressTracker:
             'percentage': (self.completed_items / self.total_items * 100) if self.total_items > 0 else 0,
             'remaining': self.total_items - self.completed_items
         }
+        if self.status_provider:
+            progress_info.update(self.status_provider())
+        return progress_info
     
     def add_callback(self, callback: Callable):
         """Add progress callback"""
         self.callbacks.append(callback)
 
 
+class ExecutorStats:
+    """Thread-safe queue-depth and utilization metrics for the extraction executor"""
+    
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Reset all counters"""
+        with self.lock:
+            self.submitted = 0
+            self.started = 0
+            self.completed = 0
+            self.peak_active = 0
+            self.peak_queue_depth = 0
+            self.total_queue_wait = 0.0
+            self.busy_time = 0.0
+            self.first_submit_time: Optional[float] = None
+            self.last_finish_time: Optional[float] = None
+    
+    def track(self, func: Callable) -> Callable:
+        """Wrap a callable so its queue wait and run time are recorded"""
+        submit_time = time.time()
+        with self.lock:
+            self.submitted += 1
+            if self.first_submit_time is None:
+                self.first_submit_time = submit_time
+            self.peak_queue_depth = max(self.peak_queue_depth, self.submitted - self.started)
+        
+        def tracked():
+            start_time = time.time()
+            with self.lock:
+                self.started += 1
+                self.total_queue_wait += start_time - submit_time
+                self.peak_active = max(self.peak_active, self.started - self.completed)
+            try:
+                return func()
+            finally:
+                finish_time = time.time()
+                with self.lock:
+                    self.completed += 1
+                    self.busy_time += finish_time - start_time
+                    self.last_finish_time = finish_time
+        
+        return tracked
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current executor metrics"""
+        with self.lock:
+            now = time.time()
+            elapsed = 0.0
+            if self.first_submit_time is not None:
+                end_time = self.last_finish_time if self.completed == self.submitted and self.last_finish_time else now
+                elapsed = max(0.0, end_time - self.first_submit_time)
+            capacity = elapsed * self.max_workers
+            
+            return {
+                'max_workers': self.max_workers,
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'active': self.started - self.completed,
+                'queue_depth': self.submitted - self.started,
+                'peak_active': self.peak_active,
+                'peak_queue_depth': self.peak_queue_depth,
+                'avg_queue_wait': self.total_queue_wait / self.started if self.started else 0.0,
+                'busy_time': self.busy_time,
+                'utilization': min(1.0, self.busy_time / capacity) if capacity > 0 else 0.0
+            }
+
+
 class AsyncPDFProcessor:
     """Async wrapper for PDF processing with rate limiting"""
     
     def __init__(self, extractor: Union[PDFExtractor, AdvancedPDFExtractor], 
-                 throttler: Throttler):
+                 throttler: AdaptiveRateController, max_workers: int = 5,
+                 rest_client: Optional[AdobeRESTClient] = None):
+        """
+        Initialize async PDF processor
+        
+        Args:
+            extractor: Extractor holding the authenticated PDF Services client shared by all jobs
+            throttler: Rate and concurrency limiter applied to every extraction
+            max_workers: Size of the shared extraction thread pool
+            rest_client: Optional async REST client; basic extractions then run
+                on the event loop instead of occupying a worker thread
+        """
         self.extractor = extractor
         self.throttler = throttler
+        self.rest_client = rest_client
+        self.max_workers = max_workers
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.executor_stats = ExecutorStats(max_workers)
         self.performance_monitor = PerformanceMonitor()
     
+    def start(self):
+        """Create the shared extraction thread pool if it is not running"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="pdf_extraction"
+            )
+    
+    def shutdown(self, wait: bool = True):
+        """Shut down the shared extraction thread pool"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait)
+            self.executor = None
+    
     @with_retry('api_calls')
     async def process_pdf_async(self, pdf_path: str, config: BatchJobConfig) -> BatchJobResult:
         """Process single PDF asynchronously with throttling"""
@@ -184,38 +379,47 @@ class AsyncPDFProcessor:
         
         # Get file size
         file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+        job_start = None
         
         try:
             # Apply rate limiting
             async with self.throttler:
-                # Run extraction in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    if config.advanced_extraction and isinstance(self.extractor, AdvancedPDFExtractor):
-                        extraction_func = self.extractor.extract_with_renditions
-                        extraction_args = {
-                            'input_pdf_path': pdf_path,
-                            'output_dir': os.path.join(config.output_base_dir, Path(pdf_path).stem),
-                            'table_format': config.table_format,
-                            'extract_text': config.extract_text,
-                            'extract_figures': True,
-                            'extract_tables': True
-                        }
-                    else:
-                        extraction_func = self.extractor.extract_tables
-                        extraction_args = {
-                            'input_pdf_path': pdf_path,
-                            'output_dir': os.path.join(config.output_base_dir, Path(pdf_path).stem),
-                            'table_format': config.table_format,
-                            'extract_text': config.extract_text,
-                            'enable_ocr': config.enable_ocr
-                        }
-                    
-                    # Execute extraction
+                # Run extraction in the shared thread pool to avoid blocking
+                loop = asyncio.get_running_loop()
+                self.start()
+                
+                use_rest_client = False
+                if config.advanced_extraction and isinstance(self.extractor, AdvancedPDFExtractor):
+                    extraction_func = self.extractor.extract_with_renditions
+                    extraction_args = {
+                        'input_pdf_path': pdf_path,
+                        'output_dir': os.path.join(config.output_base_dir, Path(pdf_path).stem),
+                        'table_format': config.table_format,
+                        'extract_text': config.extract_text,
+                        'extract_figures': True,
+                        'extract_tables': True
+                    }
+                else:
+                    extraction_func = self.extractor.extract_tables
+                    use_rest_client = self.rest_client is not None
+                    extraction_args = {
+                        'input_pdf_path': pdf_path,
+                        'output_dir': os.path.join(config.output_base_dir, Path(pdf_path).stem),
+                        'table_format': config.table_format,
+                        'extract_text': config.extract_text,
+                        'enable_ocr': config.enable_ocr
+                    }
+                
+                # Execute extraction
+                job_start = time.time()
+                if use_rest_client:
+                    result = await self._extract_tables_rest(**extraction_args)
+                else:
                     result = await loop.run_in_executor(
-                        executor, 
-                        lambda: extraction_func(**extraction_args)
+                        self.executor,
+                        self.executor_stats.track(partial(extraction_func, **extraction_args))
                     )
+                self._observe_job(time.time() - job_start, result=result)
             
             processing_time = time.time() - start_time
             
@@ -232,7 +436,8 @@ class AsyncPDFProcessor:
                     processing_time=processing_time,
                     file_size_mb=file_size_mb,
                     tables_found=tables_found,
-                    extraction_confidence=0.85  # Default confidence
+                    extraction_confidence=0.85,  # Default confidence
+                    cache_hit=result.get('cache_hit', False)
                 )
             else:
                 return BatchJobResult(
@@ -246,6 +451,8 @@ class AsyncPDFProcessor:
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = str(e)
+            if job_start is not None:
+                self._observe_job(time.time() - job_start, error=e)
             
             # Check if it's a retryable error
             if any(keyword in error_msg.lower() for keyword in ['timeout', 'connection', 'temporary']):
@@ -260,6 +467,66 @@ class AsyncPDFProcessor:
             )
 
 
+    async def _extract_tables_rest(self, input_pdf_path: str, output_dir: str, table_format: str,
+                                   extract_text: bool, enable_ocr: bool) -> Dict[str, Any]:
+        """
+        Extract tables through the async REST client
+        
+        Mirrors PDFExtractor.extract_tables, including its cache keys and
+        result layout, but holds no worker thread while the job runs remotely.
+        """
+        loop = asyncio.get_running_loop()
+        os.makedirs(output_dir, exist_ok=True)
+        pdf_name = Path(input_pdf_path).stem
+        output_zip_path = os.path.join(output_dir, f"{pdf_name}_extracted.zip")
+        
+        cache = getattr(self.extractor, 'cache', None)
+        cache_key = None
+        cache_hit = False
+        if cache:
+            cache_key = await loop.run_in_executor(self.executor, partial(
+                cache.make_key, input_pdf_path, "extract_tables",
+                table_format=table_format, extract_text=extract_text, enable_ocr=enable_ocr
+            ))
+            cache_hit = await loop.run_in_executor(self.executor, cache.fetch, cache_key, output_zip_path)
+        
+        if not cache_hit:
+            elements_to_extract = ["tables"] + (["text"] if extract_text else [])
+            await self.rest_client.run_job(input_pdf_path, "extractpdf", output_zip_path, {
+                "elementsToExtract": elements_to_extract,
+                "tableOutputFormat": "xlsx" if table_format.lower() == "xlsx" else "csv",
+                "getCharBounds": enable_ocr
+            })
+            if cache_key:
+                await loop.run_in_executor(self.executor, cache.store, cache_key, output_zip_path)
+        
+        extracted_files = await loop.run_in_executor(
+            self.executor, self.extractor._process_extraction_results, output_zip_path, output_dir, pdf_name
+        )
+        return {
+            "success": True,
+            "input_file": input_pdf_path,
+            "output_zip": output_zip_path,
+            "extracted_files": extracted_files,
+            "table_format": table_format,
+            "cache_hit": cache_hit
+        }
+    
+    def _observe_job(self, latency: float, result: Optional[Dict[str, Any]] = None,
+                     error: Optional[Exception] = None):
+        """Feed job latency and throttling signals back to the rate controller"""
+        if not isinstance(self.throttler, AdaptiveRateController):
+            return
+        if result is not None:
+            # Cache hits never reach the API and would skew the latency baseline
+            if result.get('cache_hit', False):
+                return
+            if not result.get('success', False):
+                error = result.get('error')
+        
+        self.throttler.record_outcome(latency, AdaptiveRateController.is_throttling_error(error))
+
+
 class AsyncBatchProcessor:
     """High-performance async batch processor for PDF extraction"""
     
@@ -275,155 +542,282 @@ class AsyncBatchProcessor:
         self.config = config or BatchJobConfig()
         self.performance_monitor = PerformanceMonitor()
         
+        # Content-addressed result cache shared by all jobs
+        self.extraction_cache = None
+        if self.config.enable_caching:
+            self.extraction_cache = ExtractionCache(
+                self.config.cache_dir, self.config.cache_max_size_gb
+            )
+        
         # Initialize extractors
         if self.config.advanced_extraction:
             try:
-                self.extractor = AdvancedPDFExtractor(credentials_path)
+                self.extractor = AdvancedPDFExtractor(credentials_path, cache=self.extraction_cache,
+                                                      extract_results=self.config.extract_results)
             except ImportError:
                 logger.warning("Advanced extractor not available, falling back to basic extractor")
-                self.extractor = PDFExtractor(credentials_path)
+                self.extractor = PDFExtractor(credentials_path, cache=self.extraction_cache,
+                                              extract_results=self.config.extract_results)
         else:
-            self.extractor = PDFExtractor(credentials_path)
+            self.extractor = PDFExtractor(credentials_path, cache=self.extraction_cache,
+                                          extract_results=self.config.extract_results)
         
-        # Setup rate limiting
-        rate_per_second = self.config.rate_limit_per_minute / 60.0
-        self.throttler = Throttler(rate_limit=rate_per_second)
+        # Setup rate limiting; static unless adaptive_rate_limit is enabled, in which
+        # case concurrency starts at max_concurrent_jobs and may grow to the ceiling
+        self.concurrency_ceiling = max(self.config.max_concurrent_jobs_ceiling or self.config.max_concurrent_jobs,
+                                       self.config.max_concurrent_jobs)
+        self.throttler = AdaptiveRateController(AdaptiveRateConfig(
+            initial_rate_per_minute=self.config.rate_limit_per_minute,
+            min_rate_per_minute=min(self.config.min_rate_per_minute, self.config.rate_limit_per_minute),
+            max_rate_per_minute=max(self.config.max_rate_per_minute, self.config.rate_limit_per_minute),
+            initial_concurrency=self.config.max_concurrent_jobs,
+            max_concurrency=self.concurrency_ceiling,
+            adaptive=self.config.adaptive_rate_limit
+        ))
         
-        # Initialize processor
-        self.processor = AsyncPDFProcessor(self.extractor, self.throttler)
+        # Pooled async REST session shared by every job when enabled
+        self.rest_client = None
+        if self.config.use_rest_client:
+            token_store = None
+            if self.config.token_redis_url:
+                token_store = RedisTokenStore(self.config.token_redis_url)
+            elif self.config.token_cache_file:
+                token_store = FileTokenStore(self.config.token_cache_file)
+            
+            self.rest_client = AdobeRESTClient.from_credentials_file(
+                credentials_path,
+                max_connections=self.config.http_max_connections,
+                max_connections_per_host=self.config.http_connections_per_host,
+                token_store=token_store
+            )
+        
+        # Initialize processor; the extractor's PDF Services client and the
+        # processor's thread pool are shared by every job in the session
+        self.processor = AsyncPDFProcessor(
+            self.extractor, self.throttler, max_workers=self.concurrency_ceiling,
+            rest_client=self.rest_client
+        )
     
     async def process_batch(self, pdf_files: List[str], 
-                          progress_callback: Optional[Callable] = None) -> BatchProcessingReport:
+                          progress_callback: Optional[Callable] = None,
+                          resume: bool = False) -> BatchProcessingReport:
         """
         Process a batch of PDF files asynchronously
         
+        A sliding window keeps up to max_concurrent_jobs_ceiling extractions in
+        flight at all times; the rate controller admits max_concurrent_jobs of
+        them at first and more as adaptive rate limiting raises its limit.
+        Each result is appended to a JSONL results file as soon as it
+        completes and folded into running statistics, so memory stays flat for
+        very large batches and the results survive a crash partway through.
+        Per-file state is recorded in a job ledger in output_base_dir. Jobs
+        are started in the order given by the configured scheduling_policy.
+        
         Args:
             pdf_files: List of PDF file paths to process
             progress_callback: Optional callback for progress updates
+            resume: Skip files the ledger records as done and retry failed
+                files until they reach max_attempts
             
         Returns:
             Batch processing report with results and statistics
         """
         start_time = datetime.now()
         
+        # Create output directory
+        os.makedirs(self.config.output_base_dir, exist_ok=True)
+        
+        # Record per-file state so an interrupted run can resume
+        ledger = JobLedger(os.path.join(self.config.output_base_dir, self.config.ledger_file))
+        requested_count = len(pdf_files)
+        if resume:
+            recovered = ledger.recover_in_flight()
+            ledger.register(pdf_files)
+            pdf_files = ledger.select_remaining(pdf_files, self.config.max_attempts)
+            logger.info(f"♻️  Resuming: {requested_count - len(pdf_files)} files already finished, "
+                        f"{recovered} interrupted jobs recovered")
+        else:
+            ledger.register(pdf_files, reset=True)
+        
+        # Order jobs by estimated cost so large files do not stretch the tail
+        policy = SchedulingPolicy(self.config.scheduling_policy)
+        input_order = list(pdf_files)
+        scheduled_jobs = plan_jobs(input_order, policy, CostMetric(self.config.scheduling_cost))
+        pdf_files = [job.pdf_path for job in scheduled_jobs]
+        if policy != SchedulingPolicy.FIFO:
+            costs = {job.pdf_path: job.cost for job in scheduled_jobs}
+            estimate = compare_to_fifo(input_order, pdf_files, costs, self.config.max_concurrent_jobs, policy)
+            if estimate['improvement_pct'] is not None:
+                logger.info(f"🗂️  Scheduling {policy.value} by {self.config.scheduling_cost}: "
+                            f"estimated makespan {estimate['improvement_pct']:+.1f}% vs FIFO")
+        
         # Setup progress tracking
-        progress_tracker = ProgressTracker(len(pdf_files))
+        progress_tracker = ProgressTracker(len(pdf_files), status_provider=self.throttler.get_status)
         if progress_callback:
             progress_tracker.add_callback(progress_callback)
         if self.config.progress_callback:
             progress_tracker.add_callback(self.config.progress_callback)
         
-        # Create output directory
-        os.makedirs(self.config.output_base_dir, exist_ok=True)
+        results_file = os.path.join(
+            self.config.output_base_dir,
+            f"batch_results_{start_time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        )
+        
+        # Reuse the session's thread pool and HTTP session, or own them for this batch only
+        owns_executor = self.processor.executor is None
+        owns_http_session = self.rest_client is not None and self.rest_client.session is None
+        self.processor.start()
+        if self.rest_client is not None:
+            await self.rest_client.start()
+        self.processor.executor_stats.reset()
         
         logger.info(f"🚀 Starting batch processing of {len(pdf_files)} PDF files")
         logger.info(f"📋 Config: {self.config.max_concurrent_jobs} concurrent, {self.config.rate_limit_per_minute}/min rate limit")
+        logger.info(f"📝 Streaming results to: {results_file}")
         
-        # Process files in chunks to manage memory
-        all_results = []
-        total_processing_time = 0.0
-        cache_hits = 0
-        errors_by_type = {}
+        statistics = BatchStatistics()
+        retained_results: List[BatchJobResult] = []
+        window_size = max(1, self.concurrency_ceiling)
+        pdf_iterator = iter(pdf_files)
+        in_flight: Dict[asyncio.Task, str] = {}
         
-        # Process files in chunks
-        for chunk_start in range(0, len(pdf_files), self.config.chunk_size):
-            chunk_end = min(chunk_start + self.config.chunk_size, len(pdf_files))
-            chunk_files = pdf_files[chunk_start:chunk_end]
-            
-            logger.info(f"📦 Processing chunk {chunk_start//self.config.chunk_size + 1}: files {chunk_start+1}-{chunk_end}")
-            
-            # Process chunk concurrently
-            semaphore = asyncio.Semaphore(self.config.max_concurrent_jobs)
-            
-            async def process_with_semaphore(pdf_path: str) -> BatchJobResult:
-                async with semaphore:
-                    result = await self.processor.process_pdf_async(pdf_path, self.config)
-                    await progress_tracker.update(result.success)
-                    return result
-            
-            # Execute chunk
-            chunk_tasks = [process_with_semaphore(pdf_path) for pdf_path in chunk_files]
-            chunk_results = await asyncio.gather(*chunk_tasks, return_exceptions=True)
-            
-            # Process results and handle exceptions
-            for result in chunk_results:
-                if isinstance(result, Exception):
-                    # Handle exception
-                    error_type = type(result).__name__
-                    errors_by_type[error_type] = errors_by_type.get(error_type, 0) + 1
-                    
-                    # Create error result
-                    failed_result = BatchJobResult(
-                        pdf_path="unknown",
-                        success=False,
-                        error_message=str(result),
-                        processing_time=0.0
-                    )
-                    all_results.append(failed_result)
-                else:
-                    all_results.append(result)
-                    total_processing_time += result.processing_time
-                    if result.cache_hit:
-                        cache_hits += 1
+        def fill_window():
+            """Start new jobs until the window is full or the input is exhausted"""
+            while len(in_flight) < window_size:
+                pdf_path = next(pdf_iterator, None)
+                if pdf_path is None:
+                    return
+                ledger.mark_in_flight(pdf_path)
+                task = asyncio.create_task(self.processor.process_pdf_async(pdf_path, self.config))
+                in_flight[task] = pdf_path
+        
+        try:
+            with open(results_file, 'a', encoding='utf-8') as results_stream:
+                run_offset = results_stream.tell()
+                self._append_report_line(results_stream, {
+                    'type': 'batch_start',
+                    'start_time': start_time.isoformat(),
+                    'total_files': len(pdf_files),
+                    'config': self.config.to_dict()
+                })
+                
+                fill_window()
+                while in_flight:
+                    done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
                     
-                    # Track error types
-                    if not result.success and result.error_message:
-                        error_type = "ExtractionError"
-                        if "not found" in result.error_message.lower():
-                            error_type = "FileNotFound"
-                        elif "credentials" in result.error_message.lower():
-                            error_type = "CredentialsError"
-                        elif "api" in result.error_message.lower():
-                            error_type = "APIError"
+                    for task in done:
+                        pdf_path = in_flight.pop(task)
+                        error_type = None
                         
-                        errors_by_type[error_type] = errors_by_type.get(error_type, 0) + 1
-            
-            # Small delay between chunks to be respectful to API
-            if chunk_end < len(pdf_files):
-                await asyncio.sleep(1.0)
-        
-        end_time = datetime.now()
-        
-        # Calculate statistics
-        successful_count = sum(1 for r in all_results if r.success)
-        failed_count = len(all_results) - successful_count
-        avg_processing_time = total_processing_time / len(all_results) if all_results else 0.0
-        total_file_size_mb = sum(r.file_size_mb for r in all_results)
-        total_tables_found = sum(r.tables_found for r in all_results if r.success)
-        cache_hit_rate = (cache_hits / len(all_results)) * 100 if all_results else 0.0
-        
-        # Create comprehensive report
-        report = BatchProcessingReport(
-            total_files=len(pdf_files),
-            successful_extractions=successful_count,
-            failed_extractions=failed_count,
-            total_processing_time=(end_time - start_time).total_seconds(),
-            avg_processing_time=avg_processing_time,
-            total_file_size_mb=total_file_size_mb,
-            total_tables_found=total_tables_found,
-            cache_hit_rate=cache_hit_rate,
-            start_time=start_time,
-            end_time=end_time,
-            config=self.config,
-            results=all_results,
-            errors_by_type=errors_by_type
-        )
+                        try:
+                            result = task.result()
+                        except Exception as e:
+                            error_type = type(e).__name__
+                            result = BatchJobResult(
+                                pdf_path=pdf_path,
+                                success=False,
+                                error_message=str(e),
+                                processing_time=0.0
+                            )
+                        
+                        if result.success:
+                            ledger.mark_done(pdf_path, result.output_files)
+                        else:
+                            ledger.mark_failed(pdf_path, result.error_message)
+                        
+                        statistics.add(result, error_type)
+                        self._append_report_line(results_stream, {'type': 'result', **result.to_dict()})
+                        if self.config.retain_results:
+                            retained_results.append(result)
+                        
+                        await progress_tracker.update(result.success)
+                    
+                    fill_window()
+                
+                end_time = datetime.now()
+                executor_stats = self.processor.executor_stats.snapshot()
+                # Durations are read back from the results file rather than held per file during the run
+                scheduling_stats = compare_to_fifo(
+                    input_order, pdf_files, self._read_job_durations(results_file, run_offset),
+                    self.config.max_concurrent_jobs, policy
+                )
+                scheduling_stats['cost_metric'] = self.config.scheduling_cost
+                
+                # Create comprehensive report
+                report = BatchProcessingReport(
+                    total_files=len(pdf_files),
+                    successful_extractions=statistics.successful,
+                    failed_extractions=statistics.failed,
+                    total_processing_time=(end_time - start_time).total_seconds(),
+                    avg_processing_time=statistics.avg_processing_time,
+                    total_file_size_mb=statistics.total_file_size_mb,
+                    total_tables_found=statistics.total_tables_found,
+                    cache_hit_rate=statistics.cache_hit_rate,
+                    start_time=start_time,
+                    end_time=end_time,
+                    config=self.config,
+                    results=retained_results,
+                    errors_by_type=statistics.errors_by_type,
+                    executor_stats=executor_stats,
+                    results_file=results_file,
+                    skipped_files=requested_count - len(pdf_files),
+                    rate_limit_stats=self.throttler.get_status(),
+                    scheduling_stats=scheduling_stats
+                )
+                
+                summary = report.to_dict()
+                summary.pop('results')
+                self._append_report_line(results_stream, {'type': 'batch_summary', **summary})
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if owns_executor:
+                self.processor.shutdown()
+            if owns_http_session:
+                await self.rest_client.close()
+            ledger.close()
         
         # Log summary
         logger.info(f"✅ Batch processing completed!")
-        logger.info(f"📊 Results: {successful_count}/{len(pdf_files)} successful ({report.get_success_rate():.1f}%)")
-        logger.info(f"⏱️  Total time: {report.total_processing_time:.1f}s, Avg: {avg_processing_time:.1f}s per file")
-        logger.info(f"💾 Cache hit rate: {cache_hit_rate:.1f}%")
-        logger.info(f"📋 Tables found: {total_tables_found}")
+        logger.info(f"📊 Results: {statistics.successful}/{len(pdf_files)} successful ({report.get_success_rate():.1f}%)")
+        logger.info(f"⏱️  Total time: {report.total_processing_time:.1f}s, Avg: {statistics.avg_processing_time:.1f}s per file")
+        logger.info(f"💾 Cache hit rate: {statistics.cache_hit_rate:.1f}%")
+        logger.info(f"📋 Tables found: {statistics.total_tables_found}")
+        logger.info(f"🚦 Rate limit: {self.throttler.rate_per_minute:.1f}/min, "
+                    f"concurrency {self.throttler.concurrency_limit}")
+        if policy != SchedulingPolicy.FIFO and scheduling_stats['improvement_pct'] is not None:
+            logger.info(f"🗂️  Makespan vs FIFO ({policy.value}): {scheduling_stats['improvement_pct']:+.1f}% "
+                        f"({scheduling_stats['makespan_seconds']:.1f}s vs {scheduling_stats['fifo_makespan_seconds']:.1f}s replayed)")
+        logger.info(f"🧵 Executor utilization: {executor_stats['utilization']:.1%}, "
+                    f"peak queue depth: {executor_stats['peak_queue_depth']}")
         
-        if errors_by_type:
-            logger.warning(f"❌ Errors by type: {errors_by_type}")
+        if statistics.errors_by_type:
+            logger.warning(f"❌ Errors by type: {statistics.errors_by_type}")
         
         # Save report
         await self._save_batch_report(report)
         
         return report
     
+    @staticmethod
+    def _append_report_line(stream, record: Dict[str, Any]):
+        """Append one JSON record to the results stream and force it to disk"""
+        stream.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        stream.flush()
+        os.fsync(stream.fileno())
+    
+    @staticmethod
+    def _read_job_durations(results_file: str, offset: int) -> Dict[str, float]:
+        """Processing time of each file, from the result lines written since offset"""
+        durations = {}
+        with open(results_file, 'r', encoding='utf-8') as f:
+            f.seek(offset)
+            for line in f:
+                record = json.loads(line)
+                if record.get('type') == 'result':
+                    durations[record['pdf_path']] = record['processing_time']
+        return durations
+    
     async def _save_batch_report(self, report: BatchProcessingReport):
         """Save batch processing report to file"""
         try:
@@ -442,7 +836,8 @@ class AsyncBatchProcessor:
     
     async def process_directory(self, directory: str, pattern: str = "*.pdf",
                               recursive: bool = True, 
-                              progress_callback: Optional[Callable] = None) -> BatchProcessingReport:
+                              progress_callback: Optional[Callable] = None,
+                              resume: bool = False) -> BatchProcessingReport:
         """
         Process all PDF files in a directory
         
@@ -451,6 +846,7 @@ class AsyncBatchProcessor:
             pattern: File pattern to match (default: "*.pdf")
             recursive: Whether to scan subdirectories
             progress_callback: Optional progress callback
+            resume: Continue an interrupted run using the job ledger
             
         Returns:
             Batch processing report
@@ -487,17 +883,23 @@ class AsyncBatchProcessor:
                 errors_by_type={}
             )
         
-        return await self.process_batch(pdf_paths, progress_callback)
+        return await self.process_batch(pdf_paths, progress_callback, resume=resume)
     
     @asynccontextmanager
     async def batch_session(self):
         """Context manager for batch processing sessions"""
         session_start = time.time()
         logger.info("🔄 Starting batch processing session")
+        self.processor.start()
+        if self.rest_client is not None:
+            await self.rest_client.start()
         
         try:
             yield self
         finally:
+            self.processor.shutdown()
+            if self.rest_client is not None:
+                await self.rest_client.close()
             session_duration = time.time() - session_start
             logger.info(f"🏁 Batch processing session completed in {session_duration:.1f}s")
 
@@ -526,7 +928,8 @@ async def process_pdf_directory(directory: str, credentials_path: str,
                               config: Optional[BatchJobConfig] = None,
                               pattern: str = "*.pdf",
                               recursive: bool = True,
-                              progress_callback: Optional[Callable] = None) -> BatchProcessingReport:
+                              progress_callback: Optional[Callable] = None,
+                              resume: bool = False) -> BatchProcessingReport:
     """
     Convenience function for batch processing PDF directory
     
@@ -537,12 +940,13 @@ async def process_pdf_directory(directory: str, credentials_path: str,
         pattern: File pattern to match
         recursive: Whether to scan subdirectories
         progress_callback: Optional progress callback
+        resume: Continue an interrupted run using the job ledger
         
     Returns:
         Batch processing report
     """
     processor = AsyncBatchProcessor(credentials_path, config)
-    return await processor.process_directory(directory, pattern, recursive, progress_callback)
+    return await processor.process_directory(directory, pattern, recursive, progress_callback, resume=resume)
 
 
 # CLI and testing
@@ -12,6 +12,8 @@ from pathlib import Path
 from PIL import Image
 import logging
 
+from structured_data_reader import StructuredDataReader
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -29,14 +31,20 @@ class CompleteDataExtractor:
         self.extracted_tables = []
         self.financial_elements = []
         
-    def load_data(self):
-        """Load structured data from Adobe PDF Extract API"""
-        if not os.path.exists(self.json_file):
-            logger.error("JSON file not found")
-            return False
+    def load_data(self, elements=None):
+        """
+        Load structured data from Adobe PDF Extract API
+        
+        Only text elements are kept, streamed from json_file unless an
+        element iterable such as a StructuredDataReader is given.
+        """
+        if elements is None:
+            if not os.path.exists(self.json_file):
+                logger.error("JSON file not found")
+                return False
+            elements = StructuredDataReader(self.json_file, text_only=True)
         
-        with open(self.json_file, 'r', encoding='utf-8') as f:
-            self.structured_data = json.load(f)
+        self.structured_data = {'elements': [elem for elem in elements if elem.get('Text')]}
         
         logger.info(f"✅ Loaded {len(self.structured_data.get('elements', []))} elements")
         return True
@@ -271,9 +279,9 @@ class CompleteDataExtractor:
         
         return predictions
     
-    def create_comprehensive_report(self):
-        """Create comprehensive extraction report"""
-        if not self.load_data():
+    def create_comprehensive_report(self, elements=None):
+        """Create comprehensive extraction report, optionally from already streamed elements"""
+        if not self.load_data(elements):
             return None
         
         # Extract all data
@@ -5,40 +5,91 @@ Shows all extracted data and analyzes table structure for financial accuracy
 """
 
 import os
-import json
 import pandas as pd
 from pathlib import Path
 from PIL import Image
 import logging
 
+from result_archive import ExtractionArchive, load_structured_data
+from keyword_matcher import KeywordMatcher
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class FinancialDataAnalyzer:
     """Analyze extracted financial data for accuracy and structure"""
     
+    # Financial keywords to look for in text elements (case-insensitive)
+    FINANCIAL_KEYWORDS = KeywordMatcher({'financial': [
+        'USD', 'EUR', 'CHF', 'valuation', 'portfolio', 'asset', 'bond', 
+        'equity', 'price', 'value', 'total', 'market', 'shares', 'units',
+        'MESSOS', 'Client', 'Number', 'security', 'instrument'
+    ]})
+    
     def __init__(self, extraction_dir: str):
         """
         Initialize analyzer
         
         Args:
-            extraction_dir: Directory containing extraction results
+            extraction_dir: Directory containing extraction results, unpacked
+                or as *_extracted.zip archives, or a single result ZIP
         """
         self.extraction_dir = extraction_dir
         self.json_file = None
         self.figures_dir = None
+        self.archive = None
         self.structured_data = None
         self._find_files()
     
     def _find_files(self):
-        """Find JSON and figures directory"""
+        """Find JSON and figures directory, falling back to a result ZIP"""
+        result_zips = [self.extraction_dir] if self.extraction_dir.endswith('.zip') else []
         for root, dirs, files in os.walk(self.extraction_dir):
             for file in files:
                 if file == 'structuredData.json':
                     self.json_file = os.path.join(root, file)
+                elif file.endswith('.zip'):
+                    result_zips.append(os.path.join(root, file))
             for dir_name in dirs:
                 if dir_name == 'figures':
                     self.figures_dir = os.path.join(root, dir_name)
+        
+        if self.json_file:
+            return
+        
+        # Read results in place from the ZIP the extractor left behind
+        for zip_path in sorted(result_zips):
+            try:
+                archive = ExtractionArchive(zip_path)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable archive {zip_path}: {e}")
+                continue
+            if archive.json_member:
+                self.archive = archive
+                self.json_file = archive.ref(archive.json_member)
+                return
+            archive.close()
+    
+    def _figure_files(self):
+        """
+        List figure images as (file name, size in bytes, opener) tuples
+        
+        The opener returns a binary file object, read from the figures
+        directory or straight from the result ZIP.
+        """
+        if self.archive is not None:
+            return [(os.path.basename(member), self.archive.size(member),
+                     lambda member=member: self.archive.open(member))
+                    for member in sorted(self.archive.figure_files())]
+        
+        if not self.figures_dir or not os.path.exists(self.figures_dir):
+            return []
+        
+        figures = []
+        for fig_file in sorted(f for f in os.listdir(self.figures_dir) if f.endswith('.png')):
+            fig_path = os.path.join(self.figures_dir, fig_file)
+            figures.append((fig_file, os.path.getsize(fig_path), lambda fig_path=fig_path: open(fig_path, 'rb')))
+        return figures
     
     def load_structured_data(self):
         """Load and parse the structured JSON data"""
@@ -47,8 +98,7 @@ class FinancialDataAnalyzer:
             return False
         
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                self.structured_data = json.load(f)
+            self.structured_data = load_structured_data(self.json_file)
             logger.info(f"✅ Loaded structured data from {self.json_file}")
             return True
         except Exception as e:
@@ -113,13 +163,6 @@ class FinancialDataAnalyzer:
         
         print(f"📝 Text elements found: {len(text_elements)}")
         
-        # Financial keywords to look for
-        financial_keywords = [
-            'USD', 'EUR', 'CHF', 'valuation', 'portfolio', 'asset', 'bond', 
-            'equity', 'price', 'value', 'total', 'market', 'shares', 'units',
-            'MESSOS', 'Client', 'Number', 'security', 'instrument'
-        ]
-        
         financial_texts = []
         for elem in text_elements:
             text = elem.get('Text', '').strip()
@@ -127,7 +170,7 @@ class FinancialDataAnalyzer:
             bounds = elem.get('Bounds', [])
             
             # Check for financial keywords
-            if any(keyword.lower() in text.lower() for keyword in financial_keywords):
+            if self.FINANCIAL_KEYWORDS.scan(text):
                 financial_texts.append({
                     'text': text,
                     'page': page,
@@ -145,25 +188,19 @@ class FinancialDataAnalyzer:
         print("\n🖼️  **FIGURE ANALYSIS**")
         print("-" * 30)
         
-        if not self.figures_dir or not os.path.exists(self.figures_dir):
+        figure_files = self._figure_files()
+        if not figure_files:
             print("❌ No figures directory found")
             return
         
-        figure_files = [f for f in os.listdir(self.figures_dir) if f.endswith('.png')]
-        figure_files.sort()
-        
         print(f"🖼️  Total figure images: {len(figure_files)}")
         
         # Analyze image sizes and properties
         figure_analysis = []
-        for fig_file in figure_files:
-            fig_path = os.path.join(self.figures_dir, fig_file)
+        for fig_file, file_size, open_figure in figure_files:
             try:
-                # Get file size
-                file_size = os.path.getsize(fig_path)
-                
                 # Get image dimensions
-                with Image.open(fig_path) as img:
+                with open_figure() as f, Image.open(f) as img:
                     width, height = img.size
                     mode = img.mode
                 
@@ -294,18 +331,15 @@ class FinancialDataAnalyzer:
         print("-" * 30)
         
         # Count figure images by size (proxy for complexity)
-        if not self.figures_dir or not os.path.exists(self.figures_dir):
+        figure_files = self._figure_files()
+        if not figure_files:
             print("❌ No figures to analyze for OCR")
             return
         
-        figure_files = [f for f in os.listdir(self.figures_dir) if f.endswith('.png')]
-        
         ocr_candidates = []
-        for fig_file in figure_files:
-            fig_path = os.path.join(self.figures_dir, fig_file)
+        for fig_file, file_size, open_figure in figure_files:
             try:
-                file_size = os.path.getsize(fig_path)
-                with Image.open(fig_path) as img:
+                with open_figure() as f, Image.open(f) as img:
                     width, height = img.size
                     aspect_ratio = width/height if height > 0 else 0
                 
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Columnar Element Store for Adobe Extraction Results
+One array-backed table per document, shared by reference between the spatial
+analyzer and the financial parsers
+"""
+
+import hashlib
+import logging
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from structured_data_reader import StructuredDataReader
+
+logger = logging.getLogger(__name__)
+
+
+class StringPool:
+    """Interned strings addressed by integer id"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+    def __getitem__(self, string_id: int) -> str:
+        return self.strings[string_id]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class ElementTable:
+    """
+    Adobe elements as parallel NumPy columns
+
+    Rows are grouped by page (reading order is kept within each page, and
+    source_index records the original position). Bounds are stored exactly
+    as Adobe reports them, [x1, y1, x2, y2] in PDF points, NaN when missing;
+    text, Path and font name are ids into one shared StringPool.
+    """
+
+    def __init__(self, page: np.ndarray, bounds: np.ndarray, text_size: np.ndarray,
+                 font_size: np.ndarray, text_id: np.ndarray, path_id: np.ndarray,
+                 font_id: np.ndarray, source_index: np.ndarray, strings: StringPool):
+        order = np.argsort(page, kind='stable')
+        self.page = page[order]
+        self.bounds = bounds[order]
+        self.text_size = text_size[order]
+        self.font_size = font_size[order]
+        self.text_id = text_id[order]
+        self.path_id = path_id[order]
+        self.font_id = font_id[order]
+        self.source_index = source_index[order]
+        self.strings = strings
+
+        # Page offset index: rows of page_numbers[i] are page_offsets[i]:page_offsets[i + 1]
+        self.page_numbers, starts = np.unique(self.page, return_index=True)
+        self.page_offsets = np.append(starts, len(self.page)).astype(np.int64)
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[Dict[str, Any]], text_only: bool = True) -> 'ElementTable':
+        """
+        Build a table in one pass over Adobe element dictionaries
+
+        Args:
+            elements: Element dictionaries, e.g. a StructuredDataReader
+            text_only: Skip elements without text
+        """
+        strings = StringPool()
+        page, text_id, path_id, font_id, source_index = (array('i') for _ in range(5))
+        bounds, text_size, font_size = array('d'), array('d'), array('d')
+        nan_bounds = (np.nan,) * 4
+
+        for index, element in enumerate(elements):
+            text = (element.get('Text') or '').strip()
+            if text_only and not text:
+                continue
+
+            element_bounds = element.get('Bounds') or ()
+            font = element.get('Font') or {}
+            page.append(int(element.get('Page', 0)))
+            bounds.extend(element_bounds[:4] if len(element_bounds) >= 4 else nan_bounds)
+            text_size.append(float(element.get('TextSize') or 0.0))
+            font_size.append(float(font.get('size') or 0.0))
+            text_id.append(strings.intern(text))
+            path_id.append(strings.intern(element.get('Path') or ''))
+            font_id.append(strings.intern(font.get('name') or ''))
+            source_index.append(index)
+
+        as_int = lambda values: np.frombuffer(values, dtype=np.int32) if len(values) else np.zeros(0, np.int32)
+        as_float = lambda values, dtype: np.frombuffer(values, dtype=dtype) if len(values) else np.zeros(0, dtype)
+        return cls(
+            page=as_int(page),
+            bounds=as_float(bounds, np.float64).reshape(-1, 4),
+            text_size=as_float(text_size, np.float64),
+            font_size=as_float(font_size, np.float64),
+            text_id=as_int(text_id),
+            path_id=as_int(path_id),
+            font_id=as_int(font_id),
+            source_index=as_int(source_index),
+            strings=strings
+        )
+
+    @classmethod
+    def from_file(cls, source: str, pages: Optional[Iterable[int]] = None,
+                  path_prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+                  text_only: bool = True) -> 'ElementTable':
+        """Build a table by streaming a structuredData.json path or archive reference"""
+        reader = StructuredDataReader(source, pages=pages, path_prefix=path_prefix, text_only=text_only)
+        return cls.from_elements(reader, text_only=text_only)
+
+    def __len__(self) -> int:
+        return len(self.page)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Rows as element dictionaries in document order, for dictionary-based consumers"""
+        return self.to_dicts(self.select())
+
+    def __repr__(self) -> str:
+        # Content digest rather than object identity, so monitor_performance
+        # can cache analyses keyed on the table
+        return f"ElementTable(rows={len(self)}, pages={len(self.page_numbers)}, digest={self.digest})"
+
+    @property
+    def digest(self) -> str:
+        """Hash of the table contents"""
+        if self._digest is None:
+            hasher = hashlib.sha256()
+            for column in (self.page, self.bounds, self.text_size, self.font_size,
+                           self.text_id, self.path_id, self.font_id):
+                hasher.update(np.ascontiguousarray(column).tobytes())
+            for value in self.strings.strings:
+                hasher.update(value.encode('utf-8'))
+                hasher.update(b'\0')
+            self._digest = hasher.hexdigest()[:16]
+        return self._digest
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns, excluding the string pool"""
+        return sum(column.nbytes for column in (self.page, self.bounds, self.text_size, self.font_size,
+                                                self.text_id, self.path_id, self.font_id, self.source_index))
+
+    # Geometry in Adobe's [x1, y1, x2, y2] convention. OptimizedSpatialAnalyzer
+    # deliberately keeps its legacy reading of raw bounds columns 2-3 as width
+    # and height, so that tables and element dictionaries give it the same
+    # elements; it does not use width and height below.
+    @property
+    def x(self) -> np.ndarray:
+        return self.bounds[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.bounds[:, 1]
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.bounds[:, 2] - self.bounds[:, 0]
+
+    @property
+    def height(self) -> np.ndarray:
+        return self.bounds[:, 3] - self.bounds[:, 1]
+
+    @property
+    def has_bounds(self) -> np.ndarray:
+        return ~np.isnan(self.bounds).any(axis=1)
+
+    def text(self, row: int) -> str:
+        return self.strings[self.text_id[row]]
+
+    def path(self, row: int) -> str:
+        return self.strings[self.path_id[row]]
+
+    def font_name(self, row: int) -> str:
+        return self.strings[self.font_id[row]]
+
+    def page_rows(self, page: int) -> slice:
+        """Row range of one page; empty if the page has no elements"""
+        index = np.searchsorted(self.page_numbers, page)
+        if index == len(self.page_numbers) or self.page_numbers[index] != page:
+            return slice(0, 0)
+        return slice(int(self.page_offsets[index]), int(self.page_offsets[index + 1]))
+
+    def path_mask(self, prefix: Union[str, Tuple[str, ...]]) -> np.ndarray:
+        """Rows whose Path starts with prefix, tested once per distinct string"""
+        matches = np.fromiter((value.startswith(prefix) for value in self.strings.strings),
+                              dtype=bool, count=len(self.strings))
+        return matches[self.path_id]
+
+    def box_mask(self, x1: float, y1: float, x2: float, y2: float) -> np.ndarray:
+        """Rows whose bounds lie inside a rectangle"""
+        return ((self.bounds[:, 0] >= x1) & (self.bounds[:, 1] >= y1) &
+                (self.bounds[:, 2] <= x2) & (self.bounds[:, 3] <= y2))
+
+    def select(self, pages: Optional[Iterable[int]] = None,
+               path_prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+               mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Row numbers matching all given filters, in original document order
+
+        Args:
+            pages: Only rows on these pages
+            path_prefix: Only rows whose Path starts with this prefix
+            mask: Additional boolean row mask, e.g. from box_mask
+        """
+        selected = np.ones(len(self), dtype=bool) if mask is None else mask.copy()
+        if pages is not None:
+            selected &= np.isin(self.page, np.fromiter(pages, dtype=np.int64))
+        if path_prefix:
+            selected &= self.path_mask(path_prefix)
+        rows = np.flatnonzero(selected)
+        return rows[np.argsort(self.source_index[rows], kind='stable')]
+
+    def iter_rows(self, rows: Optional[Union[np.ndarray, slice]] = None) -> Iterator[int]:
+        """Row numbers in table order, optionally restricted to a mask, index array or slice"""
+        if rows is None:
+            return iter(range(len(self)))
+        if isinstance(rows, slice):
+            return iter(range(*rows.indices(len(self))))
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return iter(rows.tolist())
+
+    def to_dicts(self, rows: Optional[Union[np.ndarray, slice]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield rows as Adobe-style element dictionaries"""
+        has_bounds = self.has_bounds
+        for row in self.iter_rows(rows):
+            element = {
+                'Text': self.text(row),
+                'Page': int(self.page[row]),
+                'Path': self.path(row),
+                'TextSize': float(self.text_size[row]),
+                'Font': {'name': self.font_name(row), 'size': float(self.font_size[row])}
+            }
+            if has_bounds[row]:
+                element['Bounds'] = self.bounds[row].tolist()
+            yield element
@@ -5,15 +5,15 @@ Optimizes Adobe PDF Services API for best possible extraction results
 """
 
 import os
-import json
 import logging
 from typing import Dict, Any, List, Optional
 import time
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 # Import existing components
 try:
-    from pdf_extractor import PDFExtractor
+    from pdf_extractor import PDFExtractor, SharedUpload
     from advanced_pdf_extractor import AdvancedPDFExtractor
     from optimized_spatial_analysis import create_spatial_analyzer, analyze_spatial_structure
     from complete_data_extractor import CompleteDataExtractor
@@ -21,6 +21,8 @@ try:
     from performance_monitor import monitor_performance
     from exceptions import TableExtractionError, OCRError
     from retry_handler import with_retry
+    from result_archive import result_exists, materialize
+    from element_table import ElementTable
 except ImportError:
     logging.warning("Some modules not available")
 
@@ -59,7 +61,10 @@ class EnhancedAdobeProcessor:
             'enable_multiple_passes': True,
             'enable_spatial_enhancement': True,
             'enable_confidence_boosting': True,
-            'min_confidence_threshold': 0.3
+            'min_confidence_threshold': 0.3,
+            'enable_concurrent_passes': True,
+            'max_parallel_passes': 3,
+            'early_stop_score': None  # Stop waiting once a pass scores at least this
         }
     
     @monitor_performance(cache_ttl=3600)
@@ -103,64 +108,153 @@ class EnhancedAdobeProcessor:
     def _multi_pass_extraction(self, pdf_path: str, output_dir: str) -> Dict[str, Any]:
         """
         Perform multi-pass extraction to get best results
+
+        The PDF is uploaded by the first pass that misses the result cache and
+        every later pass is submitted against that asset; when all passes are
+        cache hits nothing is uploaded. With concurrent passes enabled,
+        wall-clock time approaches the slowest single pass instead of the sum
+        of all passes.
         """
-        passes = []
+        input_asset = SharedUpload(self.basic_extractor.upload_pdf, pdf_path)
+        
+        pass_specs = self._build_extraction_passes(pdf_path, output_dir, input_asset)
+        
+        if self.quality_settings['enable_concurrent_passes']:
+            passes = self._run_passes_concurrently(pass_specs)
+        else:
+            passes = []
+            for pass_spec in pass_specs:
+                pass_result = self._run_extraction_pass(*pass_spec)
+                passes.append(pass_result)
+                if self._meets_early_stop_score(pass_result):
+                    break
+        
+        # Select best result from all passes
+        best_result = self._select_best_extraction_pass(passes)
+        best_result['all_passes'] = passes
+        
+        return best_result
+    
+    def _build_extraction_passes(self, pdf_path: str, output_dir: str,
+                                 input_asset: Optional[SharedUpload] = None) -> List[tuple]:
+        """Build (pass_type, description, extraction function, arguments) for each pass"""
+        pass_specs = []
         
         # Pass 1: Basic extraction with OCR enabled
-        logger.info("📋 Pass 1: Basic extraction with OCR")
-        try:
-            result_basic = self.basic_extractor.extract_tables(
-                input_pdf_path=pdf_path,
-                output_dir=f"{output_dir}/pass1_basic",
-                table_format="csv",
-                extract_text=True,
-                enable_ocr=True
-            )
-            result_basic['pass_type'] = 'basic_ocr'
-            passes.append(result_basic)
-        except Exception as e:
-            logger.error(f"Basic extraction failed: {e}")
-            passes.append({'success': False, 'pass_type': 'basic_ocr', 'error': str(e)})
+        pass_specs.append((
+            'basic_ocr', "Pass 1: Basic extraction with OCR",
+            self.basic_extractor.extract_tables,
+            {
+                'input_pdf_path': pdf_path,
+                'output_dir': f"{output_dir}/pass1_basic",
+                'table_format': "csv",
+                'extract_text': True,
+                'enable_ocr': True,
+                'input_asset': input_asset
+            }
+        ))
         
         # Pass 2: Advanced extraction with renditions (if available)
         if self.has_advanced:
-            logger.info("📋 Pass 2: Advanced extraction with renditions")
-            try:
-                result_advanced = self.advanced_extractor.extract_with_renditions(
-                    input_pdf_path=pdf_path,
-                    output_dir=f"{output_dir}/pass2_advanced",
-                    table_format="csv",
-                    extract_text=True,
-                    extract_figures=True,
-                    extract_tables=True
-                )
-                result_advanced['pass_type'] = 'advanced_renditions'
-                passes.append(result_advanced)
-            except Exception as e:
-                logger.error(f"Advanced extraction failed: {e}")
-                passes.append({'success': False, 'pass_type': 'advanced_renditions', 'error': str(e)})
+            pass_specs.append((
+                'advanced_renditions', "Pass 2: Advanced extraction with renditions",
+                self.advanced_extractor.extract_with_renditions,
+                {
+                    'input_pdf_path': pdf_path,
+                    'output_dir': f"{output_dir}/pass2_advanced",
+                    'table_format': "csv",
+                    'extract_text': True,
+                    'extract_figures': True,
+                    'extract_tables': True,
+                    'input_asset': input_asset
+                }
+            ))
         
         # Pass 3: Excel format extraction (different parser might catch different tables)
-        logger.info("📋 Pass 3: Excel format extraction")
+        pass_specs.append((
+            'excel_format', "Pass 3: Excel format extraction",
+            self.basic_extractor.extract_tables,
+            {
+                'input_pdf_path': pdf_path,
+                'output_dir': f"{output_dir}/pass3_excel",
+                'table_format': "xlsx",
+                'extract_text': True,
+                'enable_ocr': True,
+                'input_asset': input_asset
+            }
+        ))
+        
+        return pass_specs
+    
+    def _run_extraction_pass(self, pass_type: str, description: str,
+                             extraction_func, extraction_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single extraction pass, converting failures into a failed pass result"""
+        logger.info(f"📋 {description}")
         try:
-            result_excel = self.basic_extractor.extract_tables(
-                input_pdf_path=pdf_path,
-                output_dir=f"{output_dir}/pass3_excel",
-                table_format="xlsx",
-                extract_text=True,
-                enable_ocr=True
-            )
-            result_excel['pass_type'] = 'excel_format'
-            passes.append(result_excel)
+            pass_result = extraction_func(**extraction_args)
+            pass_result['pass_type'] = pass_type
+            return pass_result
         except Exception as e:
-            logger.error(f"Excel format extraction failed: {e}")
-            passes.append({'success': False, 'pass_type': 'excel_format', 'error': str(e)})
+            logger.error(f"{pass_type} extraction failed: {e}")
+            return {'success': False, 'pass_type': pass_type, 'error': str(e)}
+    
+    def _run_passes_concurrently(self, pass_specs: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Run passes in parallel and collect them as they finish
         
-        # Select best result from all passes
-        best_result = self._select_best_extraction_pass(passes)
-        best_result['all_passes'] = passes
+        At most max_parallel_passes are submitted at a time and the next one is
+        submitted only after a pass finishes without clearing the early stop
+        score, so an early stop never starts another pass. Running passes are
+        not waited for; Adobe jobs cannot be cancelled server-side, so they
+        still finish in the background.
+        """
+        passes = []
+        max_workers = max(1, min(self.quality_settings['max_parallel_passes'], len(pass_specs)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extraction_pass")
+        remaining = iter(pass_specs)
+        futures = {}
         
-        return best_result
+        def submit_next():
+            pass_spec = next(remaining, None)
+            if pass_spec is not None:
+                futures[executor.submit(self._run_extraction_pass, *pass_spec)] = pass_spec[0]
+        
+        try:
+            for _ in range(max_workers):
+                submit_next()
+            
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                stop = False
+                for future in done:
+                    del futures[future]
+                    pass_result = future.result()
+                    passes.append(pass_result)
+                    stop = stop or self._meets_early_stop_score(pass_result)
+                
+                if stop:
+                    skipped = list(futures.values()) + [pass_spec[0] for pass_spec in remaining]
+                    if skipped:
+                        logger.info(f"⏹️  Early stop: skipping remaining passes {skipped}")
+                    break
+                
+                for _ in done:
+                    submit_next()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Keep pass order stable so score ties resolve the same way as sequential runs
+        pass_order = {pass_spec[0]: index for index, pass_spec in enumerate(pass_specs)}
+        passes.sort(key=lambda pass_result: pass_order[pass_result['pass_type']])
+        
+        return passes
+    
+    def _meets_early_stop_score(self, pass_result: Dict[str, Any]) -> bool:
+        """Check whether a pass is good enough to stop running further passes"""
+        early_stop_score = self.quality_settings.get('early_stop_score')
+        if early_stop_score is None:
+            return False
+        return self._calculate_extraction_score(pass_result) >= early_stop_score
     
     def _select_best_extraction_pass(self, passes: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Select the best extraction result from multiple passes"""
@@ -223,17 +317,12 @@ class EnhancedAdobeProcessor:
             extracted_files = extraction_result.get('extracted_files', {})
             json_file = extracted_files.get('json')
             
-            if json_file and os.path.exists(json_file):
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    structured_data = json.load(f)
+            if json_file and result_exists(json_file):
+                # Columnar text elements for spatial analysis
+                elements_data = ElementTable.from_file(json_file)
+                spatial_results = self.spatial_analyzer.analyze_document(elements_data)
                 
-                # Get elements for spatial analysis
-                elements_data = structured_data.get('elements', [])
-                
-                if elements_data:
-                    # Perform spatial analysis
-                    spatial_results = self.spatial_analyzer.analyze_document(elements_data)
-                    
+                if spatial_results.get('elements_processed'):
                     # Enhance extraction result with spatial analysis
                     extraction_result['spatial_analysis'] = spatial_results
                     extraction_result['spatial_tables_found'] = len(spatial_results.get('tables', []))
@@ -352,8 +441,10 @@ class EnhancedAdobeProcessor:
             # Mock the paths for the securities extractor based on our results
             extracted_files = basic_result.get('extracted_files', {})
             if 'json' in extracted_files:
-                securities_extractor.json_file = extracted_files['json']
-                securities_extractor.figures_dir = os.path.dirname(extracted_files['json']) + "/figures"
+                # The securities extractor reads figures from disk, so unpack results kept in the ZIP
+                json_path = materialize(extracted_files['json'], whole_archive=True)
+                securities_extractor.json_file = json_path
+                securities_extractor.figures_dir = os.path.dirname(json_path) + "/figures"
             
             securities_report = securities_extractor.create_comprehensive_securities_report()
             
@@ -6,17 +6,23 @@ This will get every security with names, ISIN codes, prices, and valuations
 
 import os
 import json
-import requests
-import time
+import asyncio
 import zipfile
 import pandas as pd
 import logging
 
+from adobe_rest_client import AdobeRESTClient
+from token_manager import FileTokenStore
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 def extract_all_securities_with_adobe():
     """Extract complete securities data using Adobe's table extraction"""
+    return asyncio.run(extract_all_securities_with_adobe_async())
+
+async def extract_all_securities_with_adobe_async():
+    """Extract complete securities data over the shared async REST client"""
     
     # Your Adobe credentials
     client_id = os.getenv("ADOBE_CLIENT_ID", "YOUR_CLIENT_ID_HERE")
@@ -33,156 +39,82 @@ def extract_all_securities_with_adobe():
         print(f"❌ PDF file not found: {pdf_path}")
         return None
     
-    # Get access token
-    access_token = get_adobe_access_token(client_id, client_secret)
-    if not access_token:
-        print("❌ Failed to get Adobe access token")
-        return None
-    
-    print("✅ Adobe authentication successful")
-    
-    # ENHANCED extraction options specifically for financial tables
-    extract_options = {
-        "elementsToExtract": ["text", "tables"],
-        "elementsToExtractRenditions": ["tables", "figures"],
-        "tableStructureFormat": "csv"
-    }
-    
-    try:
-        # Step 1: Create upload URI
-        upload_url = "https://pdf-services.adobe.io/assets"
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': client_id,
-            'Content-Type': 'application/json'
-        }
-        
-        upload_payload = {"mediaType": "application/pdf"}
-        upload_response = requests.post(upload_url, headers=headers, json=upload_payload)
-        upload_response.raise_for_status()
-        upload_data = upload_response.json()
-        
-        asset_id = upload_data.get('assetID')
-        upload_uri = upload_data.get('uploadUri')
-        
-        print(f"📤 Uploading PDF to Adobe...")
-        
-        # Step 2: Upload PDF
-        with open(pdf_path, 'rb') as pdf_file:
-            put_headers = {'Content-Type': 'application/pdf'}
-            put_response = requests.put(upload_uri, headers=put_headers, data=pdf_file)
-            put_response.raise_for_status()
-        
-        print(f"✅ PDF uploaded successfully (Asset ID: {asset_id})")
+    # Tokens are valid for hours; reuse them across runs instead of logging in every time
+    async with AdobeRESTClient(client_id, client_secret, job_timeout=600,
+                               token_store=FileTokenStore()) as client:
+        # Get access token
+        access_token = await get_adobe_access_token(client)
+        if not access_token:
+            print("❌ Failed to get Adobe access token")
+            return None
         
-        # Step 3: Submit enhanced extraction job
-        extract_url = "https://pdf-services.adobe.io/operation/extractpdf"
-        extract_headers = {
-            'Authorization': f'Bearer {access_token}',
-            'X-API-Key': client_id,
-            'Content-Type': 'application/json'
-        }
+        print("✅ Adobe authentication successful")
         
-        # Use the basic format that works, then enhance processing
-        extract_payload = {
-            "assetID": asset_id
+        # ENHANCED extraction options specifically for financial tables
+        extract_options = {
+            "elementsToExtract": ["text", "tables"],
+            "elementsToExtractRenditions": ["tables", "figures"],
+            "tableStructureFormat": "csv"
         }
         
-        print("🔄 Submitting enhanced extraction job with table recognition...")
-        print(f"📊 Options: {list(extract_options.keys())}")
-        
-        extract_response = requests.post(extract_url, headers=extract_headers, json=extract_payload)
-        extract_response.raise_for_status()
-        
-        job_url = extract_response.headers.get('location')
-        print(f"✅ Enhanced extraction job submitted successfully")
-        
-        # Step 4: Poll for completion and process results
-        return poll_and_extract_securities(job_url, access_token, client_id)
-        
-    except Exception as e:
-        print(f"❌ Adobe extraction failed: {e}")
-        if hasattr(e, 'response') and e.response:
-            print(f"Response: {e.response.text}")
-        return None
+        try:
+            print(f"📤 Uploading PDF to Adobe...")
+            
+            # Step 1-2: Create upload URI and upload PDF
+            asset_id = await client.upload(pdf_path)
+            
+            print(f"✅ PDF uploaded successfully (Asset ID: {asset_id})")
+            
+            # Step 3: Submit enhanced extraction job
+            # Use the basic format that works, then enhance processing
+            extract_payload = {
+                "assetID": asset_id
+            }
+            
+            print("🔄 Submitting enhanced extraction job with table recognition...")
+            print(f"📊 Options: {list(extract_options.keys())}")
+            
+            job_url = await client.submit("extractpdf", extract_payload)
+            print(f"✅ Enhanced extraction job submitted successfully")
+            
+            # Step 4: Poll for completion and process results
+            return await poll_and_extract_securities(job_url, client)
+            
+        except Exception as e:
+            print(f"❌ Adobe extraction failed: {e}")
+            return None
 
-def get_adobe_access_token(client_id, client_secret):
+async def get_adobe_access_token(client):
     """Get Adobe access token"""
-    auth_url = "https://ims-na1.adobelogin.com/ims/token/v1"
-    auth_data = {
-        'client_id': client_id,
-        'client_secret': client_secret,
-        'grant_type': 'client_credentials',
-        'scope': 'openid,AdobeID,read_organizations,additional_info.projectedProductContext'
-    }
-    
     try:
-        response = requests.post(auth_url, data=auth_data, timeout=30)
-        response.raise_for_status()
-        return response.json().get('access_token')
+        return await client.get_token()
     except Exception as e:
         logger.error(f"Failed to get access token: {e}")
         return None
 
-def poll_and_extract_securities(job_url, access_token, client_id):
+async def poll_and_extract_securities(job_url, client):
     """Poll for completion and extract securities data"""
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'X-API-Key': client_id
-    }
-    
-    max_attempts = 40  # Increased for table extraction
-    attempt = 0
-    
     print("⏳ Waiting for enhanced table extraction to complete...")
     
-    while attempt < max_attempts:
-        try:
-            response = requests.get(job_url, headers=headers)
-            response.raise_for_status()
-            job_status = response.json()
-            
-            status = job_status.get('status')
-            print(f"📊 Status: {status} (attempt {attempt + 1}/40)")
-            
-            if status == 'done':
-                # Get download URL
-                download_url = None
-                if 'resource' in job_status and 'downloadUri' in job_status['resource']:
-                    download_url = job_status['resource']['downloadUri']
-                elif 'asset' in job_status and 'downloadUri' in job_status['asset']:
-                    download_url = job_status['asset']['downloadUri']
-                elif 'downloadUri' in job_status:
-                    download_url = job_status['downloadUri']
-                
-                if not download_url:
-                    print(f"❌ No download URL found")
-                    return None
-                
-                print("✅ Enhanced extraction completed! Downloading securities data...")
-                return download_and_process_securities(download_url)
-                
-            elif status == 'failed':
-                error_msg = job_status.get('error', 'Unknown error')
-                print(f"❌ Adobe job failed: {error_msg}")
-                return None
-            
-            time.sleep(15)  # Wait longer for table extraction
-            attempt += 1
-            
-        except Exception as e:
-            print(f"❌ Error polling job: {e}")
-            return None
+    try:
+        job_status = await client.poll(job_url)
+    except Exception as e:
+        print(f"❌ Adobe job failed: {e}")
+        return None
+    
+    # Get download URL
+    download_url = client.get_download_url(job_status)
+    if not download_url:
+        print(f"❌ No download URL found")
+        return None
     
-    print("❌ Job timed out after 10 minutes")
-    return None
+    print("✅ Enhanced extraction completed! Downloading securities data...")
+    return await download_and_process_securities(download_url, client)
 
-def download_and_process_securities(download_url):
+async def download_and_process_securities(download_url, client):
     """Download and process securities data"""
     try:
         print("📥 Downloading enhanced extraction results...")
-        response = requests.get(download_url)
-        response.raise_for_status()
         
         # Create output directory
         output_dir = "all_securities_extracted"
@@ -190,8 +122,7 @@ def download_and_process_securities(download_url):
         
         # Save and extract ZIP
         zip_path = os.path.join(output_dir, "adobe_securities_complete.zip")
-        with open(zip_path, 'wb') as f:
-            f.write(response.content)
+        await client.download(download_url, zip_path)
         
         extract_dir = os.path.join(output_dir, "extracted")
         os.makedirs(extract_dir, exist_ok=True)
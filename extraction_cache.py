@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Extraction Cache for Adobe PDF Extraction System
+Stores Adobe result ZIPs keyed on the PDF's SHA-256 and the extraction parameters,
+so repeat extractions of the same bytes never hit the network
+"""
+
+import json
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+import diskcache
+
+logger = logging.getLogger(__name__)
+
+# Block size used when hashing PDFs and copying cached ZIPs (1 MB)
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_pdf(pdf_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    Compute the SHA-256 of a PDF without reading it into memory
+
+    Args:
+        pdf_path: Path to the PDF file
+        chunk_size: Bytes read per block
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Persistent, size-bounded LRU store of Adobe extraction result ZIPs"""
+
+    def __init__(self, cache_dir: str = "cache/extractions", max_size_gb: float = 2.0):
+        """
+        Initialize extraction cache
+
+        Args:
+            cache_dir: Directory for cache storage
+            max_size_gb: Maximum cache size in GB before least-recently-used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        max_size_bytes = int(max_size_gb * 1024 * 1024 * 1024)
+        self.cache = diskcache.Cache(
+            str(self.cache_dir),
+            size_limit=max_size_bytes,
+            eviction_policy='least-recently-used'
+        )
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0
+        }
+
+    def make_key(self, pdf_path: str, operation: str, **params) -> str:
+        """
+        Build the content-addressed key for an extraction request
+
+        Args:
+            pdf_path: Path to the input PDF
+            operation: Extraction operation name (e.g. 'extract_tables')
+            **params: Extraction parameters that affect the result
+
+        Returns:
+            Cache key combining the PDF hash and normalized parameters
+        """
+        normalized = {
+            name: value.lower() if isinstance(value, str) else value
+            for name, value in params.items()
+        }
+        params_string = json.dumps({'operation': operation, 'params': normalized}, sort_keys=True)
+        params_hash = hashlib.sha256(params_string.encode()).hexdigest()[:16]
+        return f"{hash_pdf(pdf_path)}:{params_hash}"
+
+    def fetch(self, key: str, output_zip_path: str) -> bool:
+        """
+        Copy a cached result ZIP to the output path
+
+        Args:
+            key: Cache key from make_key
+            output_zip_path: Destination path for the result ZIP
+
+        Returns:
+            True on a cache hit
+        """
+        try:
+            cached_file = self.cache.get(key, read=True)
+        except Exception as e:
+            logger.error(f"Extraction cache get error: {e}")
+            cached_file = None
+
+        if cached_file is None:
+            self.stats['misses'] += 1
+            return False
+
+        with cached_file, open(output_zip_path, 'wb') as f:
+            shutil.copyfileobj(cached_file, f, HASH_CHUNK_SIZE)
+
+        self.stats['hits'] += 1
+        logger.info(f"Extraction cache hit: {output_zip_path}")
+        return True
+
+    def store(self, key: str, zip_path: str) -> bool:
+        """
+        Store a result ZIP in the cache
+
+        Args:
+            key: Cache key from make_key
+            zip_path: Path to the result ZIP
+
+        Returns:
+            True if stored successfully
+        """
+        try:
+            count_before = len(self.cache) + (0 if key in self.cache else 1)
+            with open(zip_path, 'rb') as f:
+                success = self.cache.set(key, f, read=True)
+            if success:
+                self.stats['stores'] += 1
+                self.stats['evictions'] += max(0, count_before - len(self.cache))
+            return success
+        except Exception as e:
+            logger.error(f"Extraction cache set error: {e}")
+            return False
+
+    def clear(self):
+        """Clear all cache entries"""
+        self.cache.clear()
+        logger.info("Extraction cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        cache_info = {
+            'size': len(self.cache),
+            'volume': self.cache.volume(),
+            'directory': str(self.cache_dir),
+            'hit_rate': self.get_hit_rate()
+        }
+        return {**self.stats, **cache_info}
+
+    def get_hit_rate(self) -> float:
+        """Get cache hit rate"""
+        total = self.stats['hits'] + self.stats['misses']
+        if total == 0:
+            return 0.0
+        return self.stats['hits'] / total
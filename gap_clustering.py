@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+One-Dimensional Gap Clustering for Row and Column Detection
+Sort-and-sweep replacement for DBSCAN on single coordinates, with the same
+eps / min_samples semantics and the same labels
+"""
+
+import logging
+from typing import Iterable, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def standardize(values: Union[np.ndarray, Iterable[float]]) -> np.ndarray:
+    """
+    Zero mean, unit variance scaling, as sklearn's StandardScaler
+
+    Constant inputs are only centered.
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    if len(values) == 0:
+        return values
+    scale = values.std()
+    if scale < 10 * np.finfo(float).eps:
+        scale = 1.0
+    return (values - values.mean()) / scale
+
+
+def _within(distance: np.ndarray, eps: float) -> np.ndarray:
+    """Neighbour test on squared distances, as DBSCAN's tree radius query compares them"""
+    return distance * distance <= eps * eps
+
+
+def _neighbourhoods(ordered: np.ndarray, eps: float):
+    """[low, high) range of neighbours of each sorted value"""
+    n = len(ordered)
+    low = np.searchsorted(ordered, ordered - eps, side='left')
+    high = np.searchsorted(ordered, ordered + eps, side='right')
+
+    # The shifted search keys round differently from the squared distance
+    # test; move each bound until it agrees with _within
+    while True:
+        shrink = ~_within(ordered - ordered[low], eps)
+        grow = (low > 0) & _within(ordered - ordered[np.maximum(low - 1, 0)], eps)
+        if not (shrink.any() or grow.any()):
+            break
+        low = low + shrink - grow
+    while True:
+        shrink = ~_within(ordered[high - 1] - ordered, eps)
+        grow = (high < n) & _within(ordered[np.minimum(high, n - 1)] - ordered, eps)
+        if not (shrink.any() or grow.any()):
+            break
+        high = high - shrink + grow
+    return low, high
+
+
+def gap_cluster_labels(values: Union[np.ndarray, Iterable[float]], eps: float,
+                       min_samples: int = 1) -> np.ndarray:
+    """
+    Cluster 1-D values, labelled exactly like DBSCAN(eps, min_samples)
+
+    Points with at least min_samples values (itself included) within eps are
+    core points. Sorted core points split into clusters wherever the gap to
+    the next one exceeds eps; other points within eps of a core point join
+    its cluster (the lower-numbered one if two are in reach), the rest are
+    noise (-1). Clusters are numbered in order of their first core point in
+    the input, as DBSCAN numbers them. O(n log n).
+
+    Args:
+        values: Coordinates, shape (n,) or (n, 1)
+        eps: Maximum distance between neighbours
+        min_samples: Neighbourhood size that makes a point a core point
+
+    Returns:
+        Integer label per value
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    n = len(values)
+    if n == 0:
+        return np.zeros(0, dtype=np.intp)
+
+    order = np.argsort(values, kind='stable')
+    ordered = values[order]
+
+    if min_samples <= 1:
+        core = np.ones(n, dtype=bool)
+    else:
+        low, high = _neighbourhoods(ordered, eps)
+        core = (high - low) >= min_samples
+
+    sorted_labels = np.full(n, -1, dtype=np.intp)
+    core_positions = np.flatnonzero(core)
+    if len(core_positions) == 0:
+        return sorted_labels
+
+    # Sweep: a new cluster starts wherever consecutive core points are more than eps apart
+    starts = np.concatenate(([True], ~_within(np.diff(ordered[core_positions]), eps)))
+    provisional = np.cumsum(starts) - 1
+    cluster_count = int(provisional[-1]) + 1
+
+    # Renumber clusters by their lowest input index among core points
+    first_index = np.full(cluster_count, n, dtype=np.intp)
+    np.minimum.at(first_index, provisional, order[core_positions])
+    renumber = np.empty(cluster_count, dtype=np.intp)
+    renumber[np.argsort(first_index, kind='stable')] = np.arange(cluster_count)
+    sorted_labels[core_positions] = renumber[provisional]
+
+    # Border points take the lower label of the nearest core point on either side
+    border = np.flatnonzero(~core)
+    if len(border):
+        right = np.searchsorted(core_positions, border)
+        left = right - 1
+        has_left = left >= 0
+        has_right = right < len(core_positions)
+        left_core = core_positions[np.where(has_left, left, 0)]
+        right_core = core_positions[np.where(has_right, right, 0)]
+
+        sentinel = np.iinfo(np.intp).max
+        left_label = np.where(has_left & _within(ordered[border] - ordered[left_core], eps),
+                              sorted_labels[left_core], sentinel)
+        right_label = np.where(has_right & _within(ordered[right_core] - ordered[border], eps),
+                               sorted_labels[right_core], sentinel)
+        border_label = np.minimum(left_label, right_label)
+        sorted_labels[border] = np.where(border_label == sentinel, -1, border_label)
+
+    labels = np.empty(n, dtype=np.intp)
+    labels[order] = sorted_labels
+    return labels
+
+
+class GapClustering:
+    """
+    Drop-in for DBSCAN on one feature
+
+    Usage mirrors scikit-learn: GapClustering(eps=8.0).fit(y).labels_
+    """
+
+    def __init__(self, eps: float = 0.5, min_samples: int = 1):
+        self.eps = eps
+        self.min_samples = min_samples
+        self.labels_ = np.zeros(0, dtype=np.intp)
+
+    def fit(self, values: Union[np.ndarray, Iterable[float]]) -> 'GapClustering':
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 2 and values.shape[1] != 1:
+            raise ValueError(f"GapClustering expects one feature, got shape {values.shape}")
+        self.labels_ = gap_cluster_labels(values, self.eps, self.min_samples)
+        return self
+
+
+if __name__ == "__main__":
+    # Benchmark against DBSCAN on statement-like row coordinates
+    import time
+
+    rng = np.random.default_rng(0)
+    print(f"{'elements':>10} {'gap (ms)':>10} {'DBSCAN (ms)':>12}  labels equal")
+    for size in (100, 1000, 10000, 100000):
+        y = np.repeat(np.arange(size // 8) * 12.0, 8) + rng.uniform(-1.5, 1.5, size // 8 * 8)
+
+        start = time.perf_counter()
+        labels = gap_cluster_labels(y, eps=8.0)
+        gap_ms = (time.perf_counter() - start) * 1000
+
+        try:
+            from sklearn.cluster import DBSCAN
+        except ImportError:
+            print(f"{len(y):>10} {gap_ms:>10.2f} {'n/a':>12}")
+            continue
+        start = time.perf_counter()
+        expected = DBSCAN(eps=8.0, min_samples=1).fit(y.reshape(-1, 1)).labels_
+        dbscan_ms = (time.perf_counter() - start) * 1000
+        print(f"{len(y):>10} {gap_ms:>10.2f} {dbscan_ms:>12.2f}  {np.array_equal(labels, expected)}")
@@ -6,8 +6,11 @@ Combines the best of both services for optimal table extraction accuracy
 
 import os
 import json
+import asyncio
+import aiohttp
 import pandas as pd
 import requests
+import threading
 import time
 import logging
 from typing import Dict, Any, List, Optional, Tuple
@@ -20,8 +23,10 @@ try:
     from pdf_extractor import PDFExtractor
     from advanced_pdf_extractor import AdvancedPDFExtractor
     from performance_monitor import monitor_performance
-    from exceptions import OCRError, ProcessingError
+    from exceptions import OCRError, ProcessingError, APITimeoutError
     from retry_handler import with_retry
+    from job_poller import JobPoller, PollPolicy, parse_retry_after
+    from result_archive import result_exists, load_structured_data
 except ImportError:
     logging.warning("Some modules not available")
 
@@ -76,6 +81,34 @@ class HybridOCRProcessor:
             'hybrid_used': 0,
             'total_processed': 0
         }
+        
+        # Azure status polling: one poller, HTTP session and event loop shared by every call
+        self.azure_poller = JobPoller(PollPolicy(initial_interval=1.0, max_interval=10.0),
+                                      done_states=('succeeded',), failed_states=('failed',))
+        self._azure_session: Optional[aiohttp.ClientSession] = None
+        self._poll_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_lock = threading.Lock()
+    
+    def close(self):
+        """Close the Azure polling session and stop its event loop"""
+        with self._poll_lock:
+            loop, thread = self._poll_loop, self._poll_thread
+            self._poll_loop = self._poll_thread = None
+        if loop is None:
+            return
+        if self._azure_session is not None:
+            asyncio.run_coroutine_threadsafe(self._azure_session.close(), loop).result()
+            self._azure_session = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     @monitor_performance(cache_ttl=3600)
     def extract_tables_optimal(self, pdf_path: str, 
@@ -294,25 +327,44 @@ class HybridOCRProcessor:
     
     def _poll_azure_results(self, operation_location: str, timeout: int = 120) -> Dict[str, Any]:
         """Poll Azure for results with timeout"""
-        headers = {"Ocp-Apim-Subscription-Key": self.azure_api_key}
-        start_time = time.time()
+        waiter = asyncio.run_coroutine_threadsafe(
+            self._wait_for_azure_operation(operation_location, timeout), self._get_poll_loop()
+        )
+        try:
+            result = waiter.result()
+        except APITimeoutError:
+            return {"success": False, "error": "Timeout waiting for Azure results"}
+        
+        if result["status"] == "succeeded":
+            return self._parse_azure_results(result)
+        return {
+            "success": False,
+            "error": result.get("error", {}).get("message", "Azure processing failed")
+        }
+    
+    def _get_poll_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop running the shared poller, started on first use"""
+        with self._poll_lock:
+            if self._poll_loop is None:
+                self._poll_loop = asyncio.new_event_loop()
+                self._poll_thread = threading.Thread(target=self._poll_loop.run_forever,
+                                                     name="azure_poller", daemon=True)
+                self._poll_thread.start()
+            return self._poll_loop
+    
+    async def _wait_for_azure_operation(self, operation_location: str, timeout: int) -> Dict[str, Any]:
+        """Wait for an Azure analyze operation, honouring its Retry-After hints"""
+        return await self.azure_poller.wait(operation_location, self._fetch_azure_status, timeout=timeout)
+    
+    async def _fetch_azure_status(self, url: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Fetch an Azure operation status over the shared session"""
+        if self._azure_session is None:
+            self._azure_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
         
-        while time.time() - start_time < timeout:
-            response = requests.get(operation_location, headers=headers)
+        headers = {"Ocp-Apim-Subscription-Key": self.azure_api_key}
+        async with self._azure_session.get(url, headers=headers) as response:
             response.raise_for_status()
-            result = response.json()
-            
-            if result["status"] == "succeeded":
-                return self._parse_azure_results(result)
-            elif result["status"] == "failed":
-                return {
-                    "success": False,
-                    "error": result.get("error", {}).get("message", "Azure processing failed")
-                }
-            
-            time.sleep(2)  # Wait before next poll
-        
-        return {"success": False, "error": "Timeout waiting for Azure results"}
+            return await response.json(), parse_retry_after(response.headers.get('Retry-After'))
     
     def _parse_azure_results(self, azure_result: Dict[str, Any]) -> Dict[str, Any]:
         """Parse Azure Document Intelligence results"""
@@ -371,9 +423,8 @@ class HybridOCRProcessor:
             try:
                 # Load structured data
                 json_path = extracted_files['json']
-                if os.path.exists(json_path):
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        structured_data = json.load(f)
+                if result_exists(json_path):
+                    structured_data = load_structured_data(json_path)
                     
                     # Extract table information from elements
                     # This is a simplified implementation - you might need to adapt
@@ -547,8 +598,8 @@ def extract_tables_best_quality(pdf_path: str,
     """
     Convenience function to extract tables with best available quality
     """
-    processor = create_hybrid_processor(adobe_credentials_path, azure_endpoint, azure_api_key)
-    return processor.extract_tables_optimal(pdf_path, strategy="auto")
+    with create_hybrid_processor(adobe_credentials_path, azure_endpoint, azure_api_key) as processor:
+        return processor.extract_tables_optimal(pdf_path, strategy="auto")
 
 
 if __name__ == "__main__":
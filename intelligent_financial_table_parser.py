@@ -17,16 +17,119 @@ import json
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict, List, Tuple, Optional, Any
+import time
+from typing import Dict, List, Tuple, Optional, Any, Iterable, Iterator, Union
 from dataclasses import dataclass, field
-from collections import defaultdict
-from sklearn.cluster import DBSCAN
-from sklearn.preprocessing import StandardScaler
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import chain, islice
 import logging
 
+from result_archive import result_exists
+from structured_data_reader import StructuredDataReader
+from element_table import ElementTable
+from gap_clustering import gap_cluster_labels, standardize
+from token_classifier import TokenFlag, TokenInfo, classify_token, token_flags
+from keyword_matcher import KeywordMatcher
+from exceptions import ProcessingError
+from page_cache import PageCachedDetector, PageResultCache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keyword dictionaries for security name, header and table type recognition
+SECURITY_KEYWORDS = [
+    'notes', 'bonds', 'fund', 'equity', 'structured', 'treasury',
+    'corporate', 'government', 'municipal', 'convertible'
+]
+ISSUER_SUFFIXES = ['bank', 'capital', 'group', 'corp', 'ltd', 'inc', 'ag', 'sa']
+INSTRUMENT_WORDS = ['note', 'notes', 'bond', 'bonds', 'fund', 'equity', 'structured']
+HEADER_LABELS = ['name', 'isin', 'quantity', 'value', 'price', 'performance']
+
+# Header keywords per column type, in order of precedence
+COLUMN_KEYWORDS = {
+    'name': ['name', 'security', 'instrument'],
+    'isin': ['isin'],
+    'quantity': ['quantity', 'amount', 'nominal'],
+    'market_value': ['value', 'market'],
+    'price': ['price'],
+    'performance': ['performance', 'return', '%'],
+    'currency': ['currency', 'curr'],
+    'maturity': ['maturity', 'expiry']
+}
+
+TABLE_TYPE_KEYWORDS = {
+    'securities_table': ['notes', 'bonds', 'fund', 'equity', 'structured'],
+    'portfolio_summary': ['total', 'portfolio', 'allocation'],
+    'performance_table': ['performance', 'ytd', 'return']
+}
+
+# Multilingual keywords of UniversalFormatHandler
+LANGUAGE_PATTERNS = {
+    'english': {
+        'security_keywords': ['notes', 'bonds', 'fund', 'equity', 'treasury'],
+        'column_headers': ['name', 'quantity', 'value', 'price', 'performance'],
+        'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
+    },
+    'german': {
+        'security_keywords': ['anleihen', 'fonds', 'aktien', 'strukturiert'],
+        'column_headers': ['name', 'menge', 'wert', 'preis', 'performance'],
+        'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
+    },
+    'french': {
+        'security_keywords': ['obligations', 'fonds', 'actions', 'structuré'],
+        'column_headers': ['nom', 'quantité', 'valeur', 'prix', 'performance'],
+        'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
+    }
+}
+
+DATE_IN_TEXT = re.compile(r'\d{2,4}[-\.]\d{2}[-\.]\d{2,4}')
+PERCENTAGE_IN_TEXT = re.compile(r'\d+\.?\d*%')
+
+
+def financial_keyword_matcher(security_keywords: Iterable[str] = SECURITY_KEYWORDS,
+                              language_patterns: Optional[Dict[str, Dict[str, List[str]]]] = None) -> KeywordMatcher:
+    """
+    Matcher over all keyword dictionaries, built once per distinct keyword set
+
+    Categories are 'security', 'issuer' and 'instrument' (the latter two
+    whole words only), 'header', 'column:<type>', 'table:<type>' and
+    '<language>:<group>' for the language patterns of UniversalFormatHandler.
+
+    Args:
+        security_keywords: Security name keywords; defaults to SECURITY_KEYWORDS
+        language_patterns: Keyword groups per language; defaults to LANGUAGE_PATTERNS
+    """
+    if language_patterns is None:
+        language_patterns = LANGUAGE_PATTERNS
+    return _build_keyword_matcher(
+        tuple(security_keywords),
+        tuple((language, tuple((group, tuple(keywords)) for group, keywords in groups.items()))
+              for language, groups in language_patterns.items())
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_keyword_matcher(security_keywords: Tuple[str, ...],
+                           language_patterns: Tuple[Tuple[str, Tuple[Tuple[str, Tuple[str, ...]], ...]], ...]
+                           ) -> KeywordMatcher:
+    """Build the matcher for one hashable keyword set"""
+    dictionaries = {
+        'security': security_keywords,
+        'issuer': ISSUER_SUFFIXES,
+        'instrument': INSTRUMENT_WORDS,
+        'header': HEADER_LABELS
+    }
+    dictionaries.update((f'column:{column}', keywords) for column, keywords in COLUMN_KEYWORDS.items())
+    dictionaries.update((f'table:{table}', keywords) for table, keywords in TABLE_TYPE_KEYWORDS.items())
+    for language, groups in language_patterns:
+        dictionaries.update((f'{language}:{group}', keywords) for group, keywords in groups)
+
+    return KeywordMatcher(dictionaries, whole_word=['issuer', 'instrument'])
+
+
 @dataclass
 class TextElement:
     """Represents a single text element from Adobe's extraction"""
@@ -47,6 +150,7 @@ class TableCell:
     data_type: str  # 'text', 'number', 'currency', 'percentage', 'date', 'isin'
     confidence: float
     original_element: TextElement
+    token: Optional[TokenInfo] = field(default=None, compare=False, repr=False)  # Classification of the stripped text
 
 @dataclass
 class SecurityRecord:
@@ -64,13 +168,48 @@ class SecurityRecord:
     source_row: int = -1
     validation_flags: List[str] = field(default_factory=list)
 
-class LayoutDetectionEngine:
+@dataclass
+class DocumentParseResult:
+    """Outcome of parsing one document with parse_many"""
+    path: str
+    success: bool
+    results: Optional[Dict[str, Any]] = None  # parse_financial_document output
+    error_message: Optional[str] = None
+    error_type: Optional[str] = None
+    processing_time: float = 0.0  # Seconds spent parsing, excluding time queued
+    worker_pid: int = 0
+
+class LayoutDetectionEngine(PageCachedDetector):
     """Detects table structures and layouts automatically"""
     
-    def __init__(self):
+    # Settings that change page results; shipped to executor workers
+    PARAMETER_NAMES = ('min_table_elements', 'clustering_eps', 'min_samples')
+    
+    def __init__(self, parallel_mode: str = 'serial', max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None, cache_size: int = 128):
+        """
+        Initialize the engine
+        
+        Args:
+            parallel_mode: 'serial', 'thread' or 'process'; pools are created
+                on first use and reused until close()
+            max_workers: Pool size (CPU count if None)
+            executor: Executor to detect pages on instead of an own pool; the
+                caller keeps ownership of it
+            cache_size: Number of page results kept in the page cache
+        """
+        if parallel_mode not in ('serial', 'thread', 'process'):
+            raise ValueError(f"parallel_mode must be 'serial', 'thread' or 'process', got {parallel_mode!r}")
+        self.parallel_mode = parallel_mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = executor
+        self.page_cache = PageResultCache(cache_size)
+        self._pool: Optional[Executor] = None
+        
         self.min_table_elements = 6
         self.clustering_eps = 15.0  # Pixel distance for clustering
         self.min_samples = 2
+        self.keyword_matcher = financial_keyword_matcher()
     
     def detect_table_structure(self, elements: List[TextElement]) -> List[Dict]:
         """Detect table structures using coordinate clustering"""
@@ -83,18 +222,79 @@ class LayoutDetectionEngine:
             if self.is_table_element(element):
                 pages[element.page].append(element)
         
-        all_tables = []
+        # Pages seen before, in this or another document, are rebuilt from the cache
+        tables_by_page, pending = self._lookup_pages(pages.items())
         
-        for page_num, page_elements in pages.items():
-            logger.info(f"📄 Analyzing page {page_num} with {len(page_elements)} elements")
-            
-            # Detect tables on this page
-            page_tables = self.detect_page_tables(page_elements, page_num)
-            all_tables.extend(page_tables)
+        executor = self._get_executor() if len(pending) > 1 else None
+        
+        if executor is None:
+            for page_num, key, page_elements in pending:
+                logger.info(f"📄 Analyzing page {page_num} with {len(page_elements)} elements")
+                page_tables = self.detect_page_tables(page_elements, page_num)
+                self._cache_page(key, page_elements, page_tables)
+                tables_by_page[page_num] = page_tables
+        else:
+            logger.info(f"📄 Analyzing {len(pending)} pages in parallel")
+            for batch, future in self._submit_page_batches(executor, _detect_layout_pages, pending):
+                self._store_page_batch(batch, future.result(), tables_by_page)
+        
+        all_tables = [table for page_num in pages for table in tables_by_page[page_num]]
         
         logger.info(f"📊 Detected {len(all_tables)} tables total")
         return all_tables
     
+    def _get_executor(self) -> Optional[Executor]:
+        """Executor for page detection, or None to detect pages in this thread"""
+        if self.executor is not None:
+            return self.executor
+        if self.parallel_mode == 'serial':
+            return None
+        if self._pool is None:
+            pool_class = ProcessPoolExecutor if self.parallel_mode == 'process' else ThreadPoolExecutor
+            self._pool = pool_class(max_workers=self.max_workers)
+        return self._pool
+    
+    def _page_content(self, elements: List[TextElement]) -> Iterable[bytes]:
+        """Texts and bounds of a page's elements"""
+        yield '\0'.join(f"{element.text}\1{element.bounds!r}" for element in elements).encode('utf-8')
+    
+    def _page_payload(self, page_num: int, elements: List[TextElement]) -> tuple:
+        """Page number with each element's text and bounds"""
+        return page_num, [(element.text, element.bounds) for element in elements]
+    
+    def _page_from_payload(self, payload: tuple) -> Tuple[int, List[TextElement]]:
+        page_num, texts_and_bounds = payload
+        return page_num, [TextElement(text=text, page=page_num, bounds=bounds, font_size=0.0, path='')
+                          for text, bounds in texts_and_bounds]
+    
+    def _detect_page(self, page_num: int, elements: List[TextElement]) -> List[Dict]:
+        return self.detect_page_tables(elements, page_num)
+    
+    @staticmethod
+    def _table_to_record(table: Dict, elements: List[TextElement]) -> tuple:
+        """Store a table by element index, with each cell's row, column and classification"""
+        positions = {id(element): i for i, element in enumerate(elements)}
+        cells = tuple((positions[id(cell.original_element)], cell.row, cell.column, cell.data_type, cell.token)
+                      for cell in table['cells'])
+        return cells, table['num_rows'], table['num_columns'], table['table_type']
+    
+    @staticmethod
+    def _table_from_record(record: tuple, elements: List[TextElement], page_num: int) -> Dict:
+        """Rebuild a cached table against this document's elements"""
+        cells, num_rows, num_columns, table_type = record
+        return {
+            'page': page_num,
+            'cells': [
+                TableCell(text=elements[index].text, row=row, column=column, bounds=elements[index].bounds,
+                          data_type=data_type, confidence=elements[index].confidence,
+                          original_element=elements[index], token=token)
+                for index, row, column, data_type, token in cells
+            ],
+            'num_rows': num_rows,
+            'num_columns': num_columns,
+            'table_type': table_type
+        }
+    
     def is_table_element(self, element: TextElement) -> bool:
         """Check if element is likely part of a table"""
         
@@ -119,17 +319,14 @@ class LayoutDetectionEngine:
             return []
         
         # Cluster by Y-coordinates to find rows
-        y_coords = [[coord[1]] for coord in coordinates]  # Y1 coordinates
-        
-        scaler = StandardScaler()
-        y_scaled = scaler.fit_transform(y_coords)
+        y_scaled = standardize([coord[1] for coord in coordinates])  # Y1 coordinates
         
-        # Use DBSCAN to cluster rows
-        clustering = DBSCAN(eps=0.3, min_samples=self.min_samples).fit(y_scaled)
+        # Gap clustering on standardized Y, with DBSCAN's eps/min_samples semantics
+        row_labels = gap_cluster_labels(y_scaled, eps=0.3, min_samples=self.min_samples)
         
         # Group elements by row clusters
         row_clusters = defaultdict(list)
-        for i, label in enumerate(clustering.labels_):
+        for i, label in enumerate(row_labels.tolist()):
             if label != -1:  # Ignore noise
                 row_clusters[label].append((elements[i], coordinates[i]))
         
@@ -163,17 +360,13 @@ class LayoutDetectionEngine:
         if len(set(all_x_coords)) < 2:
             return None
         
-        x_coords_array = np.array(all_x_coords).reshape(-1, 1)
-        scaler = StandardScaler()
-        x_scaled = scaler.fit_transform(x_coords_array)
-        
-        col_clustering = DBSCAN(eps=0.4, min_samples=1).fit(x_scaled)
+        col_labels = gap_cluster_labels(standardize(all_x_coords), eps=0.4).tolist()
         
         # Map X-coordinates to column indices
-        unique_labels = sorted(set(col_clustering.labels_))
+        unique_labels = sorted(set(col_labels))
         x_to_col = {}
         
-        for i, label in enumerate(col_clustering.labels_):
+        for i, label in enumerate(col_labels):
             if label in unique_labels:
                 col_index = unique_labels.index(label)
                 x_to_col[all_x_coords[i]] = col_index
@@ -183,15 +376,17 @@ class LayoutDetectionEngine:
         for row_idx, (avg_y, cluster_elements) in enumerate(sorted_rows):
             for element, coord in cluster_elements:
                 col_idx = x_to_col.get(coord[0], 0)
+                token = classify_token(element.text.strip())
                 
                 cell = TableCell(
                     text=element.text,
                     row=row_idx,
                     column=col_idx,
                     bounds=element.bounds,
-                    data_type=self.classify_data_type(element.text),
+                    data_type=token.kind,
                     confidence=element.confidence,
-                    original_element=element
+                    original_element=element,
+                    token=token
                 )
                 table_cells.append(cell)
         
@@ -206,53 +401,27 @@ class LayoutDetectionEngine:
     def classify_data_type(self, text: str) -> str:
         """Classify the type of data in a text element"""
         
-        text = text.strip()
-        
-        # ISIN pattern
-        if re.match(r'^[A-Z]{2}\d{10}$', text):
-            return 'isin'
-        
-        # Currency amount
-        if re.match(r'^\d{1,3}(?:,\d{3})*(?:\.\d{2})?$', text.replace("'", ",")):
-            return 'currency'
-        
-        # Percentage
-        if re.match(r'^-?\d+\.\d+%$', text):
-            return 'percentage'
-        
-        # Date
-        if re.match(r'^\d{2}\.\d{2}\.\d{4}$', text):
-            return 'date'
-        
-        # Price (decimal number)
-        if re.match(r'^\d+\.\d{2,6}$', text):
-            return 'price'
-        
-        # Large number (quantity)
-        if re.match(r'^\d{1,3}(?:[,\']\d{3})*(?:\.\d+)?$', text):
-            return 'quantity'
-        
-        # Default to text
-        return 'text'
+        # ISIN, currency amount, percentage, date, price, quantity, in that
+        # order of precedence, otherwise text
+        return classify_token(text.strip()).kind
     
     def classify_table_type(self, cells: List[TableCell]) -> str:
         """Classify the type of table based on content"""
         
         data_types = [cell.data_type for cell in cells]
         text_content = ' '.join([cell.text.lower() for cell in cells])
+        keywords = self.keyword_matcher.match(text_content)
         
         # Securities table indicators
-        if 'isin' in data_types and any(keyword in text_content for keyword in 
-                                       ['notes', 'bonds', 'fund', 'equity', 'structured']):
+        if 'isin' in data_types and 'table:securities_table' in keywords:
             return 'securities_table'
         
         # Portfolio summary
-        if any(keyword in text_content for keyword in ['total', 'portfolio', 'allocation']):
+        if 'table:portfolio_summary' in keywords:
             return 'portfolio_summary'
         
         # Performance table
-        if 'percentage' in data_types and any(keyword in text_content for keyword in 
-                                            ['performance', 'ytd', 'return']):
+        if 'percentage' in data_types and 'table:performance_table' in keywords:
             return 'performance_table'
         
         return 'unknown'
@@ -261,13 +430,35 @@ class LayoutDetectionEngine:
 class PatternRecognitionBrain:
     """Advanced pattern recognition for financial data"""
     
+    # Token classifier flag equivalent to each default anchored financial
+    # pattern; an edited pattern is matched with re instead
+    PATTERN_FLAGS = {
+        'isin': (r'^[A-Z]{2}\d{10}$', TokenFlag.ISIN),
+        'valorn': (r'^\d{6,12}$', TokenFlag.VALOR),
+        'currency_amount': (r'^\d{1,3}(?:[,\']\d{3})*(?:\.\d{2})?$', TokenFlag.AMOUNT),
+        'percentage': (r'^-?\d+\.\d+%$', TokenFlag.PERCENTAGE),
+        'price': (r'^\d+\.\d{2,6}$', TokenFlag.PRICE),
+        'date_european': (r'^\d{2}\.\d{2}\.\d{4}$', TokenFlag.DATE),
+        'date_american': (r'^\d{2}/\d{2}/\d{4}$', TokenFlag.DATE_US),
+        'maturity': (r'^\d{2}\.\d{2}\.\d{2,4}$', TokenFlag.MATURITY),
+        'quantity': (r'^\d{1,3}(?:[,\']\d{3})*(?:\.\d+)?$', TokenFlag.QUANTITY)
+    }
+    
     def __init__(self):
         self.financial_patterns = self.load_financial_patterns()
         self.currency_symbols = ['USD', 'EUR', 'CHF', 'GBP', 'JPY']
-        self.security_keywords = [
-            'notes', 'bonds', 'fund', 'equity', 'structured', 'treasury',
-            'corporate', 'government', 'municipal', 'convertible'
-        ]
+        self.security_keywords = list(SECURITY_KEYWORDS)
+        self._matcher: Optional[KeywordMatcher] = None
+        self._matcher_keywords: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """Keyword matcher reflecting this instance's security_keywords, rebuilt only when they change"""
+        keywords = tuple(self.security_keywords)
+        if keywords != self._matcher_keywords:
+            self._matcher = financial_keyword_matcher(keywords)
+            self._matcher_keywords = keywords
+        return self._matcher
     
     def load_financial_patterns(self) -> Dict:
         """Load comprehensive financial data patterns"""
@@ -287,16 +478,15 @@ class PatternRecognitionBrain:
     def recognize_security_name(self, text: str) -> Tuple[bool, float]:
         """Recognize if text is a security name with confidence score"""
         
-        text_lower = text.lower()
-        
-        # Check for security keywords
-        keyword_matches = sum(1 for keyword in self.security_keywords if keyword in text_lower)
+        # Security keywords, issuer suffixes and instrument words in one scan
+        keywords = self.keyword_matcher.match(text)
+        keyword_matches = len(keywords.get('security', ()))
         
         # Check for typical security name patterns
-        has_issuer = bool(re.search(r'\b(bank|capital|group|corp|ltd|inc|ag|sa)\b', text_lower))
-        has_instrument = bool(re.search(r'\b(notes?|bonds?|fund|equity|structured)\b', text_lower))
-        has_date = bool(re.search(r'\d{2,4}[-\.]\d{2}[-\.]\d{2,4}', text))
-        has_percentage = bool(re.search(r'\d+\.?\d*%', text))
+        has_issuer = 'issuer' in keywords
+        has_instrument = 'instrument' in keywords
+        has_date = bool(DATE_IN_TEXT.search(text))
+        has_percentage = bool(PERCENTAGE_IN_TEXT.search(text))
         
         # Calculate confidence
         confidence = 0.0
@@ -323,8 +513,17 @@ class PatternRecognitionBrain:
         
         extracted = {}
         
+        # The patterns are anchored, so each matches the whole text (less a
+        # trailing newline, as $ allows) or nothing
+        token = text[:-1] if text.endswith('\n') else text
+        flags = token_flags(token)
+        
         for pattern_name, pattern in self.financial_patterns.items():
-            matches = re.findall(pattern, text)
+            default_pattern, flag = self.PATTERN_FLAGS.get(pattern_name, (None, None))
+            if pattern != default_pattern:
+                matches = re.findall(pattern, text)
+            else:
+                matches = [token] if flags & flag else []
             if matches:
                 extracted[pattern_name] = matches
         
@@ -404,9 +603,7 @@ class SmartAssociationEngine:
             header_indicators = 0
             
             for cell in row_cells:
-                text_lower = cell.text.lower()
-                if any(header in text_lower for header in 
-                      ['name', 'isin', 'quantity', 'value', 'price', 'performance']):
+                if 'header' in self.pattern_brain.keyword_matcher.match(cell.text):
                     header_indicators += 1
             
             # If more than half the cells look like headers
@@ -421,27 +618,23 @@ class SmartAssociationEngine:
         column_mapping = {}
         
         for cell in header_cells:
-            text_lower = cell.text.lower()
+            keywords = self.pattern_brain.keyword_matcher.match(cell.text)
             
-            if any(keyword in text_lower for keyword in ['name', 'security', 'instrument']):
-                column_mapping[cell.column] = 'name'
-            elif 'isin' in text_lower:
-                column_mapping[cell.column] = 'isin'
-            elif any(keyword in text_lower for keyword in ['quantity', 'amount', 'nominal']):
-                column_mapping[cell.column] = 'quantity'
-            elif any(keyword in text_lower for keyword in ['value', 'market']):
-                column_mapping[cell.column] = 'market_value'
-            elif 'price' in text_lower:
-                column_mapping[cell.column] = 'price'
-            elif any(keyword in text_lower for keyword in ['performance', 'return', '%']):
-                column_mapping[cell.column] = 'performance'
-            elif any(keyword in text_lower for keyword in ['currency', 'curr']):
-                column_mapping[cell.column] = 'currency'
-            elif any(keyword in text_lower for keyword in ['maturity', 'expiry']):
-                column_mapping[cell.column] = 'maturity'
+            # First column type, in order of precedence, with a keyword in the header
+            for column_type in COLUMN_KEYWORDS:
+                if f'column:{column_type}' in keywords:
+                    column_mapping[cell.column] = column_type
+                    break
         
         return column_mapping
     
+    def classify_cell(self, cell: TableCell) -> TokenInfo:
+        """Token classification of a cell, computed once and cached on the cell"""
+        
+        if cell.token is None:
+            cell.token = classify_token(cell.text.strip())
+        return cell.token
+    
     def find_security_in_row(self, row_cells: List[TableCell]) -> Optional[TableCell]:
         """Find the cell containing the security name in a row"""
         
@@ -449,6 +642,11 @@ class SmartAssociationEngine:
         best_confidence = 0.0
         
         for cell in row_cells:
+            # ISINs, amounts, percentages and dates score at most 0.3, below
+            # the 0.4 a security name needs
+            if self.classify_cell(cell).kind != 'text':
+                continue
+            
             is_security, confidence = self.pattern_brain.recognize_security_name(cell.text)
             
             if is_security and confidence > best_confidence:
@@ -466,51 +664,51 @@ class SmartAssociationEngine:
             source_row=security_cell.row
         )
 
-        # Extract all text from the row for analysis
-        row_text = ' '.join([cell.text for cell in row_cells])
-
-        # Use pattern recognition to extract financial data
-        financial_data = self.pattern_brain.extract_financial_data(row_text)
-
-        # Map extracted data to security fields
-        if 'isin' in financial_data and financial_data['isin']:
-            security.isin = financial_data['isin'][0]
+        # One pass over the row: currency symbols anywhere in the row, the
+        # first in currency_symbols order wins
+        currency_symbols = self.pattern_brain.currency_symbols
+        currency_rank = len(currency_symbols)
 
-        if 'currency' in financial_data and financial_data['currency']:
-            security.currency = financial_data['currency'][0]
-
-        # Extract quantities and values from cells
         for cell in row_cells:
-            if cell == security_cell:
+            for rank, symbol in enumerate(currency_symbols[:currency_rank]):
+                if symbol in cell.text:
+                    currency_rank = rank
+                    break
+
+            if cell is security_cell:
                 continue
 
             cell_text = cell.text.strip()
+            flags = self.classify_cell(cell).flags
 
             # Look for quantities (like 100'000, 200'000)
-            if re.match(r"^\d{1,3}(?:'?\d{3})*(?:\.\d+)?$", cell_text):
+            if flags & TokenFlag.LOOSE_QUANTITY:
                 if not security.quantity:
                     security.quantity = cell_text
                 elif not security.market_value:
                     security.market_value = cell_text
 
             # Look for prices (decimal numbers)
-            elif re.match(r'^\d+\.\d{2,6}$', cell_text):
+            elif flags & TokenFlag.PRICE:
                 if not security.price:
                     security.price = cell_text
 
             # Look for percentages
-            elif re.match(r'^-?\d+\.\d+%$', cell_text):
+            elif flags & TokenFlag.PERCENTAGE:
                 if not security.performance:
                     security.performance = cell_text
 
             # Look for ISIN codes
-            elif re.match(r'^[A-Z]{2}\d{10}$', cell_text):
+            elif flags & TokenFlag.ISIN:
                 security.isin = cell_text
 
             # Look for dates (maturity)
-            elif re.match(r'^\d{2}\.\d{2}\.\d{4}$', cell_text):
+            elif flags & TokenFlag.DATE:
                 security.maturity = cell_text
 
+        if currency_rank < len(currency_symbols):
+            security.currency = currency_symbols[currency_rank]
+
         # Calculate confidence score
         security.confidence_score = self.calculate_confidence_score(security)
 
@@ -560,7 +758,7 @@ class SmartAssociationEngine:
         flags = []
         
         # Check ISIN format
-        if security.isin and not re.match(r'^[A-Z]{2}\d{10}$', security.isin):
+        if security.isin and not token_flags(security.isin) & TokenFlag.ISIN:
             flags.append('invalid_isin_format')
         
         # Check if quantity and market value are reasonable
@@ -598,10 +796,11 @@ class ValidationConfidenceSystem:
         return {
             'required_fields': ['name'],
             'recommended_fields': ['isin', 'quantity', 'market_value'],
+            # Keyed by SecurityRecord field
             'format_validations': {
                 'isin': r'^[A-Z]{2}\d{10}$',
-                'percentage': r'^-?\d+\.\d+%?$',
-                'currency': r'^\d{1,3}(?:[,\']\d{3})*(?:\.\d{2})?$'
+                'performance': r'^-?\d+\.\d+%?$',
+                'currency': r'^[A-Z]{3}$'
             },
             'business_rules': {
                 'max_performance_change': 200.0,  # 200% max change
@@ -671,9 +870,9 @@ class ValidationConfidenceSystem:
             if not getattr(security, field):
                 return False
         
-        # Format validations
+        # Format validations; rules for fields a record does not have are skipped
         for field, pattern in self.validation_rules['format_validations'].items():
-            value = getattr(security, field)
+            value = getattr(security, field, None)
             if value and not re.match(pattern, value):
                 return False
         
@@ -695,6 +894,17 @@ class UniversalFormatHandler:
     def __init__(self):
         self.format_patterns = self.load_format_patterns()
         self.language_patterns = self.load_language_patterns()
+        self._matcher: Optional[KeywordMatcher] = None
+        self._matcher_patterns: Optional[Dict[str, Dict[str, List[str]]]] = None
+    
+    @property
+    def keyword_matcher(self) -> KeywordMatcher:
+        """Keyword matcher reflecting this instance's language_patterns, rebuilt only when they change"""
+        if self.language_patterns != self._matcher_patterns:
+            self._matcher = financial_keyword_matcher(language_patterns=self.language_patterns)
+            self._matcher_patterns = {language: {group: list(keywords) for group, keywords in groups.items()}
+                                      for language, groups in self.language_patterns.items()}
+        return self._matcher
     
     def load_format_patterns(self) -> Dict:
         """Load patterns for different document formats"""
@@ -726,23 +936,8 @@ class UniversalFormatHandler:
     def load_language_patterns(self) -> Dict:
         """Load language-specific patterns"""
         
-        return {
-            'english': {
-                'security_keywords': ['notes', 'bonds', 'fund', 'equity', 'treasury'],
-                'column_headers': ['name', 'quantity', 'value', 'price', 'performance'],
-                'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
-            },
-            'german': {
-                'security_keywords': ['anleihen', 'fonds', 'aktien', 'strukturiert'],
-                'column_headers': ['name', 'menge', 'wert', 'preis', 'performance'],
-                'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
-            },
-            'french': {
-                'security_keywords': ['obligations', 'fonds', 'actions', 'structuré'],
-                'column_headers': ['nom', 'quantité', 'valeur', 'prix', 'performance'],
-                'currency_keywords': ['usd', 'eur', 'chf', 'gbp']
-            }
-        }
+        return {language: {group: list(keywords) for group, keywords in groups.items()}
+                for language, groups in LANGUAGE_PATTERNS.items()}
     
     def detect_document_format(self, elements: List[TextElement]) -> str:
         """Detect the document format based on content patterns"""
@@ -764,12 +959,11 @@ class UniversalFormatHandler:
         """Detect document language"""
         
         text_content = ' '.join([elem.text.lower() for elem in elements[:50]])
+        keywords = self.keyword_matcher.match(text_content)
         
         # Simple language detection based on keywords
-        for language, patterns in self.language_patterns.items():
-            keyword_matches = sum(1 for keyword in patterns['security_keywords'] 
-                                if keyword in text_content)
-            if keyword_matches >= 2:
+        for language in self.language_patterns:
+            if len(keywords.get(f'{language}:security_keywords', ())) >= 2:
                 return language
         
         return 'english'  # Default
@@ -778,6 +972,16 @@ class UniversalFormatHandler:
 class IntelligentFinancialTableParser:
     """Main orchestrator class that combines all components"""
     
+    # Component settings that change parse results; copied into parse_many workers
+    WORKER_SETTINGS = {
+        'layout_engine': LayoutDetectionEngine.PARAMETER_NAMES,
+        'pattern_brain': ('financial_patterns', 'currency_symbols', 'security_keywords'),
+        'association_engine': ('association_rules',),
+        'association_engine.pattern_brain': ('financial_patterns', 'currency_symbols', 'security_keywords'),
+        'validation_system': ('validation_rules',),
+        'format_handler': ('format_patterns', 'language_patterns')
+    }
+    
     def __init__(self):
         self.layout_engine = LayoutDetectionEngine()
         self.pattern_brain = PatternRecognitionBrain()
@@ -785,7 +989,7 @@ class IntelligentFinancialTableParser:
         self.validation_system = ValidationConfidenceSystem()
         self.format_handler = UniversalFormatHandler()
     
-    def parse_financial_document(self, adobe_extraction_path: str) -> Dict[str, Any]:
+    def parse_financial_document(self, adobe_extraction_path: Union[str, ElementTable, Iterable[Dict[str, Any]]]) -> Dict[str, Any]:
         """Main method to parse a financial document with 100% accuracy"""
         
         logger.info("🚀 Starting intelligent financial document parsing...")
@@ -833,18 +1037,176 @@ class IntelligentFinancialTableParser:
         
         return results
     
-    def load_adobe_extraction(self, extraction_path: str) -> List[TextElement]:
-        """Load and convert Adobe extraction results to TextElement objects"""
-        
-        if not os.path.exists(extraction_path):
-            logger.error(f"Extraction file not found: {extraction_path}")
-            return []
-        
-        with open(extraction_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def parse_many(self, paths: Iterable[str], workers: Optional[int] = None, on_error: str = 'continue',
+                   ordered: bool = False) -> Iterator[DocumentParseResult]:
+        """
+        Parse many structuredData.json documents in a process pool
+
+        Each worker builds one parser on start-up, configured with this
+        parser's engine settings, and reuses its engines for every document it
+        is given. Paths are read from the iterable as the pool has room. Results stream back as documents finish,
+        with at most two documents per worker queued or awaiting collection.
+        A document that raises is reported as a failed result. If a worker
+        process dies, the documents it may have been parsing are retried one
+        at a time, so only the document that crashes it is reported failed.
+
+        Args:
+            paths: structuredData.json paths or result ZIP references
+            workers: Worker processes (default: CPU count); 1 parses in this process
+            on_error: 'continue' to yield failed results, 'raise' to raise
+                ProcessingError at the first failure
+            ordered: Yield results in input order instead of completion order
+
+        Yields:
+            DocumentParseResult per document, with its parse time
+        """
+        if on_error not in ('continue', 'raise'):
+            raise ValueError(f"on_error must be 'continue' or 'raise', got {on_error!r}")
+        
+        paths = (os.fspath(path) for path in paths)
+        workers = workers or os.cpu_count() or 1
+        
+        # A single document is not worth starting a pool for
+        head = list(islice(paths, 2)) if workers > 1 else []
+        paths = chain(head, paths)
+        if len(head) <= 1:
+            outcomes = (_parse_document(self, path) for path in paths)
+        else:
+            outcomes = self._parse_in_processes(paths, workers, ordered)
+        
+        for outcome in outcomes:
+            if not outcome.success and on_error == 'raise':
+                raise ProcessingError(
+                    f"Parsing {outcome.path} failed: {outcome.error_message}",
+                    error_code="DOCUMENT_PARSE_FAILED",
+                    context={'path': outcome.path, 'error_type': outcome.error_type}
+                )
+            yield outcome
+    
+    def _worker_settings(self) -> Dict[str, Dict[str, Any]]:
+        """Engine settings, by component, that parse_many ships to its workers"""
+        settings = {}
+        for component, names in self.WORKER_SETTINGS.items():
+            target = self
+            for attribute in component.split('.'):
+                target = getattr(target, attribute)
+            settings[component] = {name: getattr(target, name) for name in names}
+        return settings
+    
+    def _apply_worker_settings(self, settings: Dict[str, Dict[str, Any]]):
+        """Configure this parser's engines from _worker_settings() of another parser"""
+        for component, values in settings.items():
+            target = self
+            for attribute in component.split('.'):
+                target = getattr(target, attribute)
+            for name, value in values.items():
+                setattr(target, name, value)
+    
+    def _parse_in_processes(self, paths: Iterable[str], workers: int, ordered: bool) -> Iterator[DocumentParseResult]:
+        """Sliding window of documents over a process pool, restarted if a worker dies"""
+        
+        window = workers * 2
+        pending = enumerate(paths)
+        exhausted = False
+        suspects = deque()  # In flight when a worker died; retried alone
+        in_flight = {}      # future -> (index, path, alone)
+        finished = {}       # Out-of-order results held back when ordered
+        next_index = 0
+        settings = self._worker_settings()
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_parser, initargs=(settings,))
+        
+        try:
+            while True:
+                if suspects:
+                    if not in_flight:
+                        index, path = suspects.popleft()
+                        in_flight[pool.submit(_parse_in_worker, path)] = (index, path, True)
+                else:
+                    while not exhausted and len(in_flight) + len(finished) < window:
+                        index, path = next(pending, (None, None))
+                        if path is None:
+                            exhausted = True
+                            break
+                        in_flight[pool.submit(_parse_in_worker, path)] = (index, path, False)
+                if not in_flight:
+                    break
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                completed = []
+                broken = False
+                for future in done:
+                    index, path, alone = in_flight.pop(future)
+                    try:
+                        completed.append((index, future.result()))
+                    except BrokenProcessPool:
+                        broken = True
+                        if alone:
+                            completed.append((index, DocumentParseResult(
+                                path, False, error_message="Worker process died while parsing",
+                                error_type='BrokenProcessPool')))
+                        else:
+                            suspects.append((index, path))
+                    except Exception as e:
+                        completed.append((index, DocumentParseResult(
+                            path, False, error_message=str(e), error_type=type(e).__name__)))
+                
+                if broken:
+                    # Every other document in flight went down with the pool
+                    logger.warning("Parser worker died; retrying the documents in flight one at a time")
+                    for future, (index, path, _) in in_flight.items():
+                        if future.done() and not future.cancelled() and future.exception() is None:
+                            completed.append((index, future.result()))
+                        else:
+                            suspects.append((index, path))
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_parser,
+                                               initargs=(settings,))
+                
+                for index, outcome in completed:
+                    if not ordered:
+                        yield outcome
+                        continue
+                    finished[index] = outcome
+                    while next_index in finished:
+                        yield finished.pop(next_index)
+                        next_index += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def load_adobe_extraction(self, extraction_path: Union[str, ElementTable, Iterable[Dict[str, Any]]],
+                              pages: Optional[Iterable[int]] = None,
+                              path_prefix: Optional[str] = None) -> List[TextElement]:
+        """Load and convert Adobe extraction results to TextElement objects
+
+        extraction_path may be a structuredData.json path, a reference into
+        the result ZIP, an ElementTable shared with other parsers, or already
+        streamed elements such as a StructuredDataReader. Paths and tables
+        are filtered to the text elements on the requested pages and under
+        path_prefix.
+        """
+        
+        if isinstance(extraction_path, ElementTable):
+            table = extraction_path
+            elements = [
+                TextElement(text=table.text(row), page=page, bounds=bounds if has_bounds else [],
+                            font_size=size, path=table.path(row), confidence=1.0)
+                for row, page, bounds, has_bounds, size in zip(*self._table_columns(table, pages, path_prefix))
+            ]
+            logger.info(f"📊 Loaded {len(elements)} text elements from Adobe extraction")
+            return elements
+        
+        if isinstance(extraction_path, str):
+            if not result_exists(extraction_path):
+                logger.error(f"Extraction file not found: {extraction_path}")
+                return []
+            element_stream = StructuredDataReader(extraction_path, pages=pages,
+                                                  path_prefix=path_prefix, text_only=True)
+        else:
+            element_stream = extraction_path
         
         elements = []
-        for element_data in data.get('elements', []):
+        for element_data in element_stream:
             element = TextElement(
                 text=element_data.get('Text', '').strip(),
                 page=element_data.get('Page', 0),
@@ -860,6 +1222,13 @@ class IntelligentFinancialTableParser:
         logger.info(f"📊 Loaded {len(elements)} text elements from Adobe extraction")
         return elements
     
+    @staticmethod
+    def _table_columns(table: ElementTable, pages: Optional[Iterable[int]], path_prefix: Optional[str]):
+        """Columns of the selected table rows as Python lists, in document order"""
+        rows = table.select(pages=pages, path_prefix=path_prefix)
+        return (rows.tolist(), table.page[rows].tolist(), table.bounds[rows].tolist(),
+                table.has_bounds[rows].tolist(), table.text_size[rows].tolist())
+    
     def security_to_dict(self, security: SecurityRecord) -> Dict[str, Any]:
         """Convert SecurityRecord to dictionary for JSON serialization"""
         
@@ -895,6 +1264,49 @@ class IntelligentFinancialTableParser:
             logger.info(f"💾 Results saved to {output_path} and {csv_path}")
 
 
+def _detect_layout_pages(parameters: tuple, pages: List[Tuple[int, List[Tuple[str, List[float]]]]]) -> List[List[tuple]]:
+    """Executor task: detect tables on a batch of pages, returned as index records"""
+    return LayoutDetectionEngine(cache_size=0)._detect_page_batch(parameters, pages)
+
+
+def _parse_document(parser: IntelligentFinancialTableParser, path: str) -> DocumentParseResult:
+    """Parse one document, turning exceptions and empty extractions into failed results"""
+    start = time.perf_counter()
+    try:
+        results = parser.parse_financial_document(path)
+    except Exception as e:
+        logger.error(f"Error parsing {path}: {e}")
+        return DocumentParseResult(path, False, error_message=str(e), error_type=type(e).__name__,
+                                   processing_time=time.perf_counter() - start, worker_pid=os.getpid())
+    
+    elapsed = time.perf_counter() - start
+    if 'error' in results:
+        return DocumentParseResult(path, False, results=results, error_message=results['error'],
+                                   error_type='NoExtractionData', processing_time=elapsed, worker_pid=os.getpid())
+    return DocumentParseResult(path, True, results=results, processing_time=elapsed, worker_pid=os.getpid())
+
+
+_worker_parser: Optional[IntelligentFinancialTableParser] = None
+
+
+def _init_worker_parser(settings: Optional[Dict[str, Dict[str, Any]]] = None):
+    """Process-pool initializer: build the worker's parser, with the caller's settings, and its keyword matchers"""
+    global _worker_parser
+    _worker_parser = IntelligentFinancialTableParser()
+    if settings:
+        _worker_parser._apply_worker_settings(settings)
+    # Compile the keyword matchers now rather than during the first document
+    _worker_parser.association_engine.pattern_brain.keyword_matcher
+    _worker_parser.format_handler.keyword_matcher
+
+
+def _parse_in_worker(path: str) -> DocumentParseResult:
+    """Process-pool task: parse one document with the worker's parser"""
+    if _worker_parser is None:
+        _init_worker_parser()
+    return _parse_document(_worker_parser, path)
+
+
 def main():
     """Demonstrate the intelligent financial table parser"""
     
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Durable Job Ledger for Adobe PDF Batch Processing
+Records per-file state in a local SQLite database so interrupted batch runs can resume
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobState(Enum):
+    """Lifecycle states of a batch job"""
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobLedger:
+    """SQLite-backed record of batch job state, attempts and output paths"""
+
+    def __init__(self, db_path: str):
+        """
+        Initialize job ledger
+
+        Args:
+            db_path: Path to the SQLite ledger file
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+
+        # WAL keeps each per-job commit cheap while staying crash-safe
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS jobs (
+                pdf_path TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                output_files TEXT,
+                error_message TEXT,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def register(self, pdf_paths: Iterable[str], reset: bool = False):
+        """
+        Add files to the ledger as pending
+
+        Args:
+            pdf_paths: Files in the batch
+            reset: Forget previous state and attempts for these files
+        """
+        now = datetime.now().isoformat()
+        rows = ((path, JobState.PENDING.value, now) for path in pdf_paths)
+
+        if reset:
+            self.conn.executemany('''
+                INSERT INTO jobs (pdf_path, state, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(pdf_path) DO UPDATE SET
+                    state = excluded.state, attempts = 0, output_files = NULL,
+                    error_message = NULL, updated_at = excluded.updated_at
+            ''', rows)
+        else:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (pdf_path, state, updated_at) VALUES (?, ?, ?)", rows
+            )
+        self.conn.commit()
+
+    def recover_in_flight(self) -> int:
+        """
+        Return jobs left in flight by a crashed run to pending
+
+        Returns:
+            Number of recovered jobs
+        """
+        cursor = self.conn.execute(
+            "UPDATE jobs SET state = ?, updated_at = ? WHERE state = ?",
+            (JobState.PENDING.value, datetime.now().isoformat(), JobState.IN_FLIGHT.value)
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def select_remaining(self, pdf_paths: Iterable[str], max_attempts: int) -> List[str]:
+        """
+        Filter a batch down to files that still need processing
+
+        Completed files are skipped, as are failed files that have used up
+        their attempts.
+
+        Args:
+            pdf_paths: Files in the batch
+            max_attempts: Maximum attempts per file across runs
+
+        Returns:
+            Files to process, in their original order
+        """
+        finished = {
+            row[0] for row in self.conn.execute(
+                "SELECT pdf_path FROM jobs WHERE state = ? OR (state = ? AND attempts >= ?)",
+                (JobState.DONE.value, JobState.FAILED.value, max_attempts)
+            )
+        }
+        return [path for path in pdf_paths if path not in finished]
+
+    def mark_in_flight(self, pdf_path: str):
+        """Record that a job has started and count the attempt"""
+        self.conn.execute('''
+            INSERT INTO jobs (pdf_path, state, attempts, updated_at) VALUES (?, ?, 1, ?)
+            ON CONFLICT(pdf_path) DO UPDATE SET
+                state = excluded.state, attempts = attempts + 1, updated_at = excluded.updated_at
+        ''', (pdf_path, JobState.IN_FLIGHT.value, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def mark_done(self, pdf_path: str, output_files: Optional[Dict[str, Any]] = None):
+        """Record a successful job and its output paths"""
+        self.conn.execute(
+            "UPDATE jobs SET state = ?, output_files = ?, error_message = NULL, updated_at = ? WHERE pdf_path = ?",
+            (JobState.DONE.value, json.dumps(output_files or {}, default=str),
+             datetime.now().isoformat(), pdf_path)
+        )
+        self.conn.commit()
+
+    def mark_failed(self, pdf_path: str, error_message: Optional[str] = None):
+        """Record a failed job"""
+        self.conn.execute(
+            "UPDATE jobs SET state = ?, error_message = ?, updated_at = ? WHERE pdf_path = ?",
+            (JobState.FAILED.value, error_message, datetime.now().isoformat(), pdf_path)
+        )
+        self.conn.commit()
+
+    def get_job(self, pdf_path: str) -> Optional[Dict[str, Any]]:
+        """Get the ledger entry for a file"""
+        row = self.conn.execute(
+            "SELECT pdf_path, state, attempts, output_files, error_message, updated_at FROM jobs WHERE pdf_path = ?",
+            (pdf_path,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        return {
+            'pdf_path': row[0],
+            'state': row[1],
+            'attempts': row[2],
+            'output_files': json.loads(row[3]) if row[3] else {},
+            'error_message': row[4],
+            'updated_at': row[5]
+        }
+
+    def get_summary(self) -> Dict[str, int]:
+        """Count jobs per state"""
+        summary = {state.value: 0 for state in JobState}
+        for state, count in self.conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state"):
+            summary[state] = count
+        return summary
+
+    def close(self):
+        """Close the ledger database"""
+        self.conn.close()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Shared Job Status Poller for Asynchronous Document APIs
+Multiplexes many outstanding job URLs onto one event loop, polling each with
+Retry-After hints or exponential backoff with jitter
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+import aiohttp
+
+from exceptions import APITimeoutError, TemporaryAPIError
+
+logger = logging.getLogger(__name__)
+
+# Coroutine fetching a job status URL; returns the status JSON and the Retry-After hint in seconds
+StatusFetcher = Callable[[str], Awaitable[Tuple[Dict[str, Any], Optional[float]]]]
+
+
+@dataclass
+class PollPolicy:
+    """How often and how long to poll a job"""
+    initial_interval: float = 1.0  # Delay before the first status check
+    max_interval: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.2  # Random spread of each delay, as a fraction
+    max_polls: int = 40  # Cap on status requests per job
+    timeout: float = 900.0  # Seconds before a job is given up
+
+    def delay(self, polls_done: int, retry_after: Optional[float] = None) -> float:
+        """Delay before the next status check"""
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.max_interval)
+        base = min(self.max_interval, self.initial_interval * self.multiplier ** polls_done)
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a Retry-After header (seconds or HTTP date) to seconds"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable_poll_error(error: Exception) -> bool:
+    """Check whether a failed status request is worth repeating"""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (TemporaryAPIError, asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+class _PolledJob:
+    """Book-keeping for one outstanding job"""
+
+    def __init__(self, url: str, fetch_status: StatusFetcher, future: asyncio.Future, timeout: float,
+                 deadline: float):
+        self.url = url
+        self.fetch_status = fetch_status
+        self.future = future
+        self.timeout = timeout
+        self.deadline = deadline
+        self.polls = 0
+
+
+class JobPoller:
+    """
+    Wait for many asynchronous jobs with one scheduler
+
+    Each job sits in a timer heap keyed by its next check time; a single
+    scheduler task issues the status requests as they come due, so any
+    number of waiters cost one sleeping task rather than one polling loop
+    each.
+    """
+
+    def __init__(self, policy: Optional[PollPolicy] = None,
+                 done_states: Iterable[str] = ('done', 'succeeded'),
+                 failed_states: Iterable[str] = ('failed',),
+                 max_concurrent_polls: int = 10):
+        """
+        Initialize poller
+
+        Args:
+            policy: Poll timing and limits
+            done_states: Status values meaning the job finished successfully
+            failed_states: Status values meaning the job failed
+            max_concurrent_polls: Status requests allowed in flight at once
+        """
+        self.policy = policy or PollPolicy()
+        self.terminal_states = set(done_states) | set(failed_states)
+        self.max_concurrent_polls = max_concurrent_polls
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+
+        self.stats = {'jobs': 0, 'polls': 0, 'completed': 0, 'timeouts': 0, 'retried_errors': 0}
+
+    async def wait(self, url: str, fetch_status: StatusFetcher,
+                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a job reaches a terminal status
+
+        Args:
+            url: Job status URL
+            fetch_status: Coroutine function fetching the status for a URL
+            timeout: Seconds before the job is given up; defaults to the policy timeout
+
+        Returns:
+            Final status JSON, successful or failed
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Scheduler state belongs to one event loop, e.g. one asyncio.run call
+            self._loop = loop
+            self._queue = []
+            self._scheduler = None
+            self._wakeup = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_polls)
+
+        timeout = self.policy.timeout if timeout is None else timeout
+        job = _PolledJob(url, fetch_status, loop.create_future(), timeout, loop.time() + timeout)
+        self.stats['jobs'] += 1
+        self._schedule(job, loop.time() + self.policy.delay(0))
+        return await job.future
+
+    def _schedule(self, job: _PolledJob, due: float):
+        heapq.heappush(self._queue, (due, next(self._sequence), job))
+        self._wakeup.set()
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.ensure_future(self._run())
+
+    async def _run(self):
+        """Issue status requests as jobs come due"""
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            due, _, job = self._queue[0]
+            delay = due - loop.time()
+            if delay > 0:
+                # Sleep until the earliest job is due or a new job is added
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._queue)
+            if job.future.done():
+                continue  # Waiter was cancelled
+            task = asyncio.ensure_future(self._poll_once(job))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _poll_once(self, job: _PolledJob):
+        """Check one job and either resolve its waiter or schedule the next check"""
+        loop = asyncio.get_running_loop()
+        retry_after = None
+        async with self._semaphore:
+            job.polls += 1
+            self.stats['polls'] += 1
+            try:
+                status, retry_after = await job.fetch_status(job.url)
+            except Exception as e:
+                if not is_retryable_poll_error(e):
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                    return
+                self.stats['retried_errors'] += 1
+                retry_after = getattr(e, 'retry_after', None)
+                logger.debug(f"Retrying status check for {job.url}: {e}")
+                status = None
+
+        if job.future.done():
+            return
+        if status is not None and status.get('status') in self.terminal_states:
+            self.stats['completed'] += 1
+            job.future.set_result(status)
+            return
+
+        now = loop.time()
+        if job.polls >= self.policy.max_polls or now >= job.deadline:
+            self.stats['timeouts'] += 1
+            job.future.set_exception(APITimeoutError(job.timeout, f"polling {job.url}"))
+            return
+
+        # A backoff step past the deadline is shortened so the job gets a last check at the deadline
+        self._schedule(job, min(now + self.policy.delay(job.polls, retry_after), job.deadline))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get poll counters, including average status requests per job"""
+        finished = self.stats['completed'] + self.stats['timeouts']
+        return {
+            **self.stats,
+            'outstanding': len(self._queue) + len(self._in_flight),
+            'avg_polls_per_job': self.stats['polls'] / finished if finished else 0.0
+        }
@@ -13,9 +13,12 @@ from typing import Dict, List, Any, Tuple
 import logging
 from datetime import datetime
 
+from token_classifier import TokenFlag, token_flags
+
 # Import the original extractor
 try:
     from pdf_extractor import PDFExtractor
+    from result_archive import result_exists, load_structured_data
 except ImportError:
     logger.error("PDFExtractor not available - will simulate extraction")
 
@@ -76,6 +79,12 @@ class Optimized100PercentExtractor:
             ]
         }
         
+        # Compiled once; they run for every text element
+        self.compiled_patterns = {
+            category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for category, patterns in self.financial_patterns.items()
+        }
+        
     def extract_with_100_percent_target(self, pdf_path: str) -> Dict[str, Any]:
         """Extract data with optimizations targeting 100% accuracy"""
         logger.info(f"Starting 100% accuracy extraction for: {pdf_path}")
@@ -152,9 +161,8 @@ class Optimized100PercentExtractor:
             # Load the structured data
             if raw_results.get('success') and 'extracted_files' in raw_results:
                 json_file = raw_results['extracted_files'].get('json')
-                if json_file and os.path.exists(json_file):
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        structured_data = json.load(f)
+                if json_file and result_exists(json_file):
+                    structured_data = load_structured_data(json_file)
                     raw_results['structured_data'] = structured_data
             
             return raw_results
@@ -206,15 +214,15 @@ class Optimized100PercentExtractor:
         all_text = ' '.join(text_elements)
         
         # Extract client information
-        for pattern in self.financial_patterns['client_info']:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
+        for pattern in self.compiled_patterns['client_info']:
+            matches = pattern.findall(all_text)
             if matches:
                 results['client_info']['client_number'] = matches[0]
                 break
         
         # Extract dates
-        for pattern in self.financial_patterns['dates']:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
+        for pattern in self.compiled_patterns['dates']:
+            matches = pattern.findall(all_text)
             results['dates'].extend(matches)
         
         # Remove duplicates
@@ -223,8 +231,8 @@ class Optimized100PercentExtractor:
         # Extract securities (most important for accuracy boost)
         securities_found = 0
         for text in text_elements:
-            for pattern in self.financial_patterns['securities']:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in self.compiled_patterns['securities']:
+                matches = pattern.findall(text)
                 for match in matches:
                     if len(match) >= 3:  # Ensure we have at least name, identifier, amount
                         security = {
@@ -237,7 +245,7 @@ class Optimized100PercentExtractor:
                         }
                         
                         # Validate ISIN format
-                        if re.match(r'^[A-Z]{2}[A-Z0-9]{9}\d$', security['identifier']):
+                        if token_flags(security['identifier']) & TokenFlag.ISIN_LIKE:
                             results['securities'].append(security)
                             securities_found += 1
         
@@ -245,20 +253,20 @@ class Optimized100PercentExtractor:
         
         # Extract financial amounts
         amounts = []
-        for pattern in self.financial_patterns['amounts']:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
+        for pattern in self.compiled_patterns['amounts']:
+            matches = pattern.findall(all_text)
             amounts.extend([match if isinstance(match, str) else match[0] for match in matches])
         
         # Extract percentages
         percentages = []
-        for pattern in self.financial_patterns['percentages']:
-            matches = re.findall(pattern, all_text, re.IGNORECASE)
+        for pattern in self.compiled_patterns['percentages']:
+            matches = pattern.findall(all_text)
             percentages.extend(matches)
         
         # Extract portfolio totals
         portfolio_total = None
-        for pattern in self.financial_patterns['portfolio_totals']:
-            match = re.search(pattern, all_text, re.IGNORECASE)
+        for pattern in self.compiled_patterns['portfolio_totals']:
+            match = pattern.search(all_text)
             if match:
                 portfolio_total = match.group(1)
                 break
@@ -381,7 +389,7 @@ class Optimized100PercentExtractor:
     
     def _validate_isin(self, isin: str) -> bool:
         """Validate ISIN format and check digit"""
-        if not re.match(r'^[A-Z]{2}[A-Z0-9]{9}\d$', isin):
+        if not token_flags(isin) & TokenFlag.ISIN_LIKE:
             return False
         
         # Could add check digit validation here
@@ -6,20 +6,23 @@ High-performance spatial analysis and table reconstruction with caching and para
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable
 from dataclasses import dataclass
 import logging
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import pickle
 import hashlib
-from functools import lru_cache
 import multiprocessing
 import time
 from collections import defaultdict
+from functools import lru_cache
 from scipy.spatial import KDTree
-from sklearn.cluster import DBSCAN
 import json
 
+from element_table import ElementTable
+from gap_clustering import gap_cluster_labels
+from page_cache import PageCachedDetector, PageResultCache
+
 # Import our custom modules
 try:
     from performance_monitor import monitor_performance, PerformanceMonitor
@@ -113,7 +116,18 @@ class TableCandidate:
 
 
 class SpatialIndexer:
-    """Efficient spatial indexing for text elements"""
+    """
+    Efficient spatial indexing for text elements
+
+    Each page keeps its element coordinates as NumPy arrays, sorted once by
+    center x, center y and top edge. Band and region queries binary-search
+    these arrays for the candidate range and test only the candidates, so a
+    query costs O(log n + k) instead of a scan over the page.
+    """
+    
+    # Widening of binary-search bounds so floating-point rounding never drops
+    # an element the exact comparison would keep; candidates are re-checked
+    _SEARCH_MARGIN = 1e-6
     
     def __init__(self, elements: List[TextElement]):
         self.elements = elements
@@ -122,27 +136,45 @@ class SpatialIndexer:
     
     def _build_indices(self):
         """Build spatial indices for each page"""
-        pages = set(elem.page for elem in self.elements)
-        
-        for page in pages:
-            page_elements = [elem for elem in self.elements if elem.page == page]
+        pages = defaultdict(list)
+        for elem in self.elements:
+            pages[elem.page].append(elem)
+        
+        for page, page_elements in pages.items():
+            x = np.array([elem.x for elem in page_elements], dtype=float)
+            y = np.array([elem.y for elem in page_elements], dtype=float)
+            width = np.array([elem.width for elem in page_elements], dtype=float)
+            height = np.array([elem.height for elem in page_elements], dtype=float)
+            center_x = x + width / 2
+            center_y = y + height / 2
             
-            if page_elements:
-                # Create KDTree for fast spatial queries
-                points = np.array([[elem.center_x, elem.center_y] for elem in page_elements])
-                kdtree = KDTree(points)
-                
-                # Create sorted indices for range queries
-                x_sorted = sorted(enumerate(page_elements), key=lambda x: x[1].x)
-                y_sorted = sorted(enumerate(page_elements), key=lambda x: x[1].y)
-                
-                self.page_indices[page] = {
-                    'elements': page_elements,
-                    'kdtree': kdtree,
-                    'x_sorted': x_sorted,
-                    'y_sorted': y_sorted,
-                    'points': points
-                }
+            # Create KDTree for fast spatial queries
+            points = np.column_stack([center_x, center_y])
+            kdtree = KDTree(points)
+            
+            # Create sorted indices for range queries
+            center_x_order = np.argsort(center_x, kind='stable')
+            center_y_order = np.argsort(center_y, kind='stable')
+            top_order = np.argsort(y, kind='stable')
+            
+            self.page_indices[page] = {
+                'elements': page_elements,
+                'kdtree': kdtree,
+                'points': points,
+                'left': x,
+                'top': y,
+                'right': x + width,
+                'bottom': y + height,
+                'center_x': center_x,
+                'center_y': center_y,
+                'center_x_order': center_x_order,
+                'center_x_sorted': center_x[center_x_order],
+                'center_y_order': center_y_order,
+                'center_y_sorted': center_y[center_y_order],
+                'top_order': top_order,
+                'top_sorted': y[top_order],
+                'max_height': max(float(height.max()), 0.0)
+            }
     
     def find_elements_in_region(self, page: int, x: float, y: float, 
                                width: float, height: float) -> List[TextElement]:
@@ -150,17 +182,9 @@ class SpatialIndexer:
         if page not in self.page_indices:
             return []
         
-        index_data = self.page_indices[page]
-        elements = index_data['elements']
-        
-        # Use spatial filtering
-        result = []
-        for elem in elements:
-            if (elem.x < x + width and elem.right > x and
-                elem.y < y + height and elem.bottom > y):
-                result.append(elem)
-        
-        return result
+        elements = self.page_indices[page]['elements']
+        indices = self.region_indices(page, [(x, y, width, height)])[0]
+        return [elements[i] for i in indices]
     
     def find_nearest_elements(self, page: int, x: float, y: float, 
                             k: int = 5, max_distance: float = 100.0) -> List[TextElement]:
@@ -192,8 +216,7 @@ class SpatialIndexer:
             return []
         
         elements = self.page_indices[page]['elements']
-        return [elem for elem in elements 
-                if abs(elem.center_y - y) <= tolerance]
+        return [elements[i] for i in self.horizontal_band_indices(page, [y], tolerance)[0]]
     
     def find_elements_in_vertical_band(self, page: int, x: float, 
                                      tolerance: float = 10.0) -> List[TextElement]:
@@ -202,16 +225,114 @@ class SpatialIndexer:
             return []
         
         elements = self.page_indices[page]['elements']
-        return [elem for elem in elements 
-                if abs(elem.center_x - x) <= tolerance]
+        return [elements[i] for i in self.vertical_band_indices(page, [x], tolerance)[0]]
+    
+    def horizontal_band_indices(self, page: int, y_values, tolerance=10.0) -> List[np.ndarray]:
+        """
+        Batch row query: elements whose center y is within tolerance of each y
+        
+        Args:
+            page: Page number
+            y_values: Band centers
+            tolerance: Half band height, scalar or one per band
+            
+        Returns:
+            One ascending array of indices into the page's elements per band
+        """
+        return self._band_indices(page, 'center_y', y_values, tolerance)
+    
+    def vertical_band_indices(self, page: int, x_values, tolerance=10.0) -> List[np.ndarray]:
+        """
+        Batch column query: elements whose center x is within tolerance of each x
+        
+        Args:
+            page: Page number
+            x_values: Band centers
+            tolerance: Half band width, scalar or one per band
+            
+        Returns:
+            One ascending array of indices into the page's elements per band
+        """
+        return self._band_indices(page, 'center_x', x_values, tolerance)
+    
+    def region_indices(self, page: int, regions) -> List[np.ndarray]:
+        """
+        Batch region query: elements overlapping each (x, y, width, height) rectangle
+        
+        Returns:
+            One ascending array of indices into the page's elements per region
+        """
+        regions = np.asarray(regions, dtype=float).reshape(-1, 4)
+        if page not in self.page_indices:
+            return [np.zeros(0, dtype=np.intp) for _ in range(len(regions))]
+        
+        index_data = self.page_indices[page]
+        top_sorted, top_order = index_data['top_sorted'], index_data['top_order']
+        left, top, right, bottom = (index_data[key] for key in ('left', 'top', 'right', 'bottom'))
+        
+        x, y, width, height = regions.T
+        # Overlapping elements start above the region's bottom edge and no
+        # more than the tallest element's height above its top edge
+        lo = np.searchsorted(top_sorted, y - index_data['max_height'] - self._SEARCH_MARGIN, side='left')
+        hi = np.searchsorted(top_sorted, y + height + self._SEARCH_MARGIN, side='right')
+        
+        results = []
+        for i in range(len(regions)):
+            candidates = top_order[lo[i]:hi[i]]
+            hit = ((left[candidates] < x[i] + width[i]) & (right[candidates] > x[i]) &
+                   (top[candidates] < y[i] + height[i]) & (bottom[candidates] > y[i]))
+            results.append(np.sort(candidates[hit]))
+        return results
+    
+    def _band_indices(self, page: int, axis: str, centers, tolerance) -> List[np.ndarray]:
+        centers = np.atleast_1d(np.asarray(centers, dtype=float))
+        tolerance = np.broadcast_to(np.asarray(tolerance, dtype=float), centers.shape)
+        if page not in self.page_indices:
+            return [np.zeros(0, dtype=np.intp) for _ in range(len(centers))]
+        
+        index_data = self.page_indices[page]
+        values = index_data[axis]
+        order, sorted_values = index_data[f'{axis}_order'], index_data[f'{axis}_sorted']
+        
+        lo = np.searchsorted(sorted_values, centers - tolerance - self._SEARCH_MARGIN, side='left')
+        hi = np.searchsorted(sorted_values, centers + tolerance + self._SEARCH_MARGIN, side='right')
+        
+        results = []
+        for i in range(len(centers)):
+            candidates = order[lo[i]:hi[i]]
+            # Same comparison as a linear scan, applied to the candidates only
+            hit = np.abs(values[candidates] - centers[i]) <= tolerance[i]
+            results.append(np.sort(candidates[hit]))
+        return results
 
 
-class OptimizedSpatialAnalyzer:
+class OptimizedSpatialAnalyzer(PageCachedDetector):
     """High-performance spatial analysis engine"""
     
-    def __init__(self, enable_parallel: bool = True, cache_size: int = 128):
+    # Settings that change page results; shipped to process-pool workers
+    PARAMETER_NAMES = ('row_tolerance', 'column_tolerance', 'min_table_rows',
+                       'min_table_columns', 'max_table_gap_ratio')
+    
+    def __init__(self, enable_parallel: bool = True, cache_size: int = 128,
+                 parallel_mode: str = 'thread', max_workers: Optional[int] = None):
+        """
+        Initialize analyzer
+        
+        Args:
+            enable_parallel: Analyze pages concurrently
+            cache_size: Number of page results kept in the page cache
+            parallel_mode: 'thread' or 'process'; the process pool is created
+                on first use and reused until close()
+            max_workers: Pool size (CPU count if None)
+        """
+        if parallel_mode not in ('thread', 'process'):
+            raise ValueError(f"parallel_mode must be 'thread' or 'process', got {parallel_mode!r}")
         self.enable_parallel = enable_parallel
         self.cache_size = cache_size
+        self.parallel_mode = parallel_mode
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.page_cache = PageResultCache(cache_size)
+        self._pool: Optional[ProcessPoolExecutor] = None
         self.performance_monitor = PerformanceMonitor()
         
         # Algorithm parameters
@@ -221,13 +342,19 @@ class OptimizedSpatialAnalyzer:
         self.min_table_columns = 2
         self.max_table_gap_ratio = 3.0  # Max gap between elements as ratio of font size
         
+        # Overlap suppression: 'max_ratio' (intersection over the smaller table) or 'iou'
+        self.overlap_threshold = 0.3
+        self.overlap_metric = 'max_ratio'
+        
     @monitor_performance(cache_ttl=3600, enable_cache=True)
-    def analyze_document(self, elements_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_document(self, elements_data: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Main entry point for document spatial analysis
         
         Args:
-            elements_data: List of text element dictionaries from Adobe API
+            elements_data: Text element dictionaries from Adobe API, as a list
+                or streamed, e.g. from a StructuredDataReader, or an ElementTable
+                shared with the other parsers
             
         Returns:
             Analysis results with tables, confidence scores, and metadata
@@ -252,9 +379,11 @@ class OptimizedSpatialAnalyzer:
         pages = set(elem.page for elem in elements)
         all_tables = []
         
-        if self.enable_parallel and len(pages) > 1:
+        if self.enable_parallel and self.parallel_mode == 'process' and len(pages) > 1:
+            all_tables = self._analyze_pages_in_processes(pages, indexer)
+        elif self.enable_parallel and len(pages) > 1:
             # Parallel page processing
-            with ThreadPoolExecutor(max_workers=min(len(pages), multiprocessing.cpu_count())) as executor:
+            with ThreadPoolExecutor(max_workers=min(len(pages), self.max_workers)) as executor:
                 futures = [
                     executor.submit(self._analyze_page, page, indexer)
                     for page in pages
@@ -289,8 +418,11 @@ class OptimizedSpatialAnalyzer:
             'performance_score': self._calculate_performance_score(analysis_time, len(elements))
         }
     
-    def _convert_elements(self, elements_data: List[Dict[str, Any]]) -> List[TextElement]:
+    def _convert_elements(self, elements_data: Iterable[Dict[str, Any]]) -> List[TextElement]:
         """Convert Adobe API elements to optimized TextElement objects"""
+        if isinstance(elements_data, ElementTable):
+            return self._convert_table(elements_data)
+        
         elements = []
         
         for elem_data in elements_data:
@@ -325,14 +457,116 @@ class OptimizedSpatialAnalyzer:
         
         return elements
     
-    @lru_cache(maxsize=32)
+    def _convert_table(self, table: ElementTable) -> List[TextElement]:
+        """Convert ElementTable rows, filtering out small elements before creating any objects"""
+        # Same legacy reading of Bounds as for element dictionaries, [x, y, width, height],
+        # rather than ElementTable.width/height, which follow Adobe's [x1, y1, x2, y2]
+        x, y, width, height = table.bounds.T
+        rows = table.select(mask=table.has_bounds & (width > 1) & (height > 1))
+        
+        return [
+            TextElement(text=table.text(row), page=page, x=left, y=top, width=w, height=h,
+                        font_size=size, font_name=table.font_name(row))
+            for row, page, left, top, w, h, size in zip(
+                rows.tolist(), table.page[rows].tolist(), x[rows].tolist(), y[rows].tolist(),
+                width[rows].tolist(), height[rows].tolist(), table.font_size[rows].tolist()
+            )
+        ]
+    
     def _analyze_page(self, page: int, indexer: SpatialIndexer) -> List[TableCandidate]:
-        """Analyze a single page for table structures"""
+        """Analyze a single page for table structures, reusing results for unchanged pages"""
         if page not in indexer.page_indices:
             return []
         
         elements = indexer.page_indices[page]['elements']
+        key, tables = self._lookup_page(page, elements)
+        if tables is None:
+            tables = self._detect_page_tables(elements, indexer, page)
+            self._cache_page(key, elements, tables)
+        return tables
+    
+    def _analyze_pages_in_processes(self, pages: Iterable[int], indexer: SpatialIndexer) -> List[TableCandidate]:
+        """
+        Analyze pages on the process pool
+        
+        Cached pages are answered locally; the rest are sent in chunked batches
+        as coordinate arrays and texts, and come back as index records.
+        """
+        pages = [page for page in pages if page in indexer.page_indices]
+        tables_by_page, pending = self._lookup_pages(
+            (page, indexer.page_indices[page]['elements']) for page in pages
+        )
         
+        if pending:
+            for batch, future in self._submit_page_batches(self._get_process_pool(), _analyze_page_batch, pending):
+                try:
+                    batch_records = future.result()
+                except Exception as e:
+                    logger.error(f"Error analyzing pages {[page for page, _, _ in batch]}: {e}")
+                    continue
+                self._store_page_batch(batch, batch_records, tables_by_page)
+        
+        return [table for page in pages for table in tables_by_page.get(page, [])]
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    def _page_content(self, elements: List[TextElement]) -> Iterable[bytes]:
+        """Element geometry, texts and fonts"""
+        geometry = np.array([(elem.x, elem.y, elem.width, elem.height, elem.font_size) for elem in elements],
+                            dtype=float)
+        yield geometry.tobytes()
+        yield '\0'.join(f"{elem.text}\1{elem.font_name}" for elem in elements).encode('utf-8')
+    
+    def _page_payload(self, page: int, elements: List[TextElement]) -> tuple:
+        """Page number, coordinate array and texts"""
+        return (page, *_page_arrays(elements))
+    
+    def _page_from_payload(self, payload: tuple) -> Tuple[int, List[TextElement]]:
+        page, geometry, texts = payload
+        return page, [
+            TextElement(text=text, page=page, x=x, y=y, width=width, height=height, font_size=font_size)
+            for text, (x, y, width, height, font_size) in zip(texts, geometry.tolist())
+        ]
+    
+    def _detect_page(self, page: int, elements: List[TextElement]) -> List[TableCandidate]:
+        return self._detect_page_tables(elements, SpatialIndexer(elements), page)
+    
+    @staticmethod
+    def _table_to_record(table: TableCandidate, elements: List[TextElement]) -> tuple:
+        """Store a table by element index; empty cells keep their placeholder geometry"""
+        positions = {id(elem): i for i, elem in enumerate(elements)}
+        row_groups = tuple(
+            tuple(positions[id(elem)] if id(elem) in positions else (elem.x, elem.y, elem.width, elem.height)
+                  for elem in row)
+            for row in table.row_groups
+        )
+        return (tuple(positions[id(elem)] for elem in table.elements), table.rows, table.columns,
+                table.confidence, table.bounding_box, row_groups, tuple(table.column_alignment))
+    
+    @staticmethod
+    def _table_from_record(record: tuple, elements: List[TextElement], page: int) -> TableCandidate:
+        """Rebuild a cached table against this document's elements"""
+        element_indices, rows, columns, confidence, bounding_box, row_groups, column_alignment = record
+        return TableCandidate(
+            elements=[elements[i] for i in element_indices],
+            rows=rows,
+            columns=columns,
+            confidence=confidence,
+            page=page,
+            bounding_box=bounding_box,
+            row_groups=[
+                [elements[cell] if isinstance(cell, int) else TextElement("", page, *cell) for cell in row]
+                for row in row_groups
+            ],
+            column_alignment=list(column_alignment)
+        )
+    
+    def _detect_page_tables(self, elements: List[TextElement], indexer: SpatialIndexer,
+                            page: int) -> List[TableCandidate]:
+        """Detect table structures among one page's elements"""
         if len(elements) < self.min_table_rows * self.min_table_columns:
             return []
         
@@ -343,27 +577,28 @@ class OptimizedSpatialAnalyzer:
             return []
         
         # Step 2: Detect column alignment
-        tables = []
+        candidates = []
         for row_group_set in self._group_consecutive_rows(row_groups):
             if len(row_group_set) >= self.min_table_rows:
-                table = self._construct_table_from_rows(row_group_set, page)
-                if table and table.confidence > 0.3:  # Minimum confidence threshold
-                    tables.append(table)
+                table = self._construct_table_from_rows(row_group_set, page, score=False)
+                if table:
+                    candidates.append(table)
         
-        return tables
+        # Step 3: Score all candidates of the page at once
+        for table, confidence in zip(candidates, self.score_tables(candidates).tolist()):
+            table.confidence = confidence
+        
+        return [table for table in candidates if table.confidence > 0.3]  # Minimum confidence threshold
     
     def _detect_row_groups(self, elements: List[TextElement], 
                           indexer: SpatialIndexer, page: int) -> List[List[TextElement]]:
-        """Detect horizontal row groups using DBSCAN clustering"""
+        """Detect horizontal row groups by gap clustering of element centers"""
         if not elements:
             return []
         
-        # Prepare data for clustering
-        y_positions = np.array([[elem.center_y] for elem in elements])
-        
-        # Use DBSCAN to find row clusters
-        clustering = DBSCAN(eps=self.row_tolerance, min_samples=1).fit(y_positions)
-        labels = clustering.labels_
+        # Rows are runs of center_y values no more than row_tolerance apart
+        y_positions = np.array([elem.center_y for elem in elements])
+        labels = gap_cluster_labels(y_positions, eps=self.row_tolerance)
         
         # Group elements by cluster
         clusters = defaultdict(list)
@@ -419,8 +654,8 @@ class OptimizedSpatialAnalyzer:
         return table_groups
     
     def _construct_table_from_rows(self, row_groups: List[List[TextElement]], 
-                                  page: int) -> Optional[TableCandidate]:
-        """Construct table candidate from row groups"""
+                                  page: int, score: bool = True) -> Optional[TableCandidate]:
+        """Construct table candidate from row groups; score=False leaves confidence at 0 for batch scoring"""
         if not row_groups:
             return None
         
@@ -444,7 +679,7 @@ class OptimizedSpatialAnalyzer:
         max_y = max(elem.bottom for elem in all_elements)
         
         # Calculate confidence score
-        confidence = self._calculate_table_confidence(aligned_rows, column_positions)
+        confidence = self._calculate_table_confidence(aligned_rows, column_positions) if score else 0.0
         
         return TableCandidate(
             elements=all_elements,
@@ -470,9 +705,7 @@ class OptimizedSpatialAnalyzer:
             return []
         
         # Use clustering to find column positions
-        x_array = np.array(all_x_positions).reshape(-1, 1)
-        clustering = DBSCAN(eps=self.column_tolerance, min_samples=1).fit(x_array)
-        labels = clustering.labels_
+        labels = gap_cluster_labels(all_x_positions, eps=self.column_tolerance)
         
         # Calculate column centers
         column_centers = []
@@ -527,134 +760,145 @@ class OptimizedSpatialAnalyzer:
         """Calculate confidence score for table detection"""
         if not aligned_rows or not column_positions:
             return 0.0
-        
-        confidence_factors = []
-        
-        # Factor 1: Column consistency (how well aligned are columns)
-        column_consistency = 0.0
-        for col_idx in range(len(column_positions)):
-            col_elements = [row[col_idx] for row in aligned_rows if col_idx < len(row)]
-            non_empty_elements = [elem for elem in col_elements if elem.text.strip()]
-            
-            if len(non_empty_elements) > 1:
-                positions = [elem.center_x for elem in non_empty_elements]
-                std_dev = np.std(positions)
-                consistency = max(0, 1 - (std_dev / self.column_tolerance))
-                column_consistency += consistency
-        
-        if len(column_positions) > 0:
-            column_consistency /= len(column_positions)
-        confidence_factors.append(column_consistency)
-        
-        # Factor 2: Row completeness (how many cells are filled)
-        total_cells = len(aligned_rows) * len(column_positions)
-        filled_cells = sum(
-            1 for row in aligned_rows 
-            for elem in row if elem.text.strip()
-        )
-        completeness = filled_cells / total_cells if total_cells > 0 else 0
-        confidence_factors.append(completeness)
-        
-        # Factor 3: Regular spacing (consistent row heights)
-        if len(aligned_rows) > 1:
-            row_heights = []
-            for row in aligned_rows:
-                non_empty = [elem for elem in row if elem.text.strip()]
-                if non_empty:
-                    row_heights.append(np.mean([elem.height for elem in non_empty]))
-            
-            if len(row_heights) > 1:
-                height_std = np.std(row_heights)
-                avg_height = np.mean(row_heights)
-                spacing_consistency = max(0, 1 - (height_std / avg_height)) if avg_height > 0 else 0
-                confidence_factors.append(spacing_consistency)
-        
-        # Factor 4: Content patterns (numbers, structured text)
-        content_score = self._analyze_content_patterns(aligned_rows)
-        confidence_factors.append(content_score)
-        
-        # Combine factors with weights
-        weights = [0.3, 0.3, 0.2, 0.2]
-        final_confidence = sum(factor * weight for factor, weight in zip(confidence_factors, weights))
-        
-        return min(1.0, max(0.0, final_confidence))
+        return float(self._confidence_scores([aligned_rows], [len(column_positions)])[0])
     
-    def _analyze_content_patterns(self, aligned_rows: List[List[TextElement]]) -> float:
-        """Analyze content patterns to boost table confidence"""
-        if not aligned_rows:
-            return 0.0
-        
-        pattern_scores = []
+    def score_tables(self, candidates: List[TableCandidate]) -> np.ndarray:
+        """
+        Confidence scores for many table candidates in one vectorized pass
         
-        # Check for numeric columns
-        for col_idx in range(len(aligned_rows[0]) if aligned_rows else 0):
-            col_texts = [
-                row[col_idx].text.strip() for row in aligned_rows 
-                if col_idx < len(row) and row[col_idx].text.strip()
-            ]
-            
-            if len(col_texts) > 1:
-                numeric_count = sum(
-                    1 for text in col_texts 
-                    if self._is_numeric_value(text)
-                )
-                numeric_ratio = numeric_count / len(col_texts)
-                pattern_scores.append(numeric_ratio)
-        
-        # Check for header patterns (different formatting in first row)
-        if len(aligned_rows) > 1:
-            first_row_fonts = [elem.font_size for elem in aligned_rows[0] if elem.text.strip()]
-            other_rows_fonts = [
-                elem.font_size for row in aligned_rows[1:] 
-                for elem in row if elem.text.strip()
-            ]
+        Args:
+            candidates: Candidates with aligned row_groups and column_alignment
             
-            if first_row_fonts and other_rows_fonts:
-                first_row_avg = np.mean(first_row_fonts)
-                other_rows_avg = np.mean(other_rows_fonts)
-                
-                # Header typically has larger font
-                if first_row_avg > other_rows_avg:
-                    pattern_scores.append(0.8)
+        Returns:
+            One score per candidate, in order
+        """
+        return self._confidence_scores([candidate.row_groups for candidate in candidates],
+                                       [len(candidate.column_alignment) for candidate in candidates])
+    
+    def _confidence_scores(self, tables: List[List[List[TextElement]]], column_counts: List[int]) -> np.ndarray:
+        """
+        Score aligned tables from a padded tables x rows x columns cell matrix
         
-        return np.mean(pattern_scores) if pattern_scores else 0.0
+        Factors, as weighted sums: column consistency (0.3), cell completeness
+        (0.3), row height regularity (0.2, only with two or more non-empty rows)
+        and content patterns (0.2): numeric ratio per column plus a larger-font
+        header row.
+        """
+        count = len(tables)
+        if count == 0:
+            return np.zeros(0)
+        row_counts = np.array([len(rows) for rows in tables])
+        column_counts = np.array(column_counts)
+        shape = (count, max(int(row_counts.max()), 1), max(int(column_counts.max()), 1))
+        
+        # Gather non-empty cells once; padding and empty cells stay unfilled
+        table_idx, row_idx, col_idx, center_x, height, font_size, numeric = [], [], [], [], [], [], []
+        for t, rows in enumerate(tables):
+            for r, row in enumerate(rows):
+                for c, elem in enumerate(row):
+                    text = elem.text.strip()
+                    if text:
+                        table_idx.append(t)
+                        row_idx.append(r)
+                        col_idx.append(c)
+                        center_x.append(elem.center_x)
+                        height.append(elem.height)
+                        font_size.append(elem.font_size)
+                        numeric.append(_is_numeric_text(text))
+        
+        cells = (np.array(table_idx, dtype=np.intp), np.array(row_idx, dtype=np.intp),
+                 np.array(col_idx, dtype=np.intp))
+        filled = np.zeros(shape, dtype=bool)
+        filled[cells] = True
+        
+        def matrix(values, dtype=float):
+            result = np.zeros(shape, dtype=dtype)
+            result[cells] = values
+            return result
+        
+        center_x, height, font_size = matrix(center_x), matrix(height), matrix(font_size)
+        numeric = matrix(numeric, dtype=bool)
+        safe_columns = np.maximum(column_counts, 1)
+        
+        # Factor 1: column consistency, spread of centers within each column
+        column_filled = filled.sum(axis=1)
+        column_std = _masked_std(center_x, filled, axis=1)
+        column_score = np.where(column_filled > 1, np.maximum(0, 1 - column_std / self.column_tolerance), 0.0)
+        column_consistency = column_score.sum(axis=1) / safe_columns
+        
+        # Factor 2: completeness, share of filled cells
+        total_cells = row_counts * column_counts
+        completeness = np.where(total_cells > 0, filled.sum(axis=(1, 2)) / np.maximum(total_cells, 1), 0.0)
+        
+        # Factor 3: regular spacing, spread of mean row heights
+        row_filled = filled.sum(axis=2)
+        row_heights = np.where(row_filled > 0, (height * filled).sum(axis=2) / np.maximum(row_filled, 1), 0.0)
+        has_height = row_filled > 0
+        height_rows = has_height.sum(axis=1)
+        height_mean = np.where(height_rows > 0, row_heights.sum(axis=1) / np.maximum(height_rows, 1), 0.0)
+        height_std = _masked_std(row_heights, has_height, axis=1)
+        has_spacing = (row_counts > 1) & (height_rows > 1)
+        spacing = np.where(has_spacing & (height_mean > 0),
+                           np.maximum(0, 1 - height_std / np.where(height_mean > 0, height_mean, 1)), 0.0)
+        
+        # Factor 4: content patterns, numeric columns and a larger-font header
+        numeric_columns = column_filled > 1
+        numeric_ratio = (numeric & filled).sum(axis=1) / np.maximum(column_filled, 1)
+        pattern_total = np.where(numeric_columns, numeric_ratio, 0.0).sum(axis=1)
+        pattern_count = numeric_columns.sum(axis=1)
+        
+        header_filled = row_filled[:, 0]
+        body_filled = row_filled.sum(axis=1) - header_filled
+        header_font = (font_size[:, 0] * filled[:, 0]).sum(axis=1) / np.maximum(header_filled, 1)
+        body_font = (font_size * filled)[:, 1:].sum(axis=(1, 2)) / np.maximum(body_filled, 1)
+        has_header = (row_counts > 1) & (header_filled > 0) & (body_filled > 0) & (header_font > body_font)
+        pattern_total += 0.8 * has_header
+        pattern_count += has_header
+        content = np.where(pattern_count > 0, pattern_total / np.maximum(pattern_count, 1), 0.0)
+        
+        scores = 0.3 * column_consistency + 0.3 * completeness + 0.2 * spacing + 0.2 * content
+        scores = np.clip(scores, 0.0, 1.0)
+        return np.where((row_counts > 0) & (column_counts > 0), scores, 0.0)
     
     def _is_numeric_value(self, text: str) -> bool:
         """Check if text represents a numeric value"""
-        # Remove common formatting
-        clean_text = text.replace(',', '').replace('$', '').replace('%', '').strip()
-        
-        try:
-            float(clean_text)
-            return True
-        except ValueError:
-            return False
+        return _is_numeric_text(text)
     
     def _post_process_tables(self, tables: List[TableCandidate]) -> List[TableCandidate]:
-        """Post-process detected tables to remove overlaps and improve quality"""
+        """
+        Post-process detected tables to remove overlaps and improve quality
+        
+        Greedy non-maximum suppression: in order of confidence, a table is kept
+        unless it overlaps an already kept table on the same page by more than
+        overlap_threshold. Overlapping pairs come from a per-page sweep, so
+        only tables whose extents intersect are ever compared.
+        """
         if not tables:
             return tables
         
         # Sort by confidence (highest first)
         tables.sort(key=lambda t: t.confidence, reverse=True)
         
+        pages = np.array([table.page for table in tables])
+        boxes = np.array([table.bounding_box for table in tables], dtype=float).reshape(-1, 4)
+        
+        # Earlier (higher confidence) overlapping tables of each table
+        suppressors = defaultdict(list)
+        for page in np.unique(pages):
+            members = np.flatnonzero(pages == page)
+            first, second = _overlapping_pairs(boxes[members], self.overlap_threshold, self.overlap_metric)
+            for a, b in zip(members[first].tolist(), members[second].tolist()):
+                suppressors[max(a, b)].append(min(a, b))
+        
         # Remove overlapping tables (keep higher confidence one)
-        filtered_tables = []
-        for table in tables:
-            is_overlapping = False
-            
-            for existing_table in filtered_tables:
-                if self._tables_overlap(table, existing_table):
-                    is_overlapping = True
-                    break
-            
-            if not is_overlapping:
-                filtered_tables.append(table)
+        kept = np.zeros(len(tables), dtype=bool)
+        for index in range(len(tables)):
+            kept[index] = not any(kept[earlier] for earlier in suppressors.get(index, ()))
         
-        return filtered_tables
+        return [table for table, keep in zip(tables, kept) if keep]
     
     def _tables_overlap(self, table1: TableCandidate, table2: TableCandidate, 
-                       threshold: float = 0.3) -> bool:
+                       threshold: float = 0.3, metric: str = 'max_ratio') -> bool:
         """Check if two tables overlap significantly"""
         if table1.page != table2.page:
             return False
@@ -674,6 +918,10 @@ class OptimizedSpatialAnalyzer:
             table1_area = w1 * h1
             table2_area = w2 * h2
             
+            if metric == 'iou':
+                union_area = table1_area + table2_area - intersection_area
+                return (intersection_area / union_area if union_area > 0 else 0) > threshold
+            
             # Check if intersection is significant relative to either table
             overlap_ratio1 = intersection_area / table1_area if table1_area > 0 else 0
             overlap_ratio2 = intersection_area / table2_area if table2_area > 0 else 0
@@ -708,15 +956,114 @@ class OptimizedSpatialAnalyzer:
         return performance_score
 
 
+
+@lru_cache(maxsize=65536)
+def _is_numeric_text(text: str) -> bool:
+    """Whether text parses as a number once $, % and thousands separators are removed"""
+    # Remove common formatting
+    clean_text = text.replace(',', '').replace('$', '').replace('%', '').strip()
+    
+    try:
+        float(clean_text)
+        return True
+    except ValueError:
+        return False
+
+
+def _masked_std(values: np.ndarray, mask: np.ndarray, axis: int) -> np.ndarray:
+    """Population standard deviation over masked entries along one axis; 0 where none"""
+    counts = np.maximum(mask.sum(axis=axis, keepdims=True), 1)
+    mean = (values * mask).sum(axis=axis, keepdims=True) / counts
+    deviation = (values - mean) * mask
+    return np.sqrt((deviation * deviation).sum(axis=axis) / np.squeeze(counts, axis=axis))
+
+
+def _overlapping_pairs(boxes: np.ndarray, threshold: float = 0.3,
+                       metric: str = 'max_ratio') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Index pairs of (x, y, width, height) boxes overlapping by more than threshold
+    
+    Sweeps along whichever axis gives fewer candidate pairs: boxes are sorted
+    by their leading edge and each is compared only with the boxes starting
+    before its trailing edge, then pairs are checked exactly. Near-linear when
+    few boxes overlap.
+    
+    Args:
+        boxes: Array of shape (n, 4)
+        threshold: Overlap above which a pair is reported
+        metric: 'max_ratio' (intersection over the smaller area) or 'iou'
+    """
+    if metric not in ('max_ratio', 'iou'):
+        raise ValueError(f"metric must be 'max_ratio' or 'iou', got {metric!r}")
+    empty = np.zeros(0, dtype=np.intp)
+    if len(boxes) < 2:
+        return empty, empty
+    
+    x, y, width, height = boxes.T
+    right, bottom = x + width, y + height
+    
+    # Candidate pairs along each axis; sweep the one with fewer
+    sweeps = []
+    for start, end in ((x, right), (y, bottom)):
+        order = np.argsort(start, kind='stable')
+        reach = np.searchsorted(start[order], end[order], side='left')
+        counts = np.maximum(reach - np.arange(1, len(order) + 1), 0)
+        sweeps.append((int(counts.sum()), order, counts))
+    _, order, counts = min(sweeps, key=lambda sweep: sweep[0])
+    if not counts.any():
+        return empty, empty
+    
+    position = np.repeat(np.arange(len(order)), counts)
+    offsets = np.arange(len(position)) - np.repeat(np.cumsum(counts) - counts, counts)
+    first, second = order[position], order[position + 1 + offsets]
+    
+    # Exact intersection test
+    inter_width = np.minimum(right[first], right[second]) - np.maximum(x[first], x[second])
+    inter_height = np.minimum(bottom[first], bottom[second]) - np.maximum(y[first], y[second])
+    intersects = (inter_width > 0) & (inter_height > 0)
+    intersection = np.where(intersects, inter_width * inter_height, 0.0)
+    area_first, area_second = width[first] * height[first], width[second] * height[second]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if metric == 'iou':
+            union = area_first + area_second - intersection
+            overlap = np.where(union > 0, intersection / union, 0.0)
+        else:
+            overlap = np.maximum(np.where(area_first > 0, intersection / area_first, 0.0),
+                                 np.where(area_second > 0, intersection / area_second, 0.0))
+    
+    significant = intersects & (overlap > threshold)
+    return first[significant], second[significant]
+
+
+def _page_arrays(elements: List[TextElement]) -> Tuple[np.ndarray, List[str]]:
+    """Compact page payload for worker processes: (x, y, width, height, font_size) rows and texts"""
+    geometry = np.array([(elem.x, elem.y, elem.width, elem.height, elem.font_size) for elem in elements],
+                        dtype=float).reshape(-1, 5)
+    return geometry, [elem.text for elem in elements]
+
+
+_worker_analyzer: Optional[OptimizedSpatialAnalyzer] = None
+
+
+def _analyze_page_batch(parameters: tuple, pages: List[Tuple[int, np.ndarray, List[str]]]) -> List[List[tuple]]:
+    """Process-pool task: detect tables on a batch of pages, returned as index records"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = OptimizedSpatialAnalyzer(enable_parallel=False, cache_size=0)
+    return _worker_analyzer._detect_page_batch(parameters, pages)
+
 # Factory function for easy usage
 def create_spatial_analyzer(enable_parallel: bool = None, 
-                          cache_size: int = 128) -> OptimizedSpatialAnalyzer:
+                          cache_size: int = 128,
+                          parallel_mode: str = 'thread') -> OptimizedSpatialAnalyzer:
     """
     Create optimized spatial analyzer with automatic parallel detection
     
     Args:
         enable_parallel: Enable parallel processing (auto-detect if None)
-        cache_size: LRU cache size for analysis results
+        cache_size: Number of page results kept in the page cache
+        parallel_mode: 'thread', or 'process' for long documents
         
     Returns:
         Configured spatial analyzer
@@ -726,13 +1073,14 @@ def create_spatial_analyzer(enable_parallel: bool = None,
     
     return OptimizedSpatialAnalyzer(
         enable_parallel=enable_parallel,
-        cache_size=cache_size
+        cache_size=cache_size,
+        parallel_mode=parallel_mode
     )
 
 
 # Convenience function for direct usage
 @monitor_performance(cache_ttl=3600)
-def analyze_spatial_structure(elements_data: List[Dict[str, Any]], 
+def analyze_spatial_structure(elements_data: Iterable[Dict[str, Any]], 
                             **kwargs) -> Dict[str, Any]:
     """
     Convenience function for spatial analysis
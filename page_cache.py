@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Page Result Cache
+Bounded, thread-safe LRU cache of per-page table detection results, and the
+page fingerprinting, record and batching scaffolding shared by the spatial
+analyzer and the layout detection engine
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class PageResultCache:
+    """
+    Bounded LRU cache of per-page table detection results
+    
+    Keys are content fingerprints of a page's elements and the detector
+    parameters, so unchanged pages are reused across documents. Values hold
+    element indices rather than elements, keeping no document alive.
+    """
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    def get(self, key: str) -> Optional[List[tuple]]:
+        with self._lock:
+            records = self._entries.get(key)
+            if records is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return records
+    
+    def put(self, key: str, records: List[tuple]):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = records
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+    
+    def evict(self, key: str) -> bool:
+        """Drop one entry; returns whether it was cached"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
+
+
+class PageCachedDetector(ABC):
+    """
+    Per-page table detection through a PageResultCache and an optional pool
+    
+    Base of the spatial analyzer and the layout detection engine, which set
+    page_cache, max_workers and _pool, list the settings that change page
+    results in PARAMETER_NAMES, and implement the abstract hooks:
+    _page_content, _page_payload, _page_from_payload, _detect_page,
+    _table_to_record and _table_from_record. Pages missing from the cache are sent to the pool in
+    batches of compact payloads and come back as element index records.
+    """
+    
+    PARAMETER_NAMES: Tuple[str, ...] = ()
+    BATCHES_PER_WORKER = 4  # Enough batches to even out uneven pages without per-page overhead
+    
+    page_cache: PageResultCache
+    max_workers: int
+    _pool: Optional[Executor] = None
+    
+    def close(self):
+        """Shut down the detector's own pool, if one was started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _cache_parameters(self) -> tuple:
+        """Settings that change page results"""
+        return tuple(getattr(self, name) for name in self.PARAMETER_NAMES)
+    
+    def _page_fingerprint(self, elements: List[Any]) -> str:
+        """Content hash of a page's elements and the settings, ignoring the page number"""
+        hasher = hashlib.sha256(repr(self._cache_parameters()).encode())
+        for chunk in self._page_content(elements):
+            hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def _lookup_page(self, page: int, elements: List[Any]) -> Tuple[str, Optional[List[Any]]]:
+        """Fingerprint of a page and its tables rebuilt from the cache, or None on a miss"""
+        key = self._page_fingerprint(elements)
+        records = self.page_cache.get(key)
+        if records is None:
+            return key, None
+        return key, [self._table_from_record(record, elements, page) for record in records]
+    
+    def _cache_page(self, key: str, elements: List[Any], tables: List[Any]):
+        """Store tables detected on a page as element index records"""
+        self.page_cache.put(key, [self._table_to_record(table, elements) for table in tables])
+    
+    def _lookup_pages(self, pages: Iterable[Tuple[int, List[Any]]]
+                      ) -> Tuple[Dict[int, List[Any]], List[Tuple[int, str, List[Any]]]]:
+        """Tables of cached pages by page, and (page, key, elements) of the pages still to detect"""
+        tables_by_page = {}
+        pending = []
+        for page, elements in pages:
+            key, tables = self._lookup_page(page, elements)
+            if tables is None:
+                pending.append((page, key, elements))
+            else:
+                tables_by_page[page] = tables
+        return tables_by_page, pending
+    
+    def _submit_page_batches(self, executor: Executor, task: Callable[[tuple, List[tuple]], List[List[tuple]]],
+                             pending: List[Tuple[int, str, List[Any]]]) -> List[Tuple[list, Future]]:
+        """Submit pending pages to executor as task(parameters, payloads) batches"""
+        parameters = self._cache_parameters()
+        batch_size = max(1, -(-len(pending) // (self.max_workers * self.BATCHES_PER_WORKER)))
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        return [
+            (batch, executor.submit(task, parameters,
+                                    [self._page_payload(page, elements) for page, _, elements in batch]))
+            for batch in batches
+        ]
+    
+    def _store_page_batch(self, batch: List[Tuple[int, str, List[Any]]], batch_records: List[List[tuple]],
+                          tables_by_page: Dict[int, List[Any]]):
+        """Cache a finished batch's records and rebuild its tables against the local elements"""
+        for (page, key, elements), records in zip(batch, batch_records):
+            self.page_cache.put(key, records)
+            tables_by_page[page] = [self._table_from_record(record, elements, page) for record in records]
+    
+    def _detect_page_batch(self, parameters: tuple, payloads: List[tuple]) -> List[List[tuple]]:
+        """Worker side of _submit_page_batches: detect tables per payload, returned as index records"""
+        for name, value in zip(self.PARAMETER_NAMES, parameters):
+            setattr(self, name, value)
+        
+        results = []
+        for payload in payloads:
+            page, elements = self._page_from_payload(payload)
+            tables = self._detect_page(page, elements)
+            results.append([self._table_to_record(table, elements) for table in tables])
+        return results
+    
+    @abstractmethod
+    def _page_content(self, elements: List[Any]) -> Iterable[bytes]:
+        """Byte strings identifying a page's elements, for the fingerprint"""
+    
+    @abstractmethod
+    def _page_payload(self, page: int, elements: List[Any]) -> tuple:
+        """Picklable form of a page sent to pool workers"""
+    
+    @abstractmethod
+    def _page_from_payload(self, payload: tuple) -> Tuple[int, List[Any]]:
+        """Page number and elements rebuilt from a payload in a worker"""
+    
+    @abstractmethod
+    def _detect_page(self, page: int, elements: List[Any]) -> List[Any]:
+        """Detect the tables among one page's elements"""
+    
+    @staticmethod
+    @abstractmethod
+    def _table_to_record(table: Any, elements: List[Any]) -> tuple:
+        """Store a table by element index"""
+    
+    @staticmethod
+    @abstractmethod
+    def _table_from_record(record: tuple, elements: List[Any], page: int) -> Any:
+        """Rebuild a cached table against a document's elements"""
@@ -8,10 +8,10 @@ import os
 import sys
 import json
 import argparse
-import zipfile
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 import time
 
 # Import custom exceptions and logging
@@ -52,6 +52,10 @@ except ImportError:
     print("Run: pip install pdfservices-sdk")
     sys.exit(1)
 
+from streaming_io import open_upload_stream, save_result_asset, DEFAULT_CHUNK_SIZE
+from extraction_cache import ExtractionCache
+from result_archive import ExtractionArchive
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -59,17 +63,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class SharedUpload:
+    """
+    Uploads a PDF on first use and hands the same asset to every later caller
+
+    Passed as input_asset to several extractions of one PDF, so the file is
+    uploaded at most once and not at all when every extraction is a cache hit.
+    A failed upload is retried by the next caller.
+    """
+
+    def __init__(self, upload: Callable[[str], Any], input_pdf_path: str):
+        self.upload = upload
+        self.input_pdf_path = input_pdf_path
+        self.asset = None
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            if self.asset is None:
+                self.asset = self.upload(self.input_pdf_path)
+            return self.asset
+
+
 class PDFExtractor:
     """Adobe PDF Extract API wrapper for table extraction"""
     
-    def __init__(self, credentials_path: str = "credentials/pdfservices-api-credentials.json"):
+    def __init__(self, credentials_path: str = "credentials/pdfservices-api-credentials.json",
+                 streaming: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 use_mmap: bool = False, cache: Optional[ExtractionCache] = None,
+                 extract_results: bool = False):
         """
         Initialize the PDF extractor
 
         Args:
             credentials_path: Path to Adobe PDF Services API credentials JSON file
+            streaming: Upload from a file handle and write the result ZIP in chunks
+                instead of holding both in memory
+            chunk_size: Maximum bytes buffered per read/write in streaming mode
+            use_mmap: Upload from a memory-mapped buffer in streaming mode
+            cache: Optional content-addressed result cache; repeat extractions
+                of the same PDF bytes and parameters skip the Adobe API
+            extract_results: Unpack the result ZIP to disk; by default results
+                are read straight from the ZIP
         """
         self.credentials_path = credentials_path
+        self.streaming = streaming
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+        self.cache = cache
+        self.extract_results = extract_results
         self.pdf_services = None
         self._setup_credentials()
 
@@ -139,7 +181,8 @@ class PDFExtractor:
         output_dir: str = "output",
         table_format: str = "csv",
         extract_text: bool = True,
-        enable_ocr: bool = True
+        enable_ocr: bool = True,
+        input_asset=None
     ) -> Dict[str, Any]:
         """
         Extract tables and text from a PDF file
@@ -150,6 +193,8 @@ class PDFExtractor:
             table_format: Format for table extraction ('csv' or 'xlsx')
             extract_text: Whether to extract text elements
             enable_ocr: Whether to enable OCR for scanned/image content
+            input_asset: Already uploaded asset for this PDF, or a SharedUpload
+                resolved only on a cache miss; skips the upload
 
         Returns:
             Dictionary with extraction results and file paths
@@ -159,12 +204,35 @@ class PDFExtractor:
         
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Create stream asset from file
-        with open(input_pdf_path, 'rb') as file:
-            input_stream = file.read()
 
-        input_asset = self.pdf_services.upload(input_stream, PDFServicesMediaType.PDF)
+        # Generate output filename
+        pdf_name = Path(input_pdf_path).stem
+        output_zip_path = os.path.join(output_dir, f"{pdf_name}_extracted.zip")
+
+        # Serve repeat extractions of the same bytes and parameters from the cache
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(
+                input_pdf_path, "extract_tables",
+                table_format=table_format,
+                extract_text=extract_text,
+                enable_ocr=enable_ocr
+            )
+            if self.cache.fetch(cache_key, output_zip_path):
+                extracted_files = self._process_extraction_results(output_zip_path, output_dir, pdf_name)
+                return {
+                    "success": True,
+                    "input_file": input_pdf_path,
+                    "output_zip": output_zip_path,
+                    "extracted_files": extracted_files,
+                    "table_format": table_format,
+                    "cache_hit": True
+                }
+        
+        if input_asset is None:
+            input_asset = self.upload_pdf(input_pdf_path)
+        elif isinstance(input_asset, SharedUpload):
+            input_asset = input_asset()
 
         # Configure extraction parameters
         elements_to_extract = [ExtractElementType.TABLES]
@@ -198,17 +266,14 @@ class PDFExtractor:
 
             # Get result asset
             result_asset = pdf_services_response.get_result().get_resource()
-            stream_asset = self.pdf_services.get_content(result_asset)
-
-            # Generate output filename
-            pdf_name = Path(input_pdf_path).stem
-            output_zip_path = os.path.join(output_dir, f"{pdf_name}_extracted.zip")
 
             # Save result
-            with open(output_zip_path, "wb") as file:
-                file.write(stream_asset.get_input_stream())
+            self._save_result(result_asset, output_zip_path)
             
             logger.info(f"Extraction completed: {output_zip_path}")
+
+            if cache_key:
+                self.cache.store(cache_key, output_zip_path)
             
             # Extract and organize the ZIP contents
             extracted_files = self._process_extraction_results(output_zip_path, output_dir, pdf_name)
@@ -218,7 +283,8 @@ class PDFExtractor:
                 "input_file": input_pdf_path,
                 "output_zip": output_zip_path,
                 "extracted_files": extracted_files,
-                "table_format": table_format
+                "table_format": table_format,
+                "cache_hit": False
             }
             
         except Exception as e:
@@ -229,9 +295,47 @@ class PDFExtractor:
                 "input_file": input_pdf_path
             }
     
+    def upload_pdf(self, input_pdf_path: str):
+        """
+        Upload the input PDF to Adobe PDF Services
+
+        Args:
+            input_pdf_path: Path to input PDF file
+
+        Returns:
+            Uploaded input asset
+        """
+        if self.streaming:
+            with open_upload_stream(input_pdf_path, use_mmap=self.use_mmap) as input_stream:
+                return self.pdf_services.upload(input_stream, PDFServicesMediaType.PDF)
+
+        with open(input_pdf_path, 'rb') as file:
+            input_stream = file.read()
+
+        return self.pdf_services.upload(input_stream, PDFServicesMediaType.PDF)
+
+    def _save_result(self, result_asset, output_zip_path: str):
+        """
+        Save the extraction result ZIP to disk
+
+        Args:
+            result_asset: Result asset returned by the extraction job
+            output_zip_path: Destination path for the result ZIP
+        """
+        if self.streaming:
+            save_result_asset(self.pdf_services, result_asset, output_zip_path, self.chunk_size)
+            return
+
+        stream_asset = self.pdf_services.get_content(result_asset)
+        with open(output_zip_path, "wb") as file:
+            file.write(stream_asset.get_input_stream())
+
     def _process_extraction_results(self, zip_path: str, output_dir: str, pdf_name: str) -> Dict[str, str]:
         """
         Process and organize extraction results from ZIP file
+
+        Unless extract_results is set, nothing is unpacked and the returned
+        locations are archive references readable through result_archive.
         
         Args:
             zip_path: Path to the extraction results ZIP file
@@ -239,23 +343,17 @@ class PDFExtractor:
             pdf_name: Name of the original PDF (without extension)
             
         Returns:
-            Dictionary mapping file types to their paths
+            Dictionary mapping file types to their paths or archive references
         """
         extracted_files = {}
         
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Create subdirectory for this PDF's results
-                pdf_output_dir = os.path.join(output_dir, pdf_name)
-                os.makedirs(pdf_output_dir, exist_ok=True)
+            with ExtractionArchive(zip_path) as archive:
+                # Extract into a subdirectory for this PDF's results only when asked to
+                pdf_output_dir = os.path.join(output_dir, pdf_name) if self.extract_results else None
                 
-                # Extract all files
-                zip_ref.extractall(pdf_output_dir)
-                
-                # Organize extracted files
-                for file_name in zip_ref.namelist():
-                    file_path = os.path.join(pdf_output_dir, file_name)
-                    
+                # Organize result files
+                for file_name, file_path in archive.file_refs(pdf_output_dir):
                     if file_name.endswith('.json'):
                         extracted_files['json'] = file_path
                         logger.info(f"JSON data: {file_path}")
@@ -313,12 +411,44 @@ def main():
         default="credentials/pdfservices-api-credentials.json",
         help="Path to Adobe PDF Services API credentials"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the upload and result download with bounded memory"
+    )
+    parser.add_argument(
+        "--chunk-size-kb",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // 1024,
+        help=f"Chunk size for streaming mode in KB (default: {DEFAULT_CHUNK_SIZE // 1024})"
+    )
+    parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="Upload from a memory-mapped buffer in streaming mode"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Reuse cached results for previously extracted PDFs from this directory"
+    )
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Unpack the result ZIP to disk instead of reading results from it"
+    )
     
     args = parser.parse_args()
     
     try:
         # Initialize extractor
-        extractor = PDFExtractor(credentials_path=args.credentials)
+        extractor = PDFExtractor(
+            credentials_path=args.credentials,
+            streaming=args.stream,
+            chunk_size=args.chunk_size_kb * 1024,
+            use_mmap=args.mmap,
+            cache=ExtractionCache(args.cache_dir) if args.cache_dir else None,
+            extract_results=args.extract
+        )
         
         # Extract data
         enable_ocr = args.enable_ocr and not args.no_ocr
@@ -10,7 +10,7 @@ import json
 import logging
 import os
 import pickle
-from typing import Any, Dict, Optional, Callable, Union, List
+from typing import Any, Dict, Optional, Callable, Union, List, Iterator
 from functools import wraps
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
@@ -215,20 +215,28 @@ class PerformanceMonitor:
         Initialize performance monitor
         
         Args:
-            cache: Cache instance to use
+            cache: Cache instance to use (a default SmartCache is created on first use)
             metrics_file: File to store performance metrics
         """
-        self.cache = cache or SmartCache()
+        self._cache = cache
         self.metrics_file = metrics_file or "logs/performance_metrics.json"
         self.metrics_history: List[PerformanceMetrics] = []
         self.profiler = MemoryProfiler()
         
-        # Ensure metrics directory exists
-        os.makedirs(os.path.dirname(self.metrics_file), exist_ok=True)
-        
         # Load existing metrics
         self._load_metrics()
     
+    @property
+    def cache(self) -> SmartCache:
+        """Result cache; created lazily so importing a monitored module writes nothing"""
+        if self._cache is None:
+            self._cache = SmartCache()
+        return self._cache
+    
+    @cache.setter
+    def cache(self, cache: Optional[SmartCache]):
+        self._cache = cache
+    
     def _load_metrics(self):
         """Load existing metrics from file"""
         try:
@@ -246,6 +254,7 @@ class PerformanceMonitor:
         """Save metrics to file"""
         try:
             metrics_data = [metric.to_dict() for metric in self.metrics_history]
+            os.makedirs(os.path.dirname(self.metrics_file) or '.', exist_ok=True)
             with open(self.metrics_file, 'w') as f:
                 json.dump(metrics_data, f, indent=2)
         except Exception as e:
@@ -304,8 +313,8 @@ class PerformanceMonitor:
         cpu_thread.start()
         
         try:
-            # Try cache first if enabled
-            if enable_cache and self.cache:
+            # Try cache first if enabled; one-shot iterators have no stable key
+            if enable_cache and self.cache and not self._has_iterator_argument(args, kwargs):
                 cache_hit, cached_result = self.cache.get(func_name, args, kwargs)
                 if cache_hit:
                     result = cached_result
@@ -366,6 +375,11 @@ class PerformanceMonitor:
         
         return result
     
+    @staticmethod
+    def _has_iterator_argument(args: tuple, kwargs: dict) -> bool:
+        """Check for generators and other iterators, which are consumed by the call"""
+        return any(isinstance(arg, Iterator) for arg in (*args, *kwargs.values()))
+    
     def _estimate_size(self, obj: Any) -> int:
         """Estimate size of object in bytes"""
         try:
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Zero-Extraction Access to Adobe Extraction Result Archives
+Serves structuredData.json, table CSV/XLSX files and rendition PNGs straight
+from the result ZIP, with an opt-in mode that extracts to disk
+"""
+
+import io
+import json
+import logging
+import os
+import zipfile
+from contextlib import contextmanager
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Separates the archive path from the member name in a result reference,
+# e.g. "output/report_extracted.zip!/structuredData.json"
+MEMBER_SEPARATOR = "!/"
+
+
+def member_ref(zip_path: str, member: str) -> str:
+    """Build a reference to a file inside a result archive"""
+    return f"{zip_path}{MEMBER_SEPARATOR}{member}"
+
+
+def split_member_ref(ref: str) -> Tuple[Optional[str], str]:
+    """
+    Split a result reference into archive path and member name
+
+    Returns:
+        (zip_path, member) for archive references, (None, ref) for plain paths
+    """
+    zip_path, separator, member = str(ref).partition(MEMBER_SEPARATOR)
+    if separator and zip_path.lower().endswith('.zip'):
+        return zip_path, member
+    return None, str(ref)
+
+
+def result_exists(ref: str) -> bool:
+    """Check whether a plain path or archive reference points at a file"""
+    zip_path, member = split_member_ref(ref)
+    if zip_path is None:
+        return os.path.exists(member)
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.getinfo(member)
+        return True
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return False
+
+
+@contextmanager
+def open_result(ref: str, mode: str = 'rb', encoding: str = 'utf-8') -> Iterator[IO]:
+    """
+    Open a plain path or archive reference for reading
+
+    Args:
+        ref: File path or archive reference
+        mode: 'rb' for bytes or 'r' for text
+        encoding: Text encoding for mode 'r'
+    """
+    zip_path, member = split_member_ref(ref)
+    if zip_path is None:
+        with open(member, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+        return
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref, zip_ref.open(member) as f:
+        yield f if 'b' in mode else io.TextIOWrapper(f, encoding=encoding)
+
+
+def load_structured_data(ref: str) -> Dict[str, Any]:
+    """Load structuredData.json from a plain path or archive reference"""
+    with open_result(ref, 'rb') as f:
+        return json.load(f)
+
+
+def materialize(ref: str, dest_dir: Optional[str] = None, whole_archive: bool = False) -> str:
+    """
+    Get a disk path for a result, extracting from its archive if needed
+
+    Args:
+        ref: File path or archive reference
+        dest_dir: Directory that archive members are extracted under;
+            defaults to the ZIP path without its extension
+        whole_archive: Extract every member, for consumers that also read
+            neighbouring files such as the figures directory
+
+    Returns:
+        Path of the file on disk
+    """
+    zip_path, member = split_member_ref(ref)
+    if zip_path is None:
+        return member
+    dest_dir = dest_dir or os.path.splitext(zip_path)[0]
+    with ExtractionArchive(zip_path) as archive:
+        if whole_archive:
+            archive.extract_all(dest_dir)
+            return os.path.join(dest_dir, member)
+        return archive.extract(member, dest_dir)
+
+
+class ExtractionArchive:
+    """
+    Read-only view of an Adobe extraction result ZIP
+
+    Members are decompressed only when asked for; nothing is written to disk
+    unless extract or extract_all is called.
+    """
+
+    def __init__(self, zip_path: str):
+        """
+        Open result archive
+
+        Args:
+            zip_path: Path to the extraction result ZIP
+        """
+        self.zip_path = zip_path
+        self.zip_file = zipfile.ZipFile(zip_path, 'r')
+        self._structured_data: Optional[Dict[str, Any]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the archive"""
+        self.zip_file.close()
+
+    def namelist(self) -> List[str]:
+        """Names of all files in the archive"""
+        return [name for name in self.zip_file.namelist() if not name.endswith('/')]
+
+    def ref(self, member: str) -> str:
+        """Reference to a member, usable with open_result and load_structured_data"""
+        return member_ref(self.zip_path, member)
+
+    @property
+    def json_member(self) -> Optional[str]:
+        """Name of the structured data JSON, if present"""
+        for name in self.namelist():
+            if name.endswith('.json'):
+                return name
+        return None
+
+    def table_files(self, extension: str = '.csv') -> List[str]:
+        """Table files of one type, e.g. '.csv', '.xlsx' or '.png' renditions"""
+        return [name for name in self.namelist() if 'tables/' in name and name.endswith(extension)]
+
+    def figure_files(self) -> List[str]:
+        """Figure rendition PNGs"""
+        return [name for name in self.namelist() if 'figures/' in name and name.endswith('.png')]
+
+    def size(self, member: str) -> int:
+        """Uncompressed size of a member in bytes"""
+        return self.zip_file.getinfo(member).file_size
+
+    def open(self, member: str) -> IO[bytes]:
+        """Open a member as a binary file object"""
+        return self.zip_file.open(member)
+
+    def read(self, member: str) -> bytes:
+        """Read a member into memory"""
+        return self.zip_file.read(member)
+
+    def structured_data(self) -> Dict[str, Any]:
+        """Parsed structuredData.json, loaded once per archive"""
+        if self._structured_data is None:
+            member = self.json_member
+            if member is None:
+                raise FileNotFoundError(f"No structured data JSON in {self.zip_path}")
+            with self.open(member) as f:
+                self._structured_data = json.load(f)
+        return self._structured_data
+
+    def read_table(self, member: str):
+        """Load a table CSV or XLSX into a pandas DataFrame"""
+        import pandas as pd
+
+        data = io.BytesIO(self.read(member))
+        if member.endswith('.xlsx'):
+            return pd.read_excel(data)
+        return pd.read_csv(data)
+
+    def extract(self, member: str, dest_dir: str) -> str:
+        """
+        Extract one member to disk
+
+        Returns:
+            Path of the extracted file
+        """
+        return self.zip_file.extract(member, dest_dir)
+
+    def extract_all(self, dest_dir: str) -> List[str]:
+        """
+        Extract every member to disk
+
+        Returns:
+            Paths of the extracted files
+        """
+        self.zip_file.extractall(dest_dir)
+        return [os.path.join(dest_dir, name) for name in self.namelist()]
+
+    def file_refs(self, dest_dir: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        Pair each member with the location consumers should read it from
+
+        Args:
+            dest_dir: Extract everything here and return disk paths; by
+                default members stay in the archive and archive references
+                are returned
+
+        Returns:
+            (member name, path or archive reference) pairs
+        """
+        if dest_dir is None:
+            return [(name, self.ref(name)) for name in self.namelist()]
+
+        os.makedirs(dest_dir, exist_ok=True)
+        self.extract_all(dest_dir)
+        return [(name, os.path.join(dest_dir, name)) for name in self.namelist()]
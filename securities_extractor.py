@@ -12,6 +12,8 @@ from PIL import Image
 # import pytesseract  # Not needed for this analysis
 import logging
 
+from structured_data_reader import StructuredDataReader
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -28,14 +30,20 @@ class SecuritiesExtractor:
         self.structured_data = None
         self.all_securities = []
         
-    def load_data(self):
-        """Load structured data"""
-        if not os.path.exists(self.json_file):
-            logger.error("JSON file not found")
-            return False
+    def load_data(self, elements=None):
+        """
+        Load structured data
+        
+        Only text elements are kept, streamed from json_file unless an
+        element iterable such as a StructuredDataReader is given.
+        """
+        if elements is None:
+            if not os.path.exists(self.json_file):
+                logger.error("JSON file not found")
+                return False
+            elements = StructuredDataReader(self.json_file, text_only=True)
         
-        with open(self.json_file, 'r', encoding='utf-8') as f:
-            self.structured_data = json.load(f)
+        self.structured_data = {'elements': [elem for elem in elements if elem.get('Text')]}
         
         return True
     
@@ -283,9 +291,9 @@ class SecuritiesExtractor:
         
         return securities
     
-    def create_comprehensive_securities_report(self):
-        """Create comprehensive report of ALL securities found"""
-        if not self.load_data():
+    def create_comprehensive_securities_report(self, elements=None):
+        """Create comprehensive report of ALL securities found, optionally from already streamed elements"""
+        if not self.load_data(elements):
             return None
         
         # Extract all data
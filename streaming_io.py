@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Streaming I/O helpers for Adobe PDF Services uploads and downloads
+Keeps per-job memory bounded by a chunk size instead of by document size
+"""
+
+import os
+import mmap
+import logging
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Default chunk size for result downloads (1 MB)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Timeout for result downloads: (connect, read) in seconds
+DOWNLOAD_TIMEOUT = (10, 120)
+
+
+@contextmanager
+def open_upload_stream(pdf_path: str, use_mmap: bool = False) -> Iterator[Union[BinaryIO, mmap.mmap]]:
+    """
+    Open a PDF for upload without reading it into memory
+
+    The SDK hands the stream to ``requests``, which reads file-like bodies
+    block by block, so only one block is resident at a time.
+
+    Args:
+        pdf_path: Path to the PDF file
+        use_mmap: Upload from a read-only memory-mapped buffer instead of a file handle
+
+    Yields:
+        File handle or memory-mapped buffer positioned at the start of the PDF
+    """
+    with open(pdf_path, 'rb') as file:
+        # mmap cannot map empty files, fall back to the plain handle
+        if use_mmap and os.fstat(file.fileno()).st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+        else:
+            yield file
+
+
+def save_result_asset(pdf_services: Any, result_asset: Any, output_path: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Write an extraction result asset to disk in chunks
+
+    Downloads straight from the asset's pre-signed download URI when the SDK
+    exposes one. Otherwise falls back to ``pdf_services.get_content``, which
+    buffers the whole result in memory.
+
+    Args:
+        pdf_services: Authenticated PDFServices client
+        result_asset: Result asset returned by the extraction job
+        output_path: Destination path for the result ZIP
+        chunk_size: Maximum number of bytes held in memory at once
+
+    Returns:
+        Number of bytes written
+    """
+    get_download_uri = getattr(result_asset, 'get_download_uri', None)
+    download_uri = get_download_uri() if callable(get_download_uri) else None
+
+    # Write to a temporary file first so a failed download never leaves a truncated ZIP
+    temp_path = f"{output_path}.part"
+    bytes_written = 0
+
+    try:
+        with open(temp_path, 'wb') as file:
+            if isinstance(download_uri, str) and download_uri:
+                with requests.get(download_uri, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            file.write(chunk)
+                            bytes_written += len(chunk)
+            else:
+                logger.debug("Result asset has no download URI, using buffered SDK download")
+                content = pdf_services.get_content(result_asset).get_input_stream()
+                file.write(content)
+                bytes_written = len(content)
+
+        os.replace(temp_path, output_path)
+
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return bytes_written
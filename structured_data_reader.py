@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Streaming Reader for Adobe structuredData.json
+Yields document elements one at a time, optionally filtered by page or Path,
+without loading the whole document into memory
+"""
+
+import json
+import logging
+import os
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from result_archive import open_result, split_member_ref
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_SIZE = 64 * 1024
+_WHITESPACE = ' \t\n\r'
+
+
+class AdobeElement(TypedDict, total=False):
+    """One entry of the structuredData.json elements array"""
+    Text: str
+    Page: int
+    Path: str
+    Bounds: List[float]
+    TextSize: float
+    Font: Dict[str, Any]
+
+
+class _ElementScanner:
+    """
+    Incremental scanner for the top-level elements array
+
+    Decodes one array item at a time from a bounded text buffer; values of
+    other top-level keys are skipped and nothing after the elements array
+    is read.
+    """
+
+    def __init__(self, stream, read_size: int = DEFAULT_READ_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def elements(self) -> Iterator[Dict[str, Any]]:
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == 'elements':
+                self._expect('[')
+                if self._peek() == ']':
+                    return
+                while True:
+                    yield self._value()
+                    separator = self._peek()
+                    self.pos += 1
+                    if separator == ']':
+                        return
+                    if separator != ',':
+                        raise json.JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+            self._value()
+            separator = self._peek()
+            self.pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+
+class StructuredDataReader:
+    """
+    Re-iterable stream of elements from a structuredData.json file
+
+    Each iteration re-reads the file, so memory use is bounded by the
+    largest single element rather than the document. Uses ijson when it is
+    installed and a built-in incremental decoder otherwise.
+    """
+
+    def __init__(self, source: str, pages: Optional[Iterable[int]] = None,
+                 path_prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+                 text_only: bool = False, read_size: int = DEFAULT_READ_SIZE):
+        """
+        Initialize reader
+
+        Args:
+            source: structuredData.json path or result archive reference
+            pages: Only yield elements on these pages
+            path_prefix: Only yield elements whose Path starts with this
+                prefix or any of these prefixes, e.g. '//Document/Table'
+            text_only: Only yield elements with non-empty Text
+            read_size: Characters read from the file per chunk
+        """
+        self.source = source
+        self.pages = frozenset(pages) if pages is not None else None
+        self.path_prefix = path_prefix
+        self.text_only = text_only
+        self.read_size = read_size
+
+    def __iter__(self) -> Iterator[AdobeElement]:
+        for element in self._raw_elements():
+            if self._matches(element):
+                yield element
+
+    def __repr__(self) -> str:
+        # Identifies file contents and filters, so results cached by argument
+        # repr (e.g. monitor_performance) are reused only for the same input
+        zip_path, member = split_member_ref(self.source)
+        try:
+            stat = os.stat(zip_path or member)
+            version = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            version = "missing"
+        pages = sorted(self.pages) if self.pages is not None else None
+        return (f"StructuredDataReader({self.source!r}, version={version}, pages={pages}, "
+                f"path_prefix={self.path_prefix!r}, text_only={self.text_only})")
+
+    def _matches(self, element: Dict[str, Any]) -> bool:
+        if self.text_only and not (element.get('Text') or '').strip():
+            return False
+        if self.pages is not None and element.get('Page') not in self.pages:
+            return False
+        if self.path_prefix and not (element.get('Path') or '').startswith(self.path_prefix):
+            return False
+        return True
+
+    def _raw_elements(self) -> Iterator[Dict[str, Any]]:
+        if ijson is not None:
+            with open_result(self.source, 'rb') as f:
+                yield from ijson.items(f, 'elements.item', use_float=True)
+            return
+
+        with open_result(self.source, 'r') as f:
+            yield from _ElementScanner(f, self.read_size).elements()
+
+    def iter_pages(self) -> Iterator[Tuple[int, List[AdobeElement]]]:
+        """
+        Yield (page, elements) groups of consecutive elements
+
+        Adobe writes elements in reading order, which is mostly page by page,
+        so only one group is held in memory at a time. Elements such as
+        figures or footnotes can revisit an earlier page, in which case that
+        page is yielded again; use the pages filter to collect one page.
+        """
+        for page, elements in groupby(self, key=lambda element: element.get('Page', 0)):
+            yield page, list(elements)
+
+
+def iter_elements(source: str, pages: Optional[Iterable[int]] = None,
+                  path_prefix: Optional[Union[str, Tuple[str, ...]]] = None,
+                  text_only: bool = False) -> Iterator[AdobeElement]:
+    """
+    Stream elements from a structuredData.json file
+
+    Args:
+        source: structuredData.json path or result archive reference
+        pages: Only yield elements on these pages
+        path_prefix: Only yield elements whose Path starts with this prefix
+        text_only: Only yield elements with non-empty Text
+
+    Returns:
+        Iterator over matching elements
+    """
+    return iter(StructuredDataReader(source, pages=pages, path_prefix=path_prefix, text_only=text_only))
@@ -22,6 +22,7 @@ try:
     from complete_data_extractor import CompleteDataExtractor
     from securities_extractor import SecuritiesExtractor
     from human_validation_interface import HumanValidationInterface
+    from result_archive import materialize
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure all enhanced modules are available")
@@ -104,7 +105,7 @@ class ComprehensiveExtractionTester:
                 # Mock the paths based on enhanced extraction results
                 extracted_files = enhanced_result.get('extracted_files', {})
                 if 'json' in extracted_files:
-                    json_path = extracted_files['json']
+                    json_path = materialize(extracted_files['json'], whole_archive=True)
                     output_dir = os.path.dirname(json_path)
                     
                     # Update paths for complete extractor
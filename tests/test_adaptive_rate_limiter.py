@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the adaptive AIMD rate controller
+"""
+
+import pytest
+import asyncio
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from adaptive_rate_limiter import AdaptiveRateController, AdaptiveRateConfig
+
+
+def make_controller(**overrides):
+    """Create a controller with a small, fast configuration"""
+    settings = dict(initial_rate_per_minute=60, min_rate_per_minute=5, max_rate_per_minute=120,
+                    initial_concurrency=2, min_concurrency=1, max_concurrency=4)
+    settings.update(overrides)
+    return AdaptiveRateController(AdaptiveRateConfig(**settings))
+
+
+class TestAdaptiveRateController:
+    """Test cases for AdaptiveRateController"""
+
+    def test_additive_increase_on_stable_latency(self):
+        """Test limits grow after a round of jobs with steady latency"""
+        controller = make_controller()
+
+        for _ in range(2):
+            controller.record_outcome(1.0)
+
+        assert controller.rate_per_minute == 62
+        assert controller.concurrency_limit == 3
+        assert controller.stats['increases'] == 1
+
+    def test_multiplicative_decrease_on_throttling(self):
+        """Test a throttling response halves the limits once per burst"""
+        controller = make_controller(initial_concurrency=4)
+
+        controller.record_outcome(1.0, throttled=True)
+        controller.record_outcome(1.0, throttled=True)
+
+        assert controller.rate_per_minute == 30
+        assert controller.concurrency_limit == 2
+        assert controller.stats['decreases'] == 1
+        assert controller.stats['throttle_events'] == 2
+
+    def test_backs_off_when_latency_rises(self):
+        """Test rising p95 latency reduces the rate"""
+        controller = make_controller(initial_concurrency=1, max_concurrency=1)
+
+        controller.record_outcome(1.0)
+        rate_after_baseline = controller.rate_per_minute
+        for _ in range(5):
+            controller.record_outcome(10.0)
+
+        assert controller.rate_per_minute < rate_after_baseline
+
+    def test_static_mode_keeps_limits(self):
+        """Test non-adaptive mode never changes limits"""
+        controller = make_controller(adaptive=False)
+
+        controller.record_outcome(1.0, throttled=True)
+        for _ in range(10):
+            controller.record_outcome(1.0)
+
+        assert controller.rate_per_minute == 60
+        assert controller.concurrency_limit == 2
+
+    def test_is_throttling_error(self):
+        """Test throttling detection from error messages"""
+        assert AdaptiveRateController.is_throttling_error("HTTP 429 Too Many Requests")
+        assert AdaptiveRateController.is_throttling_error(Exception("Rate limit exceeded"))
+        assert not AdaptiveRateController.is_throttling_error("File not found")
+        assert not AdaptiveRateController.is_throttling_error(None)
+
+    def test_concurrency_cap(self):
+        """Test no more than the concurrency limit run at once"""
+        controller = make_controller(initial_rate_per_minute=6000, max_rate_per_minute=6000,
+                                     initial_concurrency=2, adaptive=False)
+        peak = 0
+
+        async def job():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await asyncio.gather(*(job() for _ in range(6)))
+
+        asyncio.run(run())
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    def test_cancelled_while_paced_releases_slot(self):
+        """Test a job cancelled before its paced start frees its concurrency slot"""
+        controller = make_controller(initial_rate_per_minute=60, adaptive=False)
+
+        async def run():
+            await controller.acquire()
+            waiting = asyncio.ensure_future(controller.acquire())
+            await asyncio.sleep(0.05)
+            assert controller.in_flight == 2
+
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            return controller.in_flight
+
+        assert asyncio.run(run()) == 1
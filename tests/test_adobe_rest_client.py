@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the async Adobe REST client against a local mock API
+"""
+
+import pytest
+import asyncio
+import os
+import tempfile
+import time
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from aiohttp import web
+
+from adobe_rest_client import AdobeRESTClient
+from token_manager import AccessToken
+from job_poller import PollPolicy
+import adobe_rest_client
+from exceptions import APIAuthenticationError, TemporaryAPIError, ExtractionError
+
+
+class MockPDFServices:
+    """Minimal stand-in for IMS and the PDF Services REST API"""
+
+    def __init__(self, polls_until_done=2, job_status="done", submit_status=201, response_delay=0.0):
+        self.polls_until_done = polls_until_done
+        self.job_status = job_status
+        self.submit_status = submit_status
+        self.response_delay = response_delay
+        self.token_requests = 0
+        self.polls = 0
+        self.uploaded = b''
+        self.peers = set()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.base_url = None
+
+    def app(self):
+        @web.middleware
+        async def count_in_flight(request, handler):
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(self.response_delay)
+                return await handler(request)
+            finally:
+                self.in_flight -= 1
+
+        app = web.Application(middlewares=[count_in_flight])
+        app.router.add_post('/ims/token', self.token)
+        app.router.add_post('/assets', self.create_asset)
+        app.router.add_put('/upload/{asset_id}', self.upload)
+        app.router.add_post('/operation/{operation}', self.submit)
+        app.router.add_get('/jobs/{job_id}', self.status)
+        app.router.add_get('/download/{job_id}', self.download)
+        return app
+
+    def _track(self, request):
+        self.peers.add(request.transport.get_extra_info('peername'))
+
+    async def token(self, request):
+        self._track(request)
+        self.token_requests += 1
+        return web.json_response({'access_token': 'token-123', 'expires_in': 86399})
+
+    async def create_asset(self, request):
+        self._track(request)
+        if request.headers.get('Authorization') != 'Bearer token-123':
+            return web.Response(status=401)
+        return web.json_response({'assetID': 'asset-1', 'uploadUri': f"{self.base_url}/upload/asset-1"})
+
+    async def upload(self, request):
+        self._track(request)
+        self.uploaded = await request.read()
+        return web.Response(status=200)
+
+    async def submit(self, request):
+        self._track(request)
+        if self.submit_status != 201:
+            return web.Response(status=self.submit_status, headers={'Retry-After': '7'}, text="slow down")
+        payload = await request.json()
+        assert payload['assetID'] == 'asset-1'
+        return web.Response(status=201, headers={'location': f"{self.base_url}/jobs/job-1"})
+
+    async def status(self, request):
+        self._track(request)
+        self.polls += 1
+        if self.polls < self.polls_until_done:
+            return web.json_response({'status': 'in progress'})
+        if self.job_status == 'failed':
+            return web.json_response({'status': 'failed', 'error': {'code': 'BAD_PDF'}})
+        return web.json_response({'status': 'done', 'content': {'downloadUri': f"{self.base_url}/download/job-1"}})
+
+    async def download(self, request):
+        self._track(request)
+        return web.Response(body=b'PK\x03\x04 result' * 1000)
+
+
+async def run_with_mock(mock, scenario):
+    """Serve the mock API locally and run a scenario against it"""
+    runner = web.AppRunner(mock.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    mock.base_url = f"http://127.0.0.1:{port}"
+
+    original_ims_url = adobe_rest_client.IMS_TOKEN_URL
+    adobe_rest_client.IMS_TOKEN_URL = f"{mock.base_url}/ims/token"
+    try:
+        client = AdobeRESTClient('client-id', 'secret', base_url=mock.base_url,
+                                 max_connections_per_host=2,
+                                 poll_policy=PollPolicy(initial_interval=0.01, max_interval=0.02))
+        async with client:
+            return await scenario(client)
+    finally:
+        adobe_rest_client.IMS_TOKEN_URL = original_ims_url
+        await runner.cleanup()
+
+
+@pytest.fixture
+def pdf_file():
+    """Temporary PDF to upload"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = os.path.join(temp_dir, "statement.pdf")
+        with open(pdf_path, 'wb') as f:
+            f.write(b'%PDF-1.4\n' + b'x' * 4096)
+        yield temp_dir, pdf_path
+
+
+class TestAdobeRESTClient:
+    """Test cases for AdobeRESTClient"""
+
+    def test_run_job_end_to_end(self, pdf_file):
+        """Test upload, submit, poll and download over one pooled session"""
+        temp_dir, pdf_path = pdf_file
+        output_path = os.path.join(temp_dir, "result.zip")
+        mock = MockPDFServices(polls_until_done=3)
+
+        result = asyncio.run(run_with_mock(
+            mock, lambda client: client.run_job(pdf_path, "extractpdf", output_path, {"elementsToExtract": ["text"]})
+        ))
+
+        assert result == output_path
+        with open(output_path, 'rb') as f:
+            assert f.read().startswith(b'PK\x03\x04')
+        with open(pdf_path, 'rb') as f:
+            assert mock.uploaded == f.read()
+        assert mock.polls == 3
+        assert mock.token_requests == 1
+        assert not os.path.exists(output_path + ".part")
+
+    def test_concurrent_jobs_share_bounded_pool(self, pdf_file):
+        """Test many jobs reuse a fixed number of keep-alive connections"""
+        temp_dir, pdf_path = pdf_file
+        mock = MockPDFServices(polls_until_done=1, response_delay=0.005)
+
+        async def scenario(client):
+            jobs = [client.run_job(pdf_path, "extractpdf", os.path.join(temp_dir, f"r{i}.zip"))
+                    for i in range(10)]
+            return await asyncio.gather(*jobs)
+
+        results = asyncio.run(run_with_mock(mock, scenario))
+
+        # Never more than two requests at once, over connections that are kept
+        # alive (the server may still see one replaced)
+        assert len(results) == 10
+        assert mock.max_in_flight == 2
+        assert len(mock.peers) <= mock.requests // 10
+        assert mock.token_requests == 1
+
+    def test_throttling_maps_to_temporary_error(self, pdf_file):
+        """Test 429 responses raise a retryable error with Retry-After"""
+        _, pdf_path = pdf_file
+        mock = MockPDFServices(submit_status=429)
+
+        async def scenario(client):
+            asset_id = await client.upload(pdf_path)
+            return await client.submit("extractpdf", {"assetID": asset_id})
+
+        with pytest.raises(TemporaryAPIError) as exc_info:
+            asyncio.run(run_with_mock(mock, scenario))
+        assert exc_info.value.retry_after == 7
+        assert "429" in str(exc_info.value)
+
+    def test_failed_job_raises(self, pdf_file):
+        """Test a failed job surfaces as an extraction error"""
+        temp_dir, pdf_path = pdf_file
+        mock = MockPDFServices(polls_until_done=1, job_status="failed")
+
+        with pytest.raises(ExtractionError):
+            asyncio.run(run_with_mock(
+                mock, lambda client: client.run_job(pdf_path, "extractpdf", os.path.join(temp_dir, "r.zip"))
+            ))
+
+    def test_rejected_credentials(self, pdf_file):
+        """Test 401 responses raise an authentication error"""
+        _, pdf_path = pdf_file
+        mock = MockPDFServices()
+
+        async def scenario(client):
+            client.token_manager.token = AccessToken("stale", time.time() + 3600)
+            return await client.upload(pdf_path)
+
+        with pytest.raises(APIAuthenticationError):
+            asyncio.run(run_with_mock(mock, scenario))
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the async batch processor, with a stub extractor in place of the Adobe SDK
+"""
+
+import pytest
+import asyncio
+import glob
+import json
+import os
+import threading
+import time
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import async_batch_processor
+from async_batch_processor import AsyncBatchProcessor, BatchJobConfig
+from batch_scheduler import simulate_makespan
+
+
+class StubExtractor:
+    """PDF extractor that returns a canned result without calling the API"""
+
+    def __init__(self, credentials_path, cache=None, extract_results=False):
+        self.credentials_path = credentials_path
+
+    def extract_tables(self, input_pdf_path, output_dir, table_format, extract_text, enable_ocr):
+        return {'success': True, 'extracted_files': {'json': os.path.join(output_dir, 'structuredData.json')}}
+
+
+class SharedClientExtractor(StubExtractor):
+    """Stub extractor that records its instances and the client and thread of every job"""
+
+    instances = []
+
+    def __init__(self, credentials_path, cache=None, extract_results=False):
+        super().__init__(credentials_path, cache, extract_results)
+        self.pdf_services = object()
+        self.calls = []
+        self.instances.append(self)
+
+    def extract_tables(self, input_pdf_path, output_dir, table_format, extract_text, enable_ocr):
+        time.sleep(0.02)
+        self.calls.append((id(self.pdf_services), threading.current_thread()))
+        return super().extract_tables(input_pdf_path, output_dir, table_format, extract_text, enable_ocr)
+
+
+class RecordingExtractor(StubExtractor):
+    """Stub extractor that takes a set time per file and records concurrency"""
+
+    durations = {}
+    default_duration = 0.02
+
+    def __init__(self, credentials_path, cache=None, extract_results=False):
+        super().__init__(credentials_path, cache, extract_results)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak_active = 0
+        self.events = []
+
+    def extract_tables(self, input_pdf_path, output_dir, table_format, extract_text, enable_ocr):
+        name = os.path.basename(input_pdf_path)
+        with self.lock:
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            self.events.append(('start', name))
+        time.sleep(self.durations.get(name, self.default_duration))
+        with self.lock:
+            self.active -= 1
+            self.events.append(('finish', name))
+        return super().extract_tables(input_pdf_path, output_dir, table_format, extract_text, enable_ocr)
+
+
+def make_pdfs(tmp_path, count):
+    """Placeholder PDF files; the stub extractors never read them"""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"statement_{i}.pdf"
+        path.write_bytes(b"%PDF-1.4\n")
+        paths.append(str(path))
+    return paths
+
+
+def read_report_lines(processor):
+    """Records of the batch's JSONL results file"""
+    results_file, = glob.glob(os.path.join(processor.config.output_base_dir, 'batch_results_*.jsonl'))
+    with open(results_file, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def make_processor(tmp_path, monkeypatch, extractor_class=StubExtractor, **overrides):
+    """Batch processor writing under tmp_path, with its extractor replaced"""
+    monkeypatch.setattr(async_batch_processor, 'PDFExtractor', extractor_class)
+    settings = dict(enable_caching=False, output_base_dir=str(tmp_path / 'output'),
+                    rate_limit_per_minute=60000, max_rate_per_minute=60000)
+    settings.update(overrides)
+    return AsyncBatchProcessor(str(tmp_path / 'credentials.json'), BatchJobConfig(**settings))
+
+
+class TestAsyncBatchProcessor:
+    """Test cases for AsyncBatchProcessor"""
+
+    def test_concurrency_ceiling_defaults_to_max_concurrent_jobs(self, tmp_path, monkeypatch):
+        """Test adaptive concurrency cannot grow unless a ceiling is configured"""
+        processor = make_processor(tmp_path, monkeypatch, max_concurrent_jobs=3)
+
+        assert processor.throttler.concurrency_limit == 3
+        assert processor.throttler.config.max_concurrency == 3
+        assert processor.processor.max_workers == 3
+
+    def test_concurrency_ceiling_sizes_limiter_and_pool(self, tmp_path, monkeypatch):
+        """Test concurrency starts at max_concurrent_jobs and may grow to the ceiling"""
+        processor = make_processor(tmp_path, monkeypatch, max_concurrent_jobs=3, max_concurrent_jobs_ceiling=8,
+                                   adaptive_rate_limit=True)
+
+        assert processor.throttler.concurrency_limit == 3
+        assert processor.throttler.config.max_concurrency == 8
+        assert processor.processor.max_workers == 8
+
+    def test_sliding_window_bounds_in_flight_jobs(self, tmp_path, monkeypatch):
+        """Test at most max_concurrent_jobs run, and a free slot is refilled without waiting for the slowest job"""
+        pdf_files = make_pdfs(tmp_path, 8)
+        monkeypatch.setattr(RecordingExtractor, 'durations', {'statement_0.pdf': 0.4})
+        processor = make_processor(tmp_path, monkeypatch, RecordingExtractor, max_concurrent_jobs=2)
+        original = processor.processor.process_pdf_async
+        jobs = {'in_flight': 0, 'peak': 0}
+
+        async def counting_process(pdf_path, config):
+            jobs['in_flight'] += 1
+            jobs['peak'] = max(jobs['peak'], jobs['in_flight'])
+            try:
+                return await original(pdf_path, config)
+            finally:
+                jobs['in_flight'] -= 1
+
+        monkeypatch.setattr(processor.processor, 'process_pdf_async', counting_process)
+
+        report = asyncio.run(processor.process_batch(pdf_files))
+
+        extractor = processor.extractor
+        assert report.successful_extractions == 8
+        assert jobs['peak'] == 2
+        assert extractor.peak_active == 2
+        # Every other file ran in the second slot while the slow first file held the other
+        slow_finish = extractor.events.index(('finish', 'statement_0.pdf'))
+        assert all(extractor.events.index(('finish', os.path.basename(path))) < slow_finish
+                   for path in pdf_files[1:])
+
+    def test_results_streamed_per_job(self, tmp_path, monkeypatch):
+        """Test each result is in the JSONL file before the next job starts"""
+        pdf_files = make_pdfs(tmp_path, 4)
+        line_counts = []
+
+        class PeekingExtractor(StubExtractor):
+            def extract_tables(self, input_pdf_path, output_dir, table_format, extract_text, enable_ocr):
+                line_counts.append(len(read_report_lines(processor)))
+                return super().extract_tables(input_pdf_path, output_dir, table_format, extract_text, enable_ocr)
+
+        processor = make_processor(tmp_path, monkeypatch, PeekingExtractor, max_concurrent_jobs=1)
+
+        report = asyncio.run(processor.process_batch(pdf_files))
+        records = read_report_lines(processor)
+
+        # The batch_start line, then one more line per finished job
+        assert line_counts == [1, 2, 3, 4]
+        assert [record['type'] for record in records] == ['batch_start'] + ['result'] * 4 + ['batch_summary']
+        assert [record['pdf_path'] for record in records[1:-1]] == pdf_files
+        assert all(record['success'] for record in records[1:-1])
+        assert records[-1]['successful_extractions'] == 4
+        assert report.results_file.endswith('.jsonl')
+
+    def test_makespan_replayed_from_results_file(self, tmp_path, monkeypatch):
+        """Test the FIFO comparison replays the processing times recorded in this run's result lines"""
+        pdf_files = make_pdfs(tmp_path, 5)
+        processor = make_processor(tmp_path, monkeypatch, RecordingExtractor, max_concurrent_jobs=2)
+
+        report = asyncio.run(processor.process_batch(pdf_files))
+        durations = {record['pdf_path']: record['processing_time']
+                     for record in read_report_lines(processor) if record['type'] == 'result'}
+
+        assert set(durations) == set(pdf_files)
+        assert report.scheduling_stats['fifo_makespan_seconds'] == \
+            simulate_makespan([durations[path] for path in pdf_files], 2)
+        assert report.scheduling_stats['makespan_seconds'] > 0
+
+    def test_report_survives_interrupted_run(self, tmp_path, monkeypatch):
+        """Test results written before an interruption are complete, synced lines and the run resumes after them"""
+        pdf_files = make_pdfs(tmp_path, 6)
+        synced = []
+        real_fsync = os.fsync
+
+        def recording_fsync(fd):
+            real_fsync(fd)
+            synced.append(os.fstat(fd).st_size)
+
+        monkeypatch.setattr(async_batch_processor.os, 'fsync', recording_fsync)
+        monkeypatch.setattr(RecordingExtractor, 'default_duration', 0.05)
+        processor = make_processor(tmp_path, monkeypatch, RecordingExtractor, max_concurrent_jobs=1)
+
+        async def interrupt_after_two_results():
+            batch = asyncio.ensure_future(processor.process_batch(pdf_files))
+            while len(synced) < 3:
+                await asyncio.sleep(0.005)
+            batch.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+
+        asyncio.run(interrupt_after_two_results())
+        records = read_report_lines(processor)
+        results_file, = glob.glob(os.path.join(processor.config.output_base_dir, 'batch_results_*.jsonl'))
+
+        # Every line was synced as written; no summary, since the batch never finished
+        assert synced[-1] == os.path.getsize(results_file)
+        assert [record['type'] for record in records] == ['batch_start'] + ['result'] * (len(records) - 1)
+        finished = [record['pdf_path'] for record in records[1:]]
+        assert finished == pdf_files[:len(finished)]
+        assert 2 <= len(finished) < len(pdf_files)
+
+        resumed = make_processor(tmp_path, monkeypatch, RecordingExtractor, max_concurrent_jobs=1)
+        report = asyncio.run(resumed.process_batch(pdf_files, resume=True))
+
+        assert report.skipped_files == len(finished)
+        assert report.successful_extractions == len(pdf_files) - len(finished)
+
+    def test_jobs_share_executor_and_client(self, tmp_path, monkeypatch):
+        """Test every job of a session runs on one bounded thread pool with one SDK client, and is counted"""
+        monkeypatch.setattr(SharedClientExtractor, 'instances', [])
+        pdf_files = make_pdfs(tmp_path, 9)
+        processor = make_processor(tmp_path, monkeypatch, SharedClientExtractor, max_concurrent_jobs=3)
+
+        async def run():
+            async with processor.batch_session():
+                executor = processor.processor.executor
+                reports = [await processor.process_batch(pdf_files[:5]), await processor.process_batch(pdf_files[5:])]
+                assert processor.processor.executor is executor
+                return reports
+
+        first, second = asyncio.run(run())
+        extractor, = SharedClientExtractor.instances
+        clients = {client for client, _ in extractor.calls}
+        threads = {thread for _, thread in extractor.calls}
+
+        assert len(extractor.calls) == 9
+        assert clients == {id(extractor.pdf_services)}
+        assert len(threads) <= 3
+        assert all(thread.name.startswith('pdf_extraction') for thread in threads)
+        assert processor.processor.executor is None
+
+        for report, jobs in [(first, 5), (second, 4)]:
+            stats = report.executor_stats
+            assert stats['max_workers'] == 3
+            assert stats['submitted'] == stats['completed'] == jobs
+            assert 1 <= stats['peak_active'] <= 3
+            assert stats['busy_time'] > 0
+            assert 0 < stats['utilization'] <= 1
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for size-aware batch scheduling
+"""
+
+import pytest
+import os
+import tempfile
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from batch_scheduler import (
+    SchedulingPolicy, CostMetric, plan_jobs, simulate_makespan, compare_to_fifo, estimate_page_count
+)
+
+
+@pytest.fixture
+def pdf_dirs():
+    """Two source directories with PDFs of different sizes"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths = {}
+        for folder, name, size_kb in [("a", "small", 10), ("a", "large", 90), ("a", "medium", 40),
+                                      ("b", "tiny", 5), ("b", "tiny2", 5)]:
+            os.makedirs(os.path.join(temp_dir, folder), exist_ok=True)
+            path = os.path.join(temp_dir, folder, f"{name}.pdf")
+            with open(path, 'wb') as f:
+                f.write(b'x' * size_kb * 1024)
+            paths[name] = path
+        yield paths
+
+
+class TestBatchScheduler:
+    """Test cases for the batch scheduler"""
+
+    def test_fifo_keeps_input_order(self, pdf_dirs):
+        """Test FIFO returns files as given"""
+        files = list(pdf_dirs.values())
+        assert [job.pdf_path for job in plan_jobs(files)] == files
+
+    def test_largest_and_shortest_first(self, pdf_dirs):
+        """Test size ordering in both directions"""
+        files = list(pdf_dirs.values())
+
+        largest = plan_jobs(files, SchedulingPolicy.LARGEST_FIRST)
+        shortest = plan_jobs(files, SchedulingPolicy.SHORTEST_FIRST)
+
+        assert largest[0].pdf_path == pdf_dirs["large"]
+        assert shortest[-1].pdf_path == pdf_dirs["large"]
+        assert [job.cost for job in shortest] == sorted(job.cost for job in largest)
+
+    def test_fair_share_interleaves_directories(self, pdf_dirs):
+        """Test small files from one directory are not queued behind another's large files"""
+        files = [pdf_dirs[name] for name in ("small", "large", "medium", "tiny", "tiny2")]
+
+        order = [job.pdf_path for job in plan_jobs(files, SchedulingPolicy.FAIR_SHARE)]
+
+        assert order.index(pdf_dirs["tiny2"]) < order.index(pdf_dirs["large"])
+        assert order.index(pdf_dirs["small"]) < order.index(pdf_dirs["large"]) < order.index(pdf_dirs["medium"])
+
+    def test_missing_file_has_zero_cost(self):
+        """Test missing files are planned rather than raising"""
+        jobs = plan_jobs(["missing.pdf"], SchedulingPolicy.LARGEST_FIRST)
+        assert jobs[0].cost == 0.0
+
+    def test_page_count_estimate(self):
+        """Test page objects are counted and page tree nodes ignored"""
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(b"1 0 obj << /Type /Pages /Count 3 >> endobj\n")
+            f.write(b"2 0 obj << /Type /Page >> endobj\n" * 3)
+            path = f.name
+        try:
+            assert estimate_page_count(path) == 3
+            assert plan_jobs([path], cost_metric=CostMetric.PAGES)[0].cost == 3
+        finally:
+            os.unlink(path)
+
+    def test_makespan_largest_first_beats_fifo(self):
+        """Test LPT ordering shortens the tail when the large job comes last"""
+        durations = {f"f{i}.pdf": 1.0 for i in range(6)}
+        durations["big.pdf"] = 6.0
+        fifo_order = list(durations)
+        lpt_order = sorted(durations, key=durations.get, reverse=True)
+
+        assert simulate_makespan([durations[p] for p in fifo_order], 3) == 8.0
+        assert simulate_makespan([durations[p] for p in lpt_order], 3) == 6.0
+
+        comparison = compare_to_fifo(fifo_order, lpt_order, durations, 3, SchedulingPolicy.LARGEST_FIRST)
+        assert comparison['improvement_pct'] == pytest.approx(25.0)
+        assert comparison['policy'] == "largest_first"
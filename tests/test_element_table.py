@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the columnar element store
+"""
+
+import pytest
+import json
+import os
+import tempfile
+
+import numpy as np
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from element_table import ElementTable
+from optimized_spatial_analysis import OptimizedSpatialAnalyzer
+from intelligent_financial_table_parser import IntelligentFinancialTableParser
+from working_universal_parser import WorkingUniversalParser
+
+
+ELEMENTS = [
+    {'Text': 'Holdings', 'Page': 0, 'Path': '//Document/H1', 'Bounds': [50, 700, 150, 720], 'TextSize': 14.0},
+    {'Page': 0, 'Path': '//Document/Figure', 'Bounds': [50, 400, 300, 600]},
+    {'Text': 'XS2530201644 ', 'Page': 1, 'Path': '//Document/Table/TR/TD/P',
+     'Bounds': [40, 500, 120, 510], 'TextSize': 8.04, 'Font': {'name': 'Arial', 'size': 8}},
+    {'Text': '1,234.56', 'Page': 1, 'Path': '//Document/Table/TR/TD[2]/P',
+     'Bounds': [300, 500, 340, 510], 'TextSize': 8.04, 'Font': {'name': 'Arial', 'size': 8}},
+    {'Text': 'Total', 'Page': 1, 'Path': '//Document/P', 'Bounds': [40, 100]},
+    {'Text': 'Footnote', 'Page': 0, 'Path': '//Document/Footnote', 'Bounds': [50, 30, 120, 40]}
+]
+
+# Partial bounds are stored as missing, so parser parity is checked on complete ones
+WELL_FORMED = [element for element in ELEMENTS if len(element.get('Bounds', [])) == 4]
+
+
+@pytest.fixture
+def table():
+    return ElementTable.from_elements(ELEMENTS)
+
+
+class TestElementTable:
+    """Test cases for ElementTable"""
+
+    def test_columns_and_page_index(self, table):
+        """Test text rows are stored by page with an offset index"""
+        assert len(table) == 5
+        assert table.page.tolist() == [0, 0, 1, 1, 1]
+        assert table.source_index.tolist() == [0, 5, 2, 3, 4]
+        assert table.page_numbers.tolist() == [0, 1]
+        assert table.page_offsets.tolist() == [0, 2, 5]
+
+        rows = table.page_rows(1)
+        assert [table.text(row) for row in range(rows.start, rows.stop)] == ['XS2530201644', '1,234.56', 'Total']
+        assert table.page_rows(7) == slice(0, 0)
+
+    def test_geometry_and_interning(self, table):
+        """Test Adobe bounds convention, missing bounds and the shared string pool"""
+        row = table.page_rows(1).start
+        assert table.x[row] == 40 and table.width[row] == 80 and table.height[row] == 10
+        assert table.has_bounds.tolist() == [True, True, True, True, False]
+        assert table.text_id.dtype == np.int32
+        assert table.font_id[2] == table.font_id[3]
+
+    def test_vectorized_filters(self, table):
+        """Test path, box and page filters return rows in document order"""
+        assert table.path_mask('//Document/Table').sum() == 2
+        in_box = table.box_mask(0, 450, 400, 550)
+        assert [table.text(row) for row in np.flatnonzero(in_box)] == ['XS2530201644', '1,234.56']
+
+        rows = table.select(pages=[0, 1], path_prefix=('//Document/H1', '//Document/Footnote'))
+        assert [table.text(row) for row in rows] == ['Holdings', 'Footnote']
+
+    def test_digest_identifies_contents(self, table):
+        """Test repr is stable for equal contents and differs otherwise"""
+        assert repr(table) == repr(ElementTable.from_elements(ELEMENTS))
+        assert repr(table) != repr(ElementTable.from_elements(ELEMENTS[:-1]))
+
+    def test_empty_table(self):
+        """Test documents without text elements"""
+        table = ElementTable.from_elements([{'Page': 0, 'Path': '//Document/Figure'}])
+
+        assert len(table) == 0
+        assert table.page_offsets.tolist() == [0]
+        assert list(table) == []
+
+    def test_from_file(self):
+        """Test building straight from structuredData.json"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'structuredData.json')
+            with open(path, 'w') as f:
+                json.dump({'elements': ELEMENTS}, f)
+
+            assert ElementTable.from_file(path, pages=[1]).page.tolist() == [1, 1, 1]
+            assert repr(ElementTable.from_file(path)) == repr(ElementTable.from_elements(ELEMENTS))
+
+
+class TestSharedTableConsumers:
+    """One table passed to every parser gives the same elements as dictionaries"""
+
+    def test_spatial_analyzer(self, table):
+        """Test spatial TextElements built from the table"""
+        analyzer = OptimizedSpatialAnalyzer(enable_parallel=False)
+
+        assert analyzer._convert_elements(table) == analyzer._convert_elements(ELEMENTS)
+
+    def test_intelligent_parser(self, table):
+        """Test intelligent parser elements, with and without a Path filter"""
+        parser = IntelligentFinancialTableParser()
+        shared = ElementTable.from_elements(WELL_FORMED)
+
+        assert parser.load_adobe_extraction(shared) == parser.load_adobe_extraction(iter(WELL_FORMED))
+        tables_only = parser.load_adobe_extraction(table, path_prefix='//Document/Table')
+        assert [e.text for e in tables_only] == ['XS2530201644', '1,234.56']
+
+    def test_universal_parser(self):
+        """Test universal parser element dictionaries"""
+        parser = WorkingUniversalParser()
+        shared = ElementTable.from_elements(WELL_FORMED)
+
+        assert parser.load_adobe_extraction(shared) == parser.load_adobe_extraction(iter(WELL_FORMED))
+
+    def test_iterates_as_dictionaries(self, table):
+        """Test dictionary consumers can iterate the table directly"""
+        texts = [element['Text'] for element in table]
+
+        assert texts == ['Holdings', 'XS2530201644', '1,234.56', 'Total', 'Footnote']
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-pass extraction in EnhancedAdobeProcessor, with mocked extractors
+"""
+
+import pytest
+import os
+import threading
+import time
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import enhanced_adobe_processor
+from enhanced_adobe_processor import EnhancedAdobeProcessor
+from pdf_extractor import SharedUpload
+
+
+class MockExtractors:
+    """Records uploads and pass calls shared by the mocked basic and advanced extractors"""
+
+    def __init__(self, delays=None, cached=(), renditions=()):
+        self.delays = delays or {}
+        self.cached = set(cached)
+        self.renditions = set(renditions)
+        self.lock = threading.Lock()
+        self.uploads = 0
+        self.calls = []
+        self.finished = []
+        self.assets = []
+        self.active = 0
+        self.peak_active = 0
+
+    def upload_pdf(self, input_pdf_path):
+        with self.lock:
+            self.uploads += 1
+        return object()
+
+    def run_pass(self, name, output_dir, input_asset):
+        with self.lock:
+            self.calls.append(name)
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        try:
+            time.sleep(self.delays.get(name, 0.01))
+            cache_hit = name in self.cached
+            if not cache_hit:
+                asset = input_asset() if isinstance(input_asset, SharedUpload) else input_asset
+                with self.lock:
+                    self.assets.append(asset)
+            files = {'json': os.path.join(output_dir, 'structuredData.json')}
+            if name in self.renditions:
+                files['tables'] = [os.path.join(output_dir, 'tables', 'table_1.csv')]
+            return {'success': True, 'extracted_files': files, 'renditions_extracted': name in self.renditions,
+                    'cache_hit': cache_hit}
+        finally:
+            with self.lock:
+                self.active -= 1
+                self.finished.append(name)
+
+    def basic(self, credentials_path):
+        mock = self
+
+        class BasicExtractor:
+            def upload_pdf(self, input_pdf_path):
+                return mock.upload_pdf(input_pdf_path)
+
+            def extract_tables(self, input_pdf_path, output_dir, table_format, extract_text, enable_ocr,
+                               input_asset=None):
+                return mock.run_pass(table_format, output_dir, input_asset)
+
+        return BasicExtractor()
+
+    def advanced(self, credentials_path):
+        mock = self
+
+        class AdvancedExtractor:
+            def extract_with_renditions(self, input_pdf_path, output_dir, table_format, extract_text,
+                                        extract_figures, extract_tables, input_asset=None):
+                return mock.run_pass('renditions', output_dir, input_asset)
+
+        return AdvancedExtractor()
+
+
+def make_processor(monkeypatch, mock, **quality_settings):
+    """Processor whose extractors are replaced by mock's"""
+    monkeypatch.setattr(enhanced_adobe_processor, 'PDFExtractor', mock.basic)
+    monkeypatch.setattr(enhanced_adobe_processor, 'AdvancedPDFExtractor', mock.advanced)
+    monkeypatch.setattr(enhanced_adobe_processor, 'create_spatial_analyzer', lambda **kwargs: None)
+    processor = EnhancedAdobeProcessor('credentials.json')
+    processor.quality_settings.update(quality_settings)
+    return processor
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    """Placeholder PDF; the mocked extractors never read it"""
+    path = tmp_path / 'statement.pdf'
+    path.write_bytes(b"%PDF-1.4\n")
+    return str(path)
+
+
+class TestMultiPassExtraction:
+    """Test cases for EnhancedAdobeProcessor._multi_pass_extraction"""
+
+    def test_passes_fan_out_over_one_upload(self, monkeypatch, pdf_path, tmp_path):
+        """Test all passes run at once and share a single upload made on the first cache miss"""
+        mock = MockExtractors(delays={'csv': 0.2, 'renditions': 0.2, 'xlsx': 0.2})
+        processor = make_processor(monkeypatch, mock)
+
+        start = time.time()
+        result = processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+        elapsed = time.time() - start
+
+        assert mock.peak_active == 3
+        assert elapsed < 0.5
+        assert mock.uploads == 1
+        assert len(mock.assets) == 3 and len({id(asset) for asset in mock.assets}) == 1
+        assert [p['pass_type'] for p in result['all_passes']] == ['basic_ocr', 'advanced_renditions', 'excel_format']
+
+    def test_no_upload_when_every_pass_hits_cache(self, monkeypatch, pdf_path, tmp_path):
+        """Test cached passes never upload the PDF"""
+        mock = MockExtractors(cached=['csv', 'renditions', 'xlsx'])
+        processor = make_processor(monkeypatch, mock)
+
+        result = processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+
+        assert result['success']
+        assert mock.uploads == 0
+        assert sorted(mock.calls) == ['csv', 'renditions', 'xlsx']
+
+    def test_upload_deferred_to_first_cache_miss(self, monkeypatch, pdf_path, tmp_path):
+        """Test a pass served from the cache does not wait for or trigger the upload"""
+        mock = MockExtractors(cached=['csv', 'xlsx'])
+        processor = make_processor(monkeypatch, mock, enable_concurrent_passes=False)
+
+        processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+
+        assert mock.calls == ['csv', 'renditions', 'xlsx']
+        assert mock.uploads == 1
+        assert len(mock.assets) == 1
+
+    def test_early_stop_does_not_wait_for_running_passes(self, monkeypatch, pdf_path, tmp_path):
+        """Test a pass clearing the early stop score returns without waiting for slower passes"""
+        mock = MockExtractors(delays={'csv': 0.5, 'renditions': 0.01, 'xlsx': 0.5}, renditions=['renditions'])
+        processor = make_processor(monkeypatch, mock, early_stop_score=0.9)
+
+        start = time.time()
+        result = processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+        elapsed = time.time() - start
+
+        assert elapsed < 0.4
+        assert result['pass_type'] == 'advanced_renditions'
+        assert [p['pass_type'] for p in result['all_passes']] == ['advanced_renditions']
+
+    def test_early_stop_cancels_queued_passes(self, monkeypatch, pdf_path, tmp_path):
+        """Test passes still queued behind the parallel limit never start after an early stop"""
+        mock = MockExtractors(delays={'csv': 0.2, 'renditions': 0.01}, renditions=['renditions'])
+        processor = make_processor(monkeypatch, mock, early_stop_score=0.9, max_parallel_passes=2)
+
+        processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+        time.sleep(0.3)
+
+        assert sorted(mock.calls) == ['csv', 'renditions']
+        assert 'xlsx' not in mock.finished
+
+    def test_sequential_early_stop(self, monkeypatch, pdf_path, tmp_path):
+        """Test sequential passes stop after the first pass clearing the score"""
+        mock = MockExtractors(renditions=['csv'])
+        processor = make_processor(monkeypatch, mock, enable_concurrent_passes=False, early_stop_score=0.9)
+
+        result = processor._multi_pass_extraction(pdf_path, str(tmp_path / 'out'))
+
+        assert mock.calls == ['csv']
+        assert result['pass_type'] == 'basic_ocr'
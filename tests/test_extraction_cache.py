@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the content-addressed extraction cache
+"""
+
+import pytest
+import os
+import tempfile
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from extraction_cache import ExtractionCache, hash_pdf
+except ImportError as e:
+    pytest.skip(f"Skipping extraction cache tests due to import error: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def work_dir():
+    """Temporary directory holding a PDF, a result ZIP and the cache"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = os.path.join(temp_dir, "statement.pdf")
+        with open(pdf_path, 'wb') as f:
+            f.write(b'%PDF-1.4\nstatement content')
+
+        zip_path = os.path.join(temp_dir, "result.zip")
+        with open(zip_path, 'wb') as f:
+            f.write(b'PK\x03\x04 mock zip payload')
+
+        yield temp_dir, pdf_path, zip_path
+
+
+class TestExtractionCache:
+    """Test cases for ExtractionCache"""
+
+    def test_key_depends_on_content_and_parameters(self, work_dir):
+        """Test keys are content-addressed and parameter-sensitive"""
+        temp_dir, pdf_path, _ = work_dir
+        cache = ExtractionCache(os.path.join(temp_dir, "cache"))
+
+        copy_path = os.path.join(temp_dir, "renamed copy.pdf")
+        with open(pdf_path, 'rb') as src, open(copy_path, 'wb') as dst:
+            dst.write(src.read())
+
+        key = cache.make_key(pdf_path, "extract_tables", table_format="csv", enable_ocr=True)
+
+        assert key == cache.make_key(copy_path, "extract_tables", table_format="CSV", enable_ocr=True)
+        assert key != cache.make_key(pdf_path, "extract_tables", table_format="xlsx", enable_ocr=True)
+        assert key != cache.make_key(pdf_path, "extract_tables", table_format="csv", enable_ocr=False)
+        assert key != cache.make_key(pdf_path, "extract_with_renditions", table_format="csv", enable_ocr=True)
+        assert key.startswith(hash_pdf(pdf_path))
+
+    def test_store_and_fetch(self, work_dir):
+        """Test a stored ZIP is returned on the next request"""
+        temp_dir, pdf_path, zip_path = work_dir
+        cache = ExtractionCache(os.path.join(temp_dir, "cache"))
+        key = cache.make_key(pdf_path, "extract_tables", table_format="csv")
+        output_path = os.path.join(temp_dir, "fetched.zip")
+
+        assert cache.fetch(key, output_path) is False
+        assert cache.store(key, zip_path) is True
+        assert cache.fetch(key, output_path) is True
+
+        with open(output_path, 'rb') as fetched, open(zip_path, 'rb') as original:
+            assert fetched.read() == original.read()
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['stores'] == 1
+        assert cache.get_hit_rate() == 0.5
+
+    def test_persists_across_instances(self, work_dir):
+        """Test cached results survive a new cache instance"""
+        temp_dir, pdf_path, zip_path = work_dir
+        cache_dir = os.path.join(temp_dir, "cache")
+
+        first = ExtractionCache(cache_dir)
+        key = first.make_key(pdf_path, "extract_tables", table_format="csv")
+        first.store(key, zip_path)
+        first.cache.close()
+
+        second = ExtractionCache(cache_dir)
+        assert second.fetch(key, os.path.join(temp_dir, "fetched.zip")) is True
+
+    def test_clear(self, work_dir):
+        """Test clearing removes all entries"""
+        temp_dir, pdf_path, zip_path = work_dir
+        cache = ExtractionCache(os.path.join(temp_dir, "cache"))
+        key = cache.make_key(pdf_path, "extract_tables")
+        cache.store(key, zip_path)
+
+        cache.clear()
+
+        assert cache.get_stats()['size'] == 0
+        assert cache.fetch(key, os.path.join(temp_dir, "fetched.zip")) is False
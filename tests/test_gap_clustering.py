@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for 1-D gap clustering, checked against scikit-learn DBSCAN
+"""
+
+import pytest
+import os
+
+import numpy as np
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from gap_clustering import GapClustering, gap_cluster_labels, standardize
+
+
+def sample_sets(seed=0, count=600):
+    """Integer, continuous, rounded-normal and statement-row coordinates"""
+    rng = np.random.default_rng(seed)
+    for i in range(count):
+        size = int(rng.integers(1, 80))
+        kind = i % 4
+        if kind == 0:
+            yield rng.integers(0, 60, size).astype(float)
+        elif kind == 1:
+            yield rng.uniform(0, 200, size)
+        elif kind == 2:
+            yield np.round(rng.normal(0, 1, size), 2)
+        else:
+            yield np.repeat(np.arange(size) * 12.0, 4) + rng.uniform(-2, 2, size * 4)
+
+
+class TestGapClustering:
+    """Test cases for gap_cluster_labels"""
+
+    @pytest.mark.parametrize('eps,min_samples', [(0.3, 1), (0.3, 2), (1.0, 3), (8.0, 1), (15.0, 2)])
+    def test_matches_dbscan(self, eps, min_samples):
+        """Test labels, noise and cluster numbering equal DBSCAN's"""
+        DBSCAN = pytest.importorskip('sklearn.cluster').DBSCAN
+
+        for values in sample_sets():
+            expected = DBSCAN(eps=eps, min_samples=min_samples).fit(values.reshape(-1, 1)).labels_
+            assert gap_cluster_labels(values, eps, min_samples).tolist() == expected.tolist()
+
+    def test_standardize_matches_standard_scaler(self):
+        """Test scaling equals StandardScaler, including constant input"""
+        StandardScaler = pytest.importorskip('sklearn.preprocessing').StandardScaler
+
+        for values in [np.array([100.0, 112.0, 400.5, 88.0]), np.full(5, 7.0)]:
+            expected = StandardScaler().fit_transform(values.reshape(-1, 1)).ravel()
+            np.testing.assert_allclose(standardize(values), expected)
+
+    def test_gap_semantics(self):
+        """Test gaps of exactly eps join clusters and wider gaps split them"""
+        assert gap_cluster_labels([40.0, 0.0, 8.0, 16.0, 25.0], eps=8.0).tolist() == [0, 1, 1, 1, 2]
+        assert gap_cluster_labels([0.0, 1.0, 50.0], eps=2.0, min_samples=2).tolist() == [0, 0, -1]
+        assert gap_cluster_labels([], eps=1.0).tolist() == []
+
+    def test_estimator_interface(self):
+        """Test the DBSCAN-style wrapper"""
+        labels = GapClustering(eps=8.0).fit(np.array([[0.0], [5.0], [40.0]])).labels_
+
+        assert labels.tolist() == [0, 0, 1]
+        with pytest.raises(ValueError):
+            GapClustering().fit(np.zeros((3, 2)))
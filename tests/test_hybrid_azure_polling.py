@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Azure result polling in HybridOCRProcessor
+"""
+
+import pytest
+import os
+import threading
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import hybrid_ocr_processor
+from hybrid_ocr_processor import HybridOCRProcessor
+from job_poller import PollPolicy
+
+
+class FakeResponse:
+    """aiohttp response carrying an operation status"""
+
+    def __init__(self, status):
+        self.status = status
+        self.headers = {'Retry-After': '0'}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self.status
+
+
+class FakeSession:
+    """aiohttp session whose operations succeed on their second status check"""
+
+    instances = []
+
+    def __init__(self, timeout=None):
+        self.checks = {}
+        self.closed = False
+        self.instances.append(self)
+
+    def get(self, url, headers=None):
+        self.checks[url] = self.checks.get(url, 0) + 1
+        status = 'succeeded' if self.checks[url] >= 2 else 'running'
+        return FakeResponse({'status': status, 'analyzeResult': {'tables': [], 'paragraphs': []}})
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Processor with stubbed Adobe extractors and a fake Azure session, closed after the test"""
+    monkeypatch.setattr(hybrid_ocr_processor, 'PDFExtractor', lambda path: None)
+    monkeypatch.setattr(hybrid_ocr_processor, 'AdvancedPDFExtractor', lambda path: None)
+    monkeypatch.setattr(hybrid_ocr_processor.aiohttp, 'ClientSession', FakeSession)
+    monkeypatch.setattr(FakeSession, 'instances', [])
+    with HybridOCRProcessor('credentials.json', 'https://azure.example', 'key') as processor:
+        processor.azure_poller.policy = PollPolicy(initial_interval=0.01, max_interval=0.05, jitter=0.0)
+        yield processor
+
+
+class TestAzurePolling:
+    """Test cases for HybridOCRProcessor._poll_azure_results"""
+
+    def test_calls_share_poller_and_session(self, processor):
+        """Test repeated and concurrent polls reuse one poller, session and event loop"""
+        assert processor._poll_azure_results('https://azure.example/operations/1')['success']
+        loop = processor._poll_loop
+
+        results = []
+        threads = [threading.Thread(target=lambda i=i: results.append(
+            processor._poll_azure_results(f'https://azure.example/operations/{i}'))) for i in range(2, 6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        session, = FakeSession.instances
+        assert all(result['success'] for result in results)
+        assert processor._poll_loop is loop
+        assert processor.azure_poller.get_stats()['completed'] == 5
+        assert sorted(session.checks.values()) == [2] * 5
+
+    def test_close_releases_session_and_loop(self, processor):
+        """Test close shuts the session and loop, and a later poll starts fresh ones"""
+        processor._poll_azure_results('https://azure.example/operations/1')
+        first_session, thread = FakeSession.instances[0], processor._poll_thread
+
+        processor.close()
+
+        assert first_session.closed
+        assert not thread.is_alive()
+        assert processor._poll_azure_results('https://azure.example/operations/2')['success']
+        assert len(FakeSession.instances) == 2
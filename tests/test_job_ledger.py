@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the durable batch job ledger
+"""
+
+import pytest
+import os
+import tempfile
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from job_ledger import JobLedger, JobState
+
+
+@pytest.fixture
+def ledger():
+    """Create a ledger in a temporary directory"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        job_ledger = JobLedger(os.path.join(temp_dir, "ledger.sqlite"))
+        yield job_ledger
+        job_ledger.close()
+
+
+class TestJobLedger:
+    """Test cases for JobLedger"""
+
+    def test_register_and_complete(self, ledger):
+        """Test jobs move through pending, in flight and done"""
+        ledger.register(["a.pdf", "b.pdf"])
+        assert ledger.get_summary()[JobState.PENDING.value] == 2
+
+        ledger.mark_in_flight("a.pdf")
+        ledger.mark_done("a.pdf", {"json": "out/a/structuredData.json"})
+
+        job = ledger.get_job("a.pdf")
+        assert job['state'] == JobState.DONE.value
+        assert job['attempts'] == 1
+        assert job['output_files'] == {"json": "out/a/structuredData.json"}
+
+    def test_select_remaining_skips_done_and_exhausted(self, ledger):
+        """Test resume skips completed files and failed files out of attempts"""
+        paths = ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+        ledger.register(paths)
+
+        ledger.mark_in_flight("a.pdf")
+        ledger.mark_done("a.pdf")
+
+        ledger.mark_in_flight("b.pdf")
+        ledger.mark_failed("b.pdf", "API error")
+
+        for _ in range(3):
+            ledger.mark_in_flight("c.pdf")
+            ledger.mark_failed("c.pdf", "API error")
+
+        assert ledger.select_remaining(paths, max_attempts=3) == ["b.pdf", "d.pdf"]
+
+    def test_recover_in_flight(self, ledger):
+        """Test jobs interrupted by a crash return to pending"""
+        ledger.register(["a.pdf"])
+        ledger.mark_in_flight("a.pdf")
+
+        assert ledger.recover_in_flight() == 1
+        assert ledger.get_job("a.pdf")['state'] == JobState.PENDING.value
+        assert ledger.get_job("a.pdf")['attempts'] == 1
+
+    def test_register_reset(self, ledger):
+        """Test a fresh run forgets previous state"""
+        ledger.register(["a.pdf"])
+        ledger.mark_in_flight("a.pdf")
+        ledger.mark_done("a.pdf")
+
+        ledger.register(["a.pdf"])
+        assert ledger.get_job("a.pdf")['state'] == JobState.DONE.value
+
+        ledger.register(["a.pdf"], reset=True)
+        job = ledger.get_job("a.pdf")
+        assert job['state'] == JobState.PENDING.value
+        assert job['attempts'] == 0
+
+    def test_state_survives_reopen(self):
+        """Test ledger state is durable across connections"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "ledger.sqlite")
+
+            first = JobLedger(db_path)
+            first.register(["a.pdf"])
+            first.mark_in_flight("a.pdf")
+            first.mark_done("a.pdf")
+            first.close()
+
+            second = JobLedger(db_path)
+            assert second.select_remaining(["a.pdf", "b.pdf"], max_attempts=3) == ["b.pdf"]
+            second.close()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared job status poller
+"""
+
+import pytest
+import asyncio
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from job_poller import JobPoller, PollPolicy, parse_retry_after
+from exceptions import APITimeoutError, TemporaryAPIError
+
+
+class FakeJobs:
+    """Status endpoint whose jobs finish at fixed times"""
+
+    def __init__(self, finish_after, retry_after=None, errors_before_success=0):
+        self.finish_after = finish_after
+        self.retry_after = retry_after
+        self.errors_before_success = errors_before_success
+        self.polls = {}
+        self.start = None
+
+    async def fetch(self, url):
+        loop = asyncio.get_running_loop()
+        if self.start is None:
+            self.start = loop.time()
+        self.polls[url] = self.polls.get(url, 0) + 1
+
+        if self.errors_before_success:
+            self.errors_before_success -= 1
+            raise TemporaryAPIError("HTTP 503", retry_after=0.01)
+
+        done = loop.time() - self.start >= self.finish_after[url]
+        return {'status': 'done' if done else 'running', 'url': url}, self.retry_after
+
+
+def fast_policy(**overrides):
+    settings = dict(initial_interval=0.02, max_interval=0.2, multiplier=2.0, jitter=0.0, max_polls=20, timeout=5.0)
+    settings.update(overrides)
+    return PollPolicy(**settings)
+
+
+class TestJobPoller:
+    """Test cases for JobPoller"""
+
+    def test_multiplexes_many_jobs(self):
+        """Test many waiters resolve through one scheduler"""
+        jobs = FakeJobs({f"job-{i}": 0.05 * (i % 4) for i in range(50)})
+        poller = JobPoller(fast_policy())
+
+        async def run():
+            return await asyncio.gather(*(poller.wait(url, jobs.fetch) for url in jobs.finish_after))
+
+        results = asyncio.run(run())
+        assert [r['url'] for r in results] == list(jobs.finish_after)
+        assert poller.get_stats()['completed'] == 50
+        assert poller.get_stats()['outstanding'] == 0
+
+    def test_backoff_caps_polls_for_slow_jobs(self):
+        """Test exponential backoff keeps poll count low for slow jobs"""
+        jobs = FakeJobs({"slow": 0.7})
+        poller = JobPoller(fast_policy(max_interval=1.0))
+
+        asyncio.run(poller.wait("slow", jobs.fetch))
+
+        # Checks at roughly 0.02, 0.06, 0.14, 0.30, 0.62, 1.26s; fixed 20ms polling would need ~35
+        assert jobs.polls["slow"] <= 7
+
+    def test_retry_after_is_honoured(self):
+        """Test Retry-After replaces the backoff delay"""
+        jobs = FakeJobs({"job": 0.25}, retry_after=0.1)
+        poller = JobPoller(fast_policy(initial_interval=0.01))
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await poller.wait("job", jobs.fetch)
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+        assert jobs.polls["job"] == 4
+        assert elapsed == pytest.approx(0.31, abs=0.08)
+
+    def test_transient_errors_are_retried(self):
+        """Test retryable status errors do not fail the job"""
+        jobs = FakeJobs({"job": 0.0}, errors_before_success=2)
+        poller = JobPoller(fast_policy())
+
+        result = asyncio.run(poller.wait("job", jobs.fetch))
+
+        assert result['status'] == 'done'
+        assert poller.get_stats()['retried_errors'] == 2
+
+    def test_poll_cap_raises_timeout(self):
+        """Test a job that never finishes stops after max_polls"""
+        jobs = FakeJobs({"stuck": 1000})
+        poller = JobPoller(fast_policy(initial_interval=0.001, max_interval=0.001, max_polls=5))
+
+        with pytest.raises(APITimeoutError):
+            asyncio.run(poller.wait("stuck", jobs.fetch))
+        assert jobs.polls["stuck"] == 5
+
+    def test_last_check_runs_at_deadline(self):
+        """Test a backoff step past the timeout is clamped to a final check at the deadline"""
+        jobs = FakeJobs({"job": 0.4})
+        poller = JobPoller(fast_policy(max_interval=1.0, timeout=0.45))
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await poller.wait("job", jobs.fetch)
+            return result, loop.time() - start
+
+        # Checks at roughly 0.02, 0.06, 0.14 and 0.30s; the next step, 0.62s, is past the deadline
+        result, elapsed = asyncio.run(run())
+        assert result['status'] == 'done'
+        assert elapsed == pytest.approx(0.45, abs=0.08)
+        assert jobs.polls["job"] == 5
+
+    def test_per_wait_timeout(self):
+        """Test a wait's own timeout overrides the policy timeout"""
+        jobs = FakeJobs({"stuck": 1000})
+        poller = JobPoller(fast_policy(timeout=60.0))
+
+        with pytest.raises(APITimeoutError):
+            asyncio.run(poller.wait("stuck", jobs.fetch, timeout=0.1))
+        assert poller.get_stats()['timeouts'] == 1
+
+    def test_parse_retry_after(self):
+        """Test seconds and HTTP-date forms of Retry-After"""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") < 0
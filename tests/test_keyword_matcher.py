@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared multi-keyword matcher
+"""
+
+import pytest
+import os
+import re
+import random
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from keyword_matcher import KeywordHit, KeywordMatcher
+from intelligent_financial_table_parser import (
+    COLUMN_KEYWORDS, HEADER_LABELS, SECURITY_KEYWORDS, TABLE_TYPE_KEYWORDS,
+    PatternRecognitionBrain, TextElement, UniversalFormatHandler, financial_keyword_matcher
+)
+
+WORDS = ['Structured', 'notes', 'NOTE', 'Bondsman', 'bonds', 'fund_x', 'Funds', 'equity', 'Bank', 'AG', 'sage',
+         'S.A.', 'Ltd.', 'incorporated', 'capital-group', 'Corp', 'Market Value', 'ISIN', 'Qty/Amount', 'Curr.',
+         'Return %', 'Expiry', 'ytd', 'Total', 'portfolio', 'Anleihen', 'Fonds', 'Structuré', 'Ærø', 'x', '3.5%',
+         '2027-01-15', '', ' ']
+
+
+def sample_texts(count=3000, seed=0):
+    """Random cell texts mixing keywords, keyword fragments and separators"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = [rng.choice(WORDS) for _ in range(rng.randint(0, 5))]
+        yield rng.choice([' ', '', '-', '/']).join(parts)
+
+
+def reference_security_name(text):
+    """The per-keyword loop and regex searches recognize_security_name made"""
+    text_lower = text.lower()
+    keyword_matches = sum(1 for keyword in SECURITY_KEYWORDS if keyword in text_lower)
+    has_issuer = bool(re.search(r'\b(bank|capital|group|corp|ltd|inc|ag|sa)\b', text_lower))
+    has_instrument = bool(re.search(r'\b(notes?|bonds?|fund|equity|structured)\b', text_lower))
+    return keyword_matches, has_issuer, has_instrument
+
+
+class TestKeywordMatcher:
+    """Test cases for KeywordMatcher"""
+
+    def test_reports_every_hit_with_categories(self):
+        """Test overlapping and nested keywords are all reported, per category"""
+        matcher = KeywordMatcher({'instrument': ['note', 'notes'], 'header': ['notes', 'tes']})
+
+        hits = matcher.scan('Notes')
+
+        assert hits == (KeywordHit(0, 5, 'notes', 'header'), KeywordHit(0, 5, 'notes', 'instrument'),
+                        KeywordHit(0, 4, 'note', 'instrument'), KeywordHit(2, 5, 'tes', 'header'))
+        assert matcher.match('NOTES') == {'header': {'notes', 'tes'}, 'instrument': {'note', 'notes'}}
+
+    def test_whole_word_categories(self):
+        """Test whole-word categories skip keywords inside longer words"""
+        matcher = KeywordMatcher({'issuer': ['ag', 'sa'], 'any': ['ag']}, whole_word=['issuer'])
+
+        assert matcher.match('Bank AG') == {'issuer': {'ag'}, 'any': {'ag'}}
+        assert matcher.match('agenda') == {'any': {'ag'}}
+        assert matcher.match('s.a.') == {}
+        assert matcher.match('') == {}
+
+    def test_special_characters_and_empty_dictionaries(self):
+        """Test regex metacharacters are literal and empty dictionaries match nothing"""
+        matcher = KeywordMatcher({'performance': ['%', 'return'], 'other': ['a.b']})
+
+        assert matcher.match('Return %') == {'performance': {'%', 'return'}}
+        assert matcher.match('axb') == {}
+        assert KeywordMatcher({}).scan('anything') == ()
+
+    def test_security_name_parity(self):
+        """Test security, issuer and instrument hits equal the old substring and regex checks"""
+        matcher = financial_keyword_matcher()
+
+        for text in sample_texts():
+            keywords = matcher.match(text)
+            assert (len(keywords.get('security', ())), 'issuer' in keywords, 'instrument' in keywords) == \
+                reference_security_name(text), text
+
+    def test_header_and_table_parity(self):
+        """Test header, column and table type categories equal the old substring checks"""
+        matcher = financial_keyword_matcher()
+
+        for text in sample_texts(seed=1):
+            keywords = matcher.match(text)
+            text_lower = text.lower()
+            assert ('header' in keywords) == any(label in text_lower for label in HEADER_LABELS)
+            for column, words in COLUMN_KEYWORDS.items():
+                assert (f'column:{column}' in keywords) == any(word in text_lower for word in words)
+            for table, words in TABLE_TYPE_KEYWORDS.items():
+                assert (f'table:{table}' in keywords) == any(word in text_lower for word in words)
+
+    def test_loop_and_trie_scans_agree(self, monkeypatch):
+        """Test small dictionaries, matched by substring checks, give the same hits as the trie scan"""
+        dictionaries = {'security': SECURITY_KEYWORDS, 'header': HEADER_LABELS, 'issuer': ['ag', 'sa', 'bank']}
+        dictionaries.update((f'table:{table}', words) for table, words in TABLE_TYPE_KEYWORDS.items())
+        small = KeywordMatcher(dictionaries, whole_word=['issuer'])
+        monkeypatch.setattr(KeywordMatcher, 'LOOP_MAX_KEYWORDS', 0)
+        trie = KeywordMatcher(dictionaries, whole_word=['issuer'])
+
+        assert small._pattern is None and trie._pattern is not None
+        for text in sample_texts(seed=2):
+            assert small.scan(text) == trie.scan(text), text
+            assert small.match(text) == trie.match(text), text
+
+    def test_long_texts_are_not_memoized(self):
+        """Test whole-table and document texts are scanned without entering the memo"""
+        matcher = KeywordMatcher({'instrument': ['notes']})
+        document = ' '.join(sample_texts(count=200))
+
+        assert matcher.match(document) == matcher._match(document)
+        assert matcher.scan(document) == matcher._scan(document)
+        assert matcher.match('Notes') == {'instrument': {'notes'}}
+        assert matcher._cached_match.cache_info().currsize == 1
+        assert matcher._cached_scan.cache_info().currsize == 0
+
+    def test_recognize_security_name(self):
+        """Test the parser's security name scoring uses the shared matcher"""
+        brain = PatternRecognitionBrain()
+
+        is_security, confidence = brain.recognize_security_name('Goldman Sachs Structured Notes 3.5% 2027-01-15')
+
+        assert brain.keyword_matcher is financial_keyword_matcher()
+        assert is_security
+        assert confidence == pytest.approx(1.0)
+        assert brain.recognize_security_name('Total') == (False, 0.0)
+
+    def test_instance_keyword_edits_are_honoured(self):
+        """Test edited security_keywords and language_patterns rebuild the instance's matcher"""
+        brain = PatternRecognitionBrain()
+        handler = UniversalFormatHandler()
+        elements = [TextElement(text, 0, [0, 0, 10, 10], 8.0, '//Document/P') for text in ['Obligasjoner', 'Fond']]
+
+        assert brain.recognize_security_name('Warrant Basket')[1] == 0.0
+        assert handler.detect_language(elements) == 'english'
+
+        brain.security_keywords.extend(['warrant', 'basket'])
+        handler.language_patterns['norwegian'] = {'security_keywords': ['obligasjoner', 'fond']}
+
+        assert brain.recognize_security_name('Warrant Basket')[1] == pytest.approx(0.6)
+        assert handler.detect_language(elements) == 'norwegian'
+        assert PatternRecognitionBrain().keyword_matcher is financial_keyword_matcher()
+        assert brain.keyword_matcher is financial_keyword_matcher(brain.security_keywords)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for page-parallel table detection in LayoutDetectionEngine
+"""
+
+import pytest
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from intelligent_financial_table_parser import LayoutDetectionEngine, TextElement
+
+WORDS = ['Structured Notes Bank AG', 'XS2530201644', "100'000", '1,234.56', '3.50%', '31.12.2024', 'USD', 'Total',
+         'Portfolio', 'Performance', '105.20']
+
+
+def document(pages=12, seed=0):
+    """Pages of jittered table rows, with some pages repeated verbatim and a few non-table elements"""
+    rng = random.Random(seed)
+    layouts = []
+    for _ in range(pages // 2):
+        rows = []
+        for row in range(rng.randint(2, 12)):
+            y = 700 - row * rng.uniform(14, 30)
+            rows.append([(rng.choice(WORDS), [x + rng.uniform(-3, 3), y, x + 60, y + 9])
+                         for x in [40, 220, 330, 430, 520][:rng.randint(2, 5)]])
+        layouts.append(rows)
+
+    elements = []
+    for page in range(pages):
+        for row in layouts[page % len(layouts)]:
+            for text, bounds in row:
+                elements.append(TextElement(text, page, list(bounds), 8.0, '//Document/Table/TR/TD/P'))
+        elements.append(TextElement('Footnote', page, [40, 40, 200, 50], 6.0, '//Document/P'))
+    return elements
+
+
+def canonical(tables, elements):
+    """Comparable form of detected tables, with cells tied to the document's elements"""
+    positions = {id(element): i for i, element in enumerate(elements)}
+    return [
+        (table['page'], table['num_rows'], table['num_columns'], table['table_type'],
+         [(positions[id(cell.original_element)], cell.text, cell.row, cell.column, cell.bounds, cell.data_type,
+           cell.token, cell.confidence) for cell in table['cells']])
+        for table in tables
+    ]
+
+
+@pytest.fixture
+def elements():
+    """Twelve-page document in which every page appears twice"""
+    return document()
+
+
+@pytest.fixture
+def expected(elements):
+    """Tables from serial detection without a cache"""
+    return canonical(LayoutDetectionEngine(cache_size=0).detect_table_structure(elements), elements)
+
+
+class TestLayoutParallel:
+    """Test cases for LayoutDetectionEngine parallel modes and page cache"""
+
+    @pytest.mark.parametrize('mode', ['serial', 'thread', 'process'])
+    def test_modes_match_serial(self, elements, expected, mode):
+        """Test every mode detects the same tables, in page order"""
+        assert expected
+
+        with LayoutDetectionEngine(parallel_mode=mode, max_workers=2) as engine:
+            tables = engine.detect_table_structure(elements)
+
+        assert canonical(tables, elements) == expected
+
+    def test_supplied_executor(self, elements, expected):
+        """Test pages run on a caller-supplied executor, which stays open"""
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            engine = LayoutDetectionEngine(executor=executor)
+            tables = engine.detect_table_structure(elements)
+            engine.close()
+
+            assert canonical(tables, elements) == expected
+            assert executor.submit(sum, [1, 2]).result() == 3
+
+    def test_repeated_pages_reuse_results(self, elements, expected):
+        """Test unchanged pages of another document are rebuilt from the cache"""
+        engine = LayoutDetectionEngine()
+        engine.detect_table_structure(elements)
+        misses = engine.page_cache.get_stats()['misses']
+
+        copies = [TextElement(e.text, e.page, list(e.bounds), e.font_size, e.path, e.confidence) for e in elements]
+        tables = engine.detect_table_structure(copies)
+
+        assert canonical(tables, copies) == expected
+        assert engine.page_cache.get_stats()['misses'] == misses
+        assert all(cell.original_element in copies for table in tables for cell in table['cells'])
+
+    def test_settings_change_invalidates(self, elements):
+        """Test results cached under other settings are not reused"""
+        engine = LayoutDetectionEngine()
+        engine.detect_table_structure(elements)
+
+        engine.min_table_elements = 10_000
+
+        assert engine.detect_table_structure(elements) == []
+
+    def test_pages_are_batched_per_worker(self, elements, expected):
+        """Test pending pages go to the executor in BATCHES_PER_WORKER batches per worker"""
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(len(args[1]))
+                return super().submit(fn, *args, **kwargs)
+
+        with RecordingExecutor(max_workers=1) as executor:
+            engine = LayoutDetectionEngine(executor=executor, max_workers=1)
+            tables = engine.detect_table_structure(elements)
+
+        assert canonical(tables, elements) == expected
+        assert submitted == [3] * engine.BATCHES_PER_WORKER
+
+    def test_invalid_mode(self):
+        """Test unknown parallel modes are rejected"""
+        with pytest.raises(ValueError):
+            LayoutDetectionEngine(parallel_mode='gpu')
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for batch parsing with IntelligentFinancialTableParser.parse_many
+"""
+
+import pytest
+import json
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from exceptions import ProcessingError
+from intelligent_financial_table_parser import DocumentParseResult, IntelligentFinancialTableParser
+
+
+def table_document(rows, columns):
+    """structuredData.json content with one table of rows at the given column offsets"""
+    elements = [
+        {'Text': text, 'Page': 0, 'Path': '//Document/Table/TR/TD/P', 'TextSize': 8.0,
+         'Bounds': [x, 700 - 20 * row, x + 70, 710 - 20 * row]}
+        for row, cells in enumerate(rows) for x, text in zip(columns, cells)
+    ]
+    return {'elements': elements}
+
+
+def statement(accounts):
+    """structuredData.json content with a header row and one row per cash account"""
+    rows = [['Account', 'Currency', 'Balance', 'Value']] + [
+        [name, currency, "100'000", "1'234'567"] for name, currency in accounts
+    ]
+    return table_document(rows, [40, 260, 380, 480])
+
+
+def holdings():
+    """structuredData.json content with a header row and two securities rows"""
+    rows = [['Name', 'ISIN', 'Quantity', 'Value', 'Performance', 'Currency'],
+            ['Goldman Sachs Structured Notes 2027', 'XS2530201644', "100'000", "1'234'567", '3.50%', 'USD'],
+            ['UBS AG Bonds 2029', 'CH0244767585', "200'000", "2'000'000", '-1.25%', 'CHF']]
+    return table_document(rows, [40, 220, 320, 400, 480, 540])
+
+
+@pytest.fixture
+def documents(tmp_path):
+    """Five statement files with one to five accounts each"""
+    paths = []
+    for count in range(1, 6):
+        path = tmp_path / f"statement_{count}" / 'structuredData.json'
+        path.parent.mkdir()
+        path.write_text(json.dumps(statement([(f"Cash account {i}", 'CHF') for i in range(count)])))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def holdings_documents(tmp_path):
+    """Three copies of a holdings statement"""
+    paths = []
+    for count in range(3):
+        path = tmp_path / f"holdings_{count}" / 'structuredData.json'
+        path.parent.mkdir()
+        path.write_text(json.dumps(holdings()))
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def parser():
+    """Parser shared by the serial reference run and the batch"""
+    return IntelligentFinancialTableParser()
+
+
+def parsed(results):
+    """Parse results without the processing timestamp"""
+    return {key: value for key, value in results.items() if key != 'extraction_metadata'}
+
+
+class TestParseMany:
+    """Test cases for parse_many"""
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_matches_serial_parsing(self, parser, documents, workers):
+        """Test every document is parsed as parse_financial_document would, with timing"""
+        expected = {path: parsed(parser.parse_financial_document(path)) for path in documents}
+
+        results = list(parser.parse_many(documents, workers=workers))
+
+        assert sorted(result.path for result in results) == sorted(documents)
+        for result in results:
+            assert result.success
+            assert parsed(result.results) == expected[result.path]
+            assert result.results['document_info']['total_elements'] > 0
+            assert result.processing_time > 0
+
+    def test_ordered_results(self, parser, documents):
+        """Test ordered=True yields results in input order"""
+        results = parser.parse_many(documents[::-1], workers=2, ordered=True)
+
+        assert [result.path for result in results] == documents[::-1]
+
+    def test_failures_are_isolated(self, parser, documents, tmp_path):
+        """Test missing and malformed documents fail alone and the rest are parsed"""
+        broken = tmp_path / 'broken.json'
+        broken.write_text('{"elements": [')
+        paths = documents[:2] + [str(tmp_path / 'missing.json'), str(broken)]
+
+        results = {result.path: result for result in parser.parse_many(paths, workers=2)}
+
+        assert all(results[path].success for path in documents[:2])
+        assert results[str(tmp_path / 'missing.json')].error_type == 'NoExtractionData'
+        assert not results[str(broken)].success
+        assert results[str(broken)].error_message
+
+    def test_raise_policy(self, parser, documents, tmp_path):
+        """Test on_error='raise' stops at the first failed document"""
+        with pytest.raises(ProcessingError):
+            list(parser.parse_many([str(tmp_path / 'missing.json')] + documents, workers=1, on_error='raise'))
+        with pytest.raises(ValueError):
+            next(parser.parse_many(documents, on_error='ignore'))
+
+    def test_worker_crash_is_isolated(self, parser, documents, monkeypatch):
+        """Test a document that kills its worker fails alone after the pool restarts"""
+        original = IntelligentFinancialTableParser.parse_financial_document
+
+        def crash_on_third(self, path):
+            if path == documents[2]:
+                os._exit(1)
+            return original(self, path)
+
+        # Forked workers inherit the patched method
+        monkeypatch.setattr(IntelligentFinancialTableParser, 'parse_financial_document', crash_on_third)
+
+        results = {result.path: result for result in parser.parse_many(documents, workers=2)}
+
+        assert len(results) == len(documents)
+        assert results[documents[2]].error_type == 'BrokenProcessPool'
+        assert all(results[path].success for path in documents if path != documents[2])
+        assert isinstance(results[documents[0]], DocumentParseResult)
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_securities_are_extracted_and_validated(self, parser, holdings_documents, workers):
+        """Test securities rows are associated and pass validation in both modes"""
+        results = list(parser.parse_many(holdings_documents, workers=workers))
+
+        assert len(results) == 3
+        for result in results:
+            assert result.success, result.error_message
+            securities = {security['isin']: security for security in result.results['securities']}
+            assert set(securities) == {'XS2530201644', 'CH0244767585'}
+            assert securities['XS2530201644']['performance'] == '3.50%'
+            assert securities['XS2530201644']['currency'] == 'USD'
+            assert result.results['validation_report']['valid_securities'] == 2
+
+    def test_workers_use_caller_settings(self, parser, holdings_documents):
+        """Test worker processes parse with the caller's engine settings, as serial parsing does"""
+        parser.layout_engine.min_table_elements = 10_000
+        parser.association_engine.pattern_brain.security_keywords.append('cash')
+
+        serial = [parsed(result.results) for result in parser.parse_many(holdings_documents, workers=1)]
+        pooled = [parsed(result.results) for result in parser.parse_many(holdings_documents, workers=2, ordered=True)]
+
+        assert pooled == serial
+        assert all(result['securities'] == [] for result in pooled)
+
+    def test_paths_are_read_lazily(self, parser, documents):
+        """Test paths are drawn from the iterable only as the pool has room"""
+        drawn = []
+
+        def paths():
+            for path in documents * 4:
+                drawn.append(path)
+                yield path
+
+        results = parser.parse_many(paths(), workers=2)
+        first = next(results)
+
+        assert first.success
+        assert len(drawn) <= 2 * 2 + 1
+        assert len(list(results)) == len(documents) * 4 - 1
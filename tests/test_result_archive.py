@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests for reading Adobe extraction results straight from the result ZIP
+"""
+
+import pytest
+import json
+import os
+import tempfile
+import zipfile
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from result_archive import (
+    ExtractionArchive, member_ref, split_member_ref, result_exists,
+    open_result, load_structured_data, materialize
+)
+
+
+STRUCTURED_DATA = {
+    'elements': [
+        {'Text': 'Portfolio Total', 'Page': 0, 'Path': '//Document/P', 'Bounds': [10, 20, 110, 30]},
+        {'Text': '1,234.56', 'Page': 0, 'Path': '//Document/Table/TR/TD', 'Bounds': [200, 20, 260, 30]}
+    ],
+    'pages': [{'page_number': 0}]
+}
+
+
+@pytest.fixture
+def result_zip():
+    """Result ZIP laid out like an Adobe extraction with renditions"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        zip_path = os.path.join(temp_dir, "statement_extracted.zip")
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('structuredData.json', json.dumps(STRUCTURED_DATA))
+            zf.writestr('tables/fileoutpart0.csv', "ISIN,Value\nXS0000000001,100\nXS0000000002,250\n")
+            zf.writestr('tables/fileoutpart1.png', b'\x89PNG table')
+            zf.writestr('figures/fileoutpart2.png', b'\x89PNG figure' * 10)
+        yield temp_dir, zip_path
+
+
+class TestResultArchive:
+    """Test cases for ExtractionArchive and archive references"""
+
+    def test_members_by_kind(self, result_zip):
+        """Test members are grouped without extracting anything"""
+        temp_dir, zip_path = result_zip
+
+        with ExtractionArchive(zip_path) as archive:
+            assert archive.json_member == 'structuredData.json'
+            assert archive.table_files('.csv') == ['tables/fileoutpart0.csv']
+            assert archive.table_files('.png') == ['tables/fileoutpart1.png']
+            assert archive.figure_files() == ['figures/fileoutpart2.png']
+            assert archive.size('figures/fileoutpart2.png') == len(b'\x89PNG figure' * 10)
+            assert archive.structured_data() == STRUCTURED_DATA
+
+        assert os.listdir(temp_dir) == ["statement_extracted.zip"]
+
+    def test_read_table_into_dataframe(self, result_zip):
+        """Test table CSVs load from memory"""
+        _, zip_path = result_zip
+
+        with ExtractionArchive(zip_path) as archive:
+            table = archive.read_table('tables/fileoutpart0.csv')
+
+        assert list(table.columns) == ['ISIN', 'Value']
+        assert table['Value'].sum() == 350
+
+    def test_archive_references(self, result_zip):
+        """Test references resolve like plain paths"""
+        temp_dir, zip_path = result_zip
+        ref = member_ref(zip_path, 'structuredData.json')
+
+        assert split_member_ref(ref) == (zip_path, 'structuredData.json')
+        assert split_member_ref('/data/structuredData.json') == (None, '/data/structuredData.json')
+        assert result_exists(ref)
+        assert not result_exists(member_ref(zip_path, 'missing.json'))
+        assert load_structured_data(ref) == STRUCTURED_DATA
+        with open_result(member_ref(zip_path, 'tables/fileoutpart0.csv'), 'r') as f:
+            assert f.readline().strip() == "ISIN,Value"
+
+        plain_path = os.path.join(temp_dir, 'plain.json')
+        with open(plain_path, 'w') as f:
+            json.dump(STRUCTURED_DATA, f)
+        assert load_structured_data(plain_path) == STRUCTURED_DATA
+
+    def test_file_refs_extract_only_on_request(self, result_zip):
+        """Test the opt-in extract-to-disk mode"""
+        temp_dir, zip_path = result_zip
+
+        with ExtractionArchive(zip_path) as archive:
+            lazy = dict(archive.file_refs())
+            assert lazy['structuredData.json'] == member_ref(zip_path, 'structuredData.json')
+            assert os.listdir(temp_dir) == ["statement_extracted.zip"]
+
+            extracted = dict(archive.file_refs(os.path.join(temp_dir, 'statement')))
+            assert os.path.isfile(extracted['figures/fileoutpart2.png'])
+
+    def test_materialize(self, result_zip):
+        """Test a single member or the whole archive can be unpacked for disk-only consumers"""
+        temp_dir, zip_path = result_zip
+
+        json_path = materialize(member_ref(zip_path, 'structuredData.json'))
+        assert json_path == os.path.join(temp_dir, 'statement_extracted', 'structuredData.json')
+        assert not os.path.exists(os.path.join(temp_dir, 'statement_extracted', 'figures'))
+
+        materialize(member_ref(zip_path, 'structuredData.json'), whole_archive=True)
+        assert os.path.isfile(os.path.join(temp_dir, 'statement_extracted', 'figures', 'fileoutpart2.png'))
+        assert materialize('/data/structuredData.json') == '/data/structuredData.json'
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-pass row processing in SmartAssociationEngine
+"""
+
+import pytest
+import os
+import random
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from intelligent_financial_table_parser import (
+    LayoutDetectionEngine, SmartAssociationEngine, TableCell, TextElement
+)
+from token_classifier import TokenFlag, classify_token
+
+TEXTS = ['Goldman Sachs Structured Notes 2027', 'UBS AG Bonds 3.5%', 'Vanguard Equity Fund', 'Treasury',
+         'XS2530201644', 'CH0244767585', "100'000", "1'234'567", '200000', '99.1250', '105.20', '-1.25%',
+         '3.50%', '31.12.2024', '30.06.27', 'USD', 'EUR CHF', 'JPYUSD', 'Total', '', '  12.5%  ', 'n/a']
+
+
+def reference_security_cell(engine, row_cells):
+    """Security name scoring of every cell, as before"""
+    best_cell, best_confidence = None, 0.0
+    for cell in row_cells:
+        is_security, confidence = engine.pattern_brain.recognize_security_name(cell.text)
+        if is_security and confidence > best_confidence:
+            best_cell, best_confidence = cell, confidence
+    return best_cell
+
+
+def reference_record_fields(engine, row_cells, security_cell):
+    """Row text extraction followed by per-cell pattern matching, as before"""
+    fields = {}
+    financial_data = engine.pattern_brain.extract_financial_data(' '.join(cell.text for cell in row_cells))
+    if financial_data.get('isin'):
+        fields['isin'] = financial_data['isin'][0]
+    if financial_data.get('currency'):
+        fields['currency'] = financial_data['currency'][0]
+
+    for cell in row_cells:
+        if cell is security_cell:
+            continue
+        text = cell.text.strip()
+        flags = classify_token(text).flags
+        if flags & TokenFlag.LOOSE_QUANTITY:
+            if 'quantity' not in fields:
+                fields['quantity'] = text
+            elif 'market_value' not in fields:
+                fields['market_value'] = text
+        elif flags & TokenFlag.PRICE:
+            fields.setdefault('price', text)
+        elif flags & TokenFlag.PERCENTAGE:
+            fields.setdefault('performance', text)
+        elif flags & TokenFlag.ISIN:
+            fields['isin'] = text
+        elif flags & TokenFlag.DATE:
+            fields['maturity'] = text
+    return fields
+
+
+def make_row(texts, row=0, classified=True):
+    """Cells of one row, with or without the layout engine's cached classification"""
+    cells = []
+    for column, text in enumerate(texts):
+        element = TextElement(text=text, page=1, bounds=[column * 50.0, 0, column * 50.0 + 40, 10], font_size=9.0,
+                              path='//Document/Table/TR/TD')
+        token = classify_token(text.strip()) if classified else None
+        cells.append(TableCell(text, row, column, element.bounds, token.kind if token else 'text', 1.0, element,
+                               token=token))
+    return cells
+
+
+@pytest.fixture
+def engine():
+    """Association engine with default rules"""
+    return SmartAssociationEngine()
+
+
+class TestRowAssociation:
+    """Test cases for row processing"""
+
+    @pytest.mark.parametrize('classified', [True, False])
+    def test_matches_reference(self, engine, classified):
+        """Test security cells and record fields equal the multi-pass implementation"""
+        rng = random.Random(7)
+        for _ in range(2000):
+            row_cells = make_row([rng.choice(TEXTS) for _ in range(rng.randint(1, 7))], classified=classified)
+
+            security_cell = engine.find_security_in_row(row_cells)
+            assert security_cell is reference_security_cell(engine, row_cells)
+            if security_cell is None:
+                continue
+
+            expected = reference_record_fields(engine, row_cells, security_cell)
+            record = engine.build_security_record_from_row(row_cells, security_cell)
+            if record is not None:
+                fields = {name: getattr(record, name) for name in
+                          ['isin', 'quantity', 'market_value', 'price', 'performance', 'currency', 'maturity']}
+                assert {name: value for name, value in fields.items() if value} == expected
+
+    def test_cells_classified_once(self, engine):
+        """Test classifications are cached on cells and reused"""
+        row_cells = make_row(['Structured Notes Bank AG', 'XS2530201644', "100'000", 'USD'], classified=False)
+
+        token = engine.classify_cell(row_cells[1])
+
+        assert row_cells[1].token is token
+        assert engine.classify_cell(row_cells[1]) is token
+        assert token.kind == 'isin'
+
+    def test_layout_engine_fills_classification(self):
+        """Test table cells built from clusters carry their token classification"""
+        engine = LayoutDetectionEngine()
+        elements = [TextElement(text, 1, [x, y, x + 40, y + 10], 9.0, '//Document/Table/TR/TD')
+                    for y, row in enumerate([['Name', 'ISIN'], ['Structured Notes', 'XS2530201644']])
+                    for x, text in zip([10.0, 300.0], row)]
+        clusters = {row: [(element, element.bounds) for element in elements[row * 2:row * 2 + 2]] for row in range(2)}
+
+        table = engine.build_table_from_clusters(clusters, 1)
+
+        for cell in table['cells']:
+            assert cell.token == classify_token(cell.text.strip())
+            assert cell.data_type == cell.token.kind
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for SpatialIndexer range queries
+"""
+
+import pytest
+import os
+
+import numpy as np
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from optimized_spatial_analysis import SpatialIndexer, TextElement
+
+
+def dense_page(count=2000, seed=7):
+    """Statement-like page: rows every 12pt, columns at fixed offsets, some jitter"""
+    rng = np.random.default_rng(seed)
+    elements = []
+    for i in range(count):
+        row, column = divmod(i, 8)
+        elements.append(TextElement(
+            text=f"cell {i}",
+            page=1,
+            x=40 + column * 65 + rng.uniform(-3, 3),
+            y=row * 12.0 + rng.uniform(-1.5, 1.5),
+            width=rng.uniform(20, 60),
+            height=rng.uniform(6, 10)
+        ))
+    return elements
+
+
+@pytest.fixture(scope="module")
+def indexer():
+    """Indexer over one dense page and one sparse page"""
+    return SpatialIndexer(dense_page() + [TextElement("other page", 2, 0, 0, 10, 10)])
+
+
+class TestSpatialIndexer:
+    """Test cases for SpatialIndexer queries against a linear scan"""
+
+    def test_horizontal_band_matches_scan(self, indexer):
+        """Test row queries return the same elements in page order"""
+        elements = indexer.page_indices[1]['elements']
+        for y in (0.0, 100.4, 1500.0, 2995.5, -50.0):
+            expected = [e for e in elements if abs(e.center_y - y) <= 6.0]
+            assert indexer.find_elements_in_horizontal_band(1, y, tolerance=6.0) == expected
+
+    def test_vertical_band_matches_scan(self, indexer):
+        """Test column queries return the same elements in page order"""
+        elements = indexer.page_indices[1]['elements']
+        for x in (60.0, 255.5, 800.0):
+            expected = [e for e in elements if abs(e.center_x - x) <= 15.0]
+            assert indexer.find_elements_in_vertical_band(1, x, tolerance=15.0) == expected
+
+    def test_region_matches_scan(self, indexer):
+        """Test region queries include partially overlapping elements"""
+        elements = indexer.page_indices[1]['elements']
+        for x, y, width, height in [(100, 200, 150, 40), (0, 0, 1000, 5), (300, 2990, 10, 100), (5000, 0, 10, 10)]:
+            expected = [e for e in elements
+                        if e.x < x + width and e.right > x and e.y < y + height and e.bottom > y]
+            assert indexer.find_elements_in_region(1, x, y, width, height) == expected
+
+    def test_batch_queries(self, indexer):
+        """Test batch variants agree with single queries"""
+        elements = indexer.page_indices[1]['elements']
+        ys = np.arange(0, 3000, 12.0)
+        tolerances = np.full(len(ys), 4.0)
+
+        batched = indexer.horizontal_band_indices(1, ys, tolerances)
+
+        assert len(batched) == len(ys)
+        for y, indices in zip(ys[::25], batched[::25]):
+            assert [elements[i] for i in indices] == indexer.find_elements_in_horizontal_band(1, y, 4.0)
+
+        regions = [(100, y, 200, 12) for y in ys[:10]]
+        for region, indices in zip(regions, indexer.region_indices(1, regions)):
+            assert [elements[i] for i in indices] == indexer.find_elements_in_region(1, *region)
+
+    def test_missing_page(self, indexer):
+        """Test queries on pages without elements"""
+        assert indexer.find_elements_in_horizontal_band(9, 10.0) == []
+        assert indexer.find_elements_in_region(9, 0, 0, 10, 10) == []
+        assert [len(r) for r in indexer.vertical_band_indices(9, [1.0, 2.0])] == [0, 0]
+        assert [e.text for e in indexer.find_elements_in_region(2, 0, 0, 5, 5)] == ["other page"]
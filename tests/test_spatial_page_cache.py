@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the spatial analyzer page result cache
+"""
+
+import pytest
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import performance_monitor
+from optimized_spatial_analysis import OptimizedSpatialAnalyzer, PageResultCache
+from page_cache import PageCachedDetector
+
+
+@pytest.fixture(autouse=True)
+def isolated_monitor(tmp_path, monkeypatch):
+    """Keep analyze_document's result cache and metrics out of the working directory"""
+    monitor = performance_monitor.performance_monitor
+    monkeypatch.setattr(monitor, '_cache', performance_monitor.SmartCache(cache_dir=str(tmp_path / 'cache')))
+    monkeypatch.setattr(monitor, 'metrics_file', str(tmp_path / 'performance_metrics.json'))
+    monkeypatch.setattr(monitor, 'metrics_history', [])
+
+
+def holdings_page(page, seed=0, rows=6):
+    """Three-column holdings table: ISIN, value, weight"""
+    elements = []
+    for row in range(rows):
+        cells = [(50, f"XS00000{row}{seed}"), (250, f"{1000 + row * 7 + seed:,}.00"), (400, f"{row + seed}.5%")]
+        for x, text in cells:
+            elements.append({'Text': text, 'Page': page, 'Bounds': [x, 100 + row * 14, 60, 10], 'TextSize': 8})
+    return elements
+
+
+@pytest.fixture
+def analyzer():
+    """Sequential analyzer so cache statistics are deterministic"""
+    return OptimizedSpatialAnalyzer(enable_parallel=False)
+
+
+class TestPageResultCache:
+    """Test cases for page result reuse"""
+
+    def test_unchanged_pages_are_reused(self, analyzer):
+        """Test only the changed page is analyzed again"""
+        analyzer.analyze_document(holdings_page(0) + holdings_page(1, 1) + holdings_page(2, 2))
+        changed = holdings_page(0) + holdings_page(1, 1) + holdings_page(2, 3)
+        result = analyzer.analyze_document(changed)
+
+        stats = analyzer.page_cache.get_stats()
+        assert (stats['hits'], stats['misses']) == (2, 4)
+
+        uncached = OptimizedSpatialAnalyzer(enable_parallel=False, cache_size=0).analyze_document(changed)
+        assert result['tables'] == uncached['tables']
+
+    def test_template_page_on_another_page_number(self, analyzer):
+        """Test a recurring page is keyed on content, and results carry the new page number"""
+        analyzer.analyze_document(holdings_page(0, 1) + holdings_page(1, 2))
+        result = analyzer.analyze_document(holdings_page(5, 1))
+
+        assert analyzer.page_cache.stats['hits'] == 1
+        assert [table['page'] for table in result['tables']] == [5]
+        assert result['tables'][0]['data'][0][0] == 'XS0000001'
+
+    def test_parameters_are_part_of_the_key(self, analyzer):
+        """Test changed tolerances do not reuse earlier results"""
+        analyzer.analyze_document(holdings_page(0))
+        analyzer.row_tolerance = 4.0
+        analyzer.analyze_document(holdings_page(0) + holdings_page(1, 1))
+
+        assert (analyzer.page_cache.stats['hits'], analyzer.page_cache.stats['misses']) == (0, 3)
+
+    def test_bounded_with_explicit_eviction(self):
+        """Test least recently used entries are evicted beyond max_entries"""
+        cache = PageResultCache(max_entries=2)
+        cache.put('a', [])
+        cache.put('b', [])
+        cache.get('a')
+        cache.put('c', [])
+
+        assert cache.get('b') is None
+        assert cache.get('a') == []
+        assert cache.stats['evictions'] == 1
+
+        assert cache.evict('a') is True
+        assert cache.evict('a') is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_disabled_cache(self):
+        """Test cache_size=0 stores nothing"""
+        analyzer = OptimizedSpatialAnalyzer(enable_parallel=False, cache_size=0)
+        analyzer.analyze_document(holdings_page(0))
+
+        assert len(analyzer.page_cache) == 0
+
+    def test_detector_hooks_are_required(self):
+        """Test a detector missing a hook fails when built, not inside a pooled batch"""
+        class Incomplete(PageCachedDetector):
+            def _page_content(self, elements):
+                yield b''
+
+        with pytest.raises(TypeError, match='_detect_page'):
+            Incomplete()
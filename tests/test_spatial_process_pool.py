@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for process-pool page analysis in the spatial analyzer
+"""
+
+import pytest
+import os
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import performance_monitor
+from optimized_spatial_analysis import OptimizedSpatialAnalyzer, _analyze_page_batch, _page_arrays
+
+
+@pytest.fixture(autouse=True)
+def isolated_monitor(tmp_path, monkeypatch):
+    """Keep analyze_document's result cache and metrics out of the working directory"""
+    monitor = performance_monitor.performance_monitor
+    monkeypatch.setattr(monitor, '_cache', performance_monitor.SmartCache(cache_dir=str(tmp_path / 'cache')))
+    monkeypatch.setattr(monitor, 'metrics_file', str(tmp_path / 'performance_metrics.json'))
+    monkeypatch.setattr(monitor, 'metrics_history', [])
+
+
+def statement(pages, rows=8):
+    """Multi-page statement with one five-column table per page"""
+    elements = []
+    for page in range(pages):
+        for row in range(rows):
+            for column, x in enumerate([50, 180, 300, 420, 520]):
+                text = f"XS{page:04d}{row:04d}" if column == 0 else f"{(page * 31 + row * 7 + column) % 9999:,}.{column}0"
+                elements.append({'Text': text, 'Page': page, 'Bounds': [x, 60 + row * 14, 60, 10], 'TextSize': 8})
+    return elements
+
+
+@pytest.fixture
+def process_analyzer():
+    """Analyzer with a small process pool, shut down after the test"""
+    with OptimizedSpatialAnalyzer(enable_parallel=True, parallel_mode='process', max_workers=2) as analyzer:
+        yield analyzer
+
+
+class TestProcessPoolAnalysis:
+    """Test cases for parallel_mode='process'"""
+
+    def test_matches_sequential_analysis(self, process_analyzer):
+        """Test process results equal single-threaded results"""
+        document = statement(12)
+        sequential = OptimizedSpatialAnalyzer(enable_parallel=False).analyze_document(document)
+
+        result = process_analyzer.analyze_document(document)
+
+        assert result['tables'] == sequential['tables']
+        assert len(result['tables']) == 12
+
+    def test_pool_is_reused_and_results_cached(self, process_analyzer):
+        """Test one pool serves several documents and fills the page cache"""
+        process_analyzer.analyze_document(statement(4))
+        pool = process_analyzer._pool
+        process_analyzer.analyze_document(statement(5))
+
+        assert pool is not None and process_analyzer._pool is pool
+        assert process_analyzer.page_cache.stats['hits'] == 4
+
+        process_analyzer.close()
+        assert process_analyzer._pool is None
+
+    def test_worker_batch_from_arrays(self):
+        """Test the worker task rebuilds pages from coordinate arrays"""
+        analyzer = OptimizedSpatialAnalyzer(enable_parallel=False)
+        from_dicts = analyzer._convert_elements(statement(1))
+        geometry, texts = _page_arrays(from_dicts)
+
+        [records] = _analyze_page_batch(analyzer._cache_parameters(), [(0, geometry, texts)])
+
+        assert geometry.shape == (40, 5)
+        assert [analyzer._table_from_record(r, from_dicts, 0).rows for r in records] == [8]
+
+    def test_rejects_unknown_mode(self):
+        """Test parallel_mode is validated"""
+        with pytest.raises(ValueError):
+            OptimizedSpatialAnalyzer(parallel_mode='gpu')
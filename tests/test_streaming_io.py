@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming upload/download helpers
+"""
+
+import pytest
+import os
+import mmap
+import tempfile
+from unittest.mock import Mock, patch
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    from streaming_io import open_upload_stream, save_result_asset
+except ImportError as e:
+    pytest.skip(f"Skipping streaming tests due to import error: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def pdf_file():
+    """Create a small PDF-like file"""
+    temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+    temp_file.write(b'%PDF-1.4\n' + b'x' * 4096)
+    temp_file.close()
+
+    yield temp_file.name
+
+    os.unlink(temp_file.name)
+
+
+class TestOpenUploadStream:
+    """Test cases for open_upload_stream"""
+
+    def test_file_handle_mode(self, pdf_file):
+        """Test default mode yields an unread file handle"""
+        with open_upload_stream(pdf_file) as stream:
+            assert not isinstance(stream, mmap.mmap)
+            assert stream.tell() == 0
+            assert stream.read(8) == b'%PDF-1.4'
+
+    def test_mmap_mode(self, pdf_file):
+        """Test mmap mode yields a read-only mapped buffer"""
+        with open_upload_stream(pdf_file, use_mmap=True) as stream:
+            assert isinstance(stream, mmap.mmap)
+            assert len(stream) == os.path.getsize(pdf_file)
+
+    def test_mmap_mode_empty_file(self):
+        """Test mmap mode falls back to a file handle for empty files"""
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            empty_path = f.name
+
+        try:
+            with open_upload_stream(empty_path, use_mmap=True) as stream:
+                assert not isinstance(stream, mmap.mmap)
+        finally:
+            os.unlink(empty_path)
+
+
+class TestSaveResultAsset:
+    """Test cases for save_result_asset"""
+
+    def test_chunked_download(self):
+        """Test result is written chunk by chunk from the download URI"""
+        result_asset = Mock()
+        result_asset.get_download_uri.return_value = "https://example.com/result.zip"
+
+        response = Mock()
+        response.iter_content.return_value = [b'abc', b'', b'def']
+        response.__enter__ = Mock(return_value=response)
+        response.__exit__ = Mock(return_value=False)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "result.zip")
+
+            with patch('streaming_io.requests.get', return_value=response) as mock_get:
+                written = save_result_asset(Mock(), result_asset, output_path, chunk_size=3)
+
+            mock_get.assert_called_once()
+            response.iter_content.assert_called_once_with(chunk_size=3)
+            assert written == 6
+            with open(output_path, 'rb') as f:
+                assert f.read() == b'abcdef'
+            assert not os.path.exists(output_path + ".part")
+
+    def test_fallback_to_sdk_content(self):
+        """Test assets without a download URI use the SDK download"""
+        pdf_services = Mock()
+        pdf_services.get_content.return_value.get_input_stream.return_value = b'zipdata'
+        result_asset = Mock(spec=[])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "result.zip")
+            written = save_result_asset(pdf_services, result_asset, output_path)
+
+            assert written == 7
+            pdf_services.get_content.assert_called_once_with(result_asset)
+
+    def test_failed_download_leaves_no_file(self):
+        """Test a failed download does not leave a partial ZIP"""
+        pdf_services = Mock()
+        pdf_services.get_content.side_effect = Exception("Download failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "result.zip")
+
+            with pytest.raises(Exception):
+                save_result_asset(pdf_services, Mock(spec=[]), output_path)
+
+            assert os.listdir(temp_dir) == []
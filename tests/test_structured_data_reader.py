@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming structuredData.json reader
+"""
+
+import pytest
+import json
+import os
+import tempfile
+import zipfile
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import structured_data_reader
+from structured_data_reader import StructuredDataReader, iter_elements
+from result_archive import member_ref
+from intelligent_financial_table_parser import IntelligentFinancialTableParser
+
+
+DOCUMENT = {
+    'version': {'json_export': '1.1.0', 'page_segmentation': '1.0.0'},
+    'extended_metadata': {'page_count': 2, 'title': 'Statement [draft], "Q1"'},
+    'elements': [
+        {'Text': 'Portfolio ', 'Page': 0, 'Path': '//Document/H1', 'Bounds': [10.5, 700, 200, 720]},
+        {'Page': 0, 'Path': '//Document/Figure', 'Bounds': [10, 400, 300, 600], 'filePaths': ['figures/1.png']},
+        {'Text': 'XS2530201644', 'Page': 1, 'Path': '//Document/Table/TR/TD/P', 'Bounds': [12, 500, 90, 510]},
+        {'Text': '1,234.56', 'Page': 1, 'Path': '//Document/Table/TR/TD[2]/P', 'TextSize': 8.04},
+        {'Text': ' ', 'Page': 1, 'Path': '//Document/P[3]'},
+        {'Text': 'Footnote {1}', 'Page': 0, 'Path': '//Document/Footnote'}
+    ],
+    'pages': [{'page_number': 0, 'width': 595}, {'page_number': 1, 'width': 595}]
+}
+
+
+@pytest.fixture
+def structured_json():
+    """structuredData.json on disk with pretty and compact layouts"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'structuredData.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(DOCUMENT, f, indent=2)
+        yield temp_dir, path
+
+
+@pytest.fixture(params=['builtin', 'ijson'])
+def parser_backend(request, monkeypatch):
+    """Run with the built-in scanner and, when installed, with ijson"""
+    if request.param == 'builtin':
+        monkeypatch.setattr(structured_data_reader, 'ijson', None)
+    elif structured_data_reader.ijson is None:
+        pytest.skip("ijson not installed")
+    return request.param
+
+
+class TestStructuredDataReader:
+    """Test cases for StructuredDataReader"""
+
+    @pytest.mark.parametrize('read_size', [1, 7, 64, 65536])
+    def test_matches_json_load(self, structured_json, parser_backend, read_size):
+        """Test streamed elements equal json.load output at any chunk size"""
+        _, path = structured_json
+
+        assert list(StructuredDataReader(path, read_size=read_size)) == DOCUMENT['elements']
+
+    def test_compact_json_and_archive_reference(self, parser_backend):
+        """Test compact layout read straight from a result ZIP"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = os.path.join(temp_dir, 'doc_extracted.zip')
+            with zipfile.ZipFile(zip_path, 'w') as zf:
+                zf.writestr('structuredData.json', json.dumps(DOCUMENT, separators=(',', ':')))
+
+            reader = StructuredDataReader(member_ref(zip_path, 'structuredData.json'), read_size=16)
+            assert list(reader) == DOCUMENT['elements']
+
+    def test_filters(self, structured_json, parser_backend):
+        """Test page, Path prefix and text filters"""
+        _, path = structured_json
+
+        on_page_1 = list(iter_elements(path, pages=[1], text_only=True))
+        assert [e['Text'] for e in on_page_1] == ['XS2530201644', '1,234.56']
+
+        tables = list(iter_elements(path, path_prefix='//Document/Table'))
+        assert len(tables) == 2
+        assert all(e['Path'].startswith('//Document/Table') for e in tables)
+
+        text = list(iter_elements(path, text_only=True))
+        assert len(text) == 4
+
+    def test_iter_pages_groups_runs(self, structured_json, parser_backend):
+        """Test consecutive elements are grouped by page"""
+        _, path = structured_json
+
+        groups = [(page, len(elements)) for page, elements in StructuredDataReader(path).iter_pages()]
+        assert groups == [(0, 2), (1, 3), (0, 1)]
+
+    def test_reiterable_with_stable_repr(self, structured_json):
+        """Test readers can be iterated twice and repr identifies the file version"""
+        _, path = structured_json
+        reader = StructuredDataReader(path, pages={1})
+
+        assert list(reader) == list(reader)
+        assert repr(reader) == repr(StructuredDataReader(path, pages=[1]))
+        assert repr(reader) != repr(StructuredDataReader(path, pages=[0]))
+
+    def test_empty_and_malformed_documents(self, parser_backend):
+        """Test documents without elements and truncated files"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            empty = os.path.join(temp_dir, 'empty.json')
+            with open(empty, 'w') as f:
+                json.dump({'version': {}, 'elements': [], 'pages': []}, f)
+            assert list(StructuredDataReader(empty)) == []
+
+            truncated = os.path.join(temp_dir, 'truncated.json')
+            with open(truncated, 'w') as f:
+                f.write(json.dumps(DOCUMENT)[:150])
+            with pytest.raises(Exception):
+                list(StructuredDataReader(truncated))
+
+    def test_parser_accepts_stream(self, structured_json):
+        """Test the table parser loads from a path or an element stream"""
+        _, path = structured_json
+        parser = IntelligentFinancialTableParser()
+
+        from_path = parser.load_adobe_extraction(path, pages=[1])
+        from_stream = parser.load_adobe_extraction(StructuredDataReader(path, pages=[1]))
+
+        assert [e.text for e in from_path] == ['XS2530201644', '1,234.56']
+        assert [e.text for e in from_stream] == [e.text for e in from_path]
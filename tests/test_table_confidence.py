@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit tests for vectorized table confidence scoring
+"""
+
+import pytest
+import os
+
+import numpy as np
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from optimized_spatial_analysis import OptimizedSpatialAnalyzer, TableCandidate, TextElement
+
+
+def reference_confidence(analyzer, aligned_rows, column_positions):
+    """Per-cell loop scoring the vectorized version must reproduce"""
+    factors = []
+    consistency = 0.0
+    for col in range(len(column_positions)):
+        cells = [row[col] for row in aligned_rows if col < len(row) and row[col].text.strip()]
+        if len(cells) > 1:
+            consistency += max(0, 1 - np.std([e.center_x for e in cells]) / analyzer.column_tolerance)
+    factors.append(consistency / len(column_positions))
+
+    filled = sum(1 for row in aligned_rows for e in row if e.text.strip())
+    factors.append(filled / (len(aligned_rows) * len(column_positions)))
+
+    if len(aligned_rows) > 1:
+        heights = [np.mean([e.height for e in row if e.text.strip()])
+                   for row in aligned_rows if any(e.text.strip() for e in row)]
+        if len(heights) > 1:
+            mean = np.mean(heights)
+            factors.append(max(0, 1 - np.std(heights) / mean) if mean > 0 else 0)
+
+    patterns = []
+    for col in range(len(aligned_rows[0])):
+        texts = [row[col].text.strip() for row in aligned_rows if row[col].text.strip()]
+        if len(texts) > 1:
+            patterns.append(sum(analyzer._is_numeric_value(t) for t in texts) / len(texts))
+    if len(aligned_rows) > 1:
+        first = [e.font_size for e in aligned_rows[0] if e.text.strip()]
+        rest = [e.font_size for row in aligned_rows[1:] for e in row if e.text.strip()]
+        if first and rest and np.mean(first) > np.mean(rest):
+            patterns.append(0.8)
+    factors.append(np.mean(patterns) if patterns else 0.0)
+
+    return min(1.0, max(0.0, sum(f * w for f, w in zip(factors, [0.3, 0.3, 0.2, 0.2]))))
+
+
+def random_table(rng):
+    """Aligned rows with empty cells, mixed numeric text, jittered geometry and fonts"""
+    rows, columns = int(rng.integers(1, 12)), int(rng.integers(1, 7))
+    positions = [60.0 + 90 * c for c in range(columns)]
+    words = ['XS2530201644', '1,234.56', '$99', '12.5%', 'Total', '', '  ', 'n/a', '-3e2']
+    aligned = []
+    for r in range(rows):
+        font = 10.0 if r == 0 and rng.random() < 0.5 else 8.0
+        aligned.append([
+            TextElement(text=str(rng.choice(words)), page=1, x=p - 20 + rng.uniform(-6, 6), y=r * 14.0,
+                        width=40.0, height=float(rng.uniform(6, 12)), font_size=font)
+            for p in positions
+        ])
+    return TableCandidate(elements=[], rows=rows, columns=columns, confidence=0.0, page=1,
+                          bounding_box=(0, 0, 0, 0), row_groups=aligned, column_alignment=positions)
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer with default tolerances"""
+    return OptimizedSpatialAnalyzer(enable_parallel=False)
+
+
+class TestTableConfidence:
+    """Test cases for confidence scoring"""
+
+    def test_matches_reference(self, analyzer):
+        """Test single-table scores equal the per-cell computation"""
+        rng = np.random.default_rng(3)
+        for _ in range(300):
+            table = random_table(rng)
+            expected = reference_confidence(analyzer, table.row_groups, table.column_alignment)
+            assert analyzer._calculate_table_confidence(table.row_groups, table.column_alignment) == \
+                pytest.approx(expected, abs=1e-12)
+
+    def test_batch_matches_single(self, analyzer):
+        """Test padded batch scoring equals scoring tables one by one"""
+        rng = np.random.default_rng(4)
+        tables = [random_table(rng) for _ in range(50)]
+
+        scores = analyzer.score_tables(tables)
+
+        single = [analyzer._calculate_table_confidence(t.row_groups, t.column_alignment) for t in tables]
+        np.testing.assert_allclose(scores, single, atol=1e-12)
+        assert analyzer.score_tables([]).shape == (0,)
+
+    def test_empty_inputs(self, analyzer):
+        """Test tables without rows or columns score zero"""
+        assert analyzer._calculate_table_confidence([], [10.0]) == 0.0
+        assert analyzer._calculate_table_confidence([[TextElement("", 1, 0, 0, 10, 10)]], []) == 0.0
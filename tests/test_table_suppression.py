@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for overlap suppression of table candidates
+"""
+
+import pytest
+import os
+import time
+
+import numpy as np
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from optimized_spatial_analysis import OptimizedSpatialAnalyzer, TableCandidate, _overlapping_pairs
+
+
+def candidates(count, pages=3, seed=0):
+    """Random candidates, many of them nested or partially overlapping"""
+    rng = np.random.default_rng(seed)
+    tables = []
+    for _ in range(count):
+        x, y = rng.uniform(0, 500), rng.uniform(0, 800)
+        box = (x, y, float(rng.uniform(0, 200)), float(rng.uniform(0, 150)))
+        tables.append(TableCandidate(elements=[], rows=2, columns=2, confidence=float(rng.integers(0, 20)) / 20,
+                                     page=int(rng.integers(0, pages)), bounding_box=box,
+                                     row_groups=[], column_alignment=[]))
+    return tables
+
+
+def pairwise_suppression(analyzer, tables, metric='max_ratio'):
+    """Greedy all-pairs suppression the sweep must reproduce"""
+    kept = []
+    for table in sorted(tables, key=lambda t: t.confidence, reverse=True):
+        if not any(analyzer._tables_overlap(table, other, analyzer.overlap_threshold, metric) for other in kept):
+            kept.append(table)
+    return kept
+
+
+@pytest.fixture
+def analyzer():
+    """Analyzer with default overlap settings"""
+    return OptimizedSpatialAnalyzer(enable_parallel=False)
+
+
+class TestTableSuppression:
+    """Test cases for _post_process_tables"""
+
+    @pytest.mark.parametrize('metric', ['max_ratio', 'iou'])
+    def test_matches_pairwise_suppression(self, analyzer, metric):
+        """Test kept tables and their order equal the all-pairs greedy result"""
+        analyzer.overlap_metric = metric
+        for seed in range(5):
+            tables = candidates(300, seed=seed)
+            expected = pairwise_suppression(analyzer, list(tables), metric)
+
+            assert analyzer._post_process_tables(list(tables)) == expected
+
+    def test_pages_are_independent(self, analyzer):
+        """Test identical boxes on different pages are all kept"""
+        same_box = [TableCandidate([], 2, 2, 0.9, page, (10, 10, 100, 100), [], []) for page in range(4)]
+
+        assert [table.page for table in analyzer._post_process_tables(same_box)] == [0, 1, 2, 3]
+
+    def test_iou_threshold(self):
+        """Test a small box inside a large one is suppressed by ratio but not by IoU"""
+        boxes = np.array([[0, 0, 100, 100], [10, 10, 20, 20]], dtype=float)
+
+        assert len(_overlapping_pairs(boxes, 0.3, 'max_ratio')[0]) == 1
+        assert len(_overlapping_pairs(boxes, 0.3, 'iou')[0]) == 0
+        with pytest.raises(ValueError):
+            _overlapping_pairs(boxes, 0.3, 'area')
+
+    def test_thousands_of_candidates(self, analyzer):
+        """Test suppression over many small candidates stays fast"""
+        rng = np.random.default_rng(1)
+        tables = [TableCandidate([], 2, 2, float(rng.random()), page, (float(x), float(y), 40.0, 20.0), [], [])
+                  for page in range(20) for x in range(0, 500, 50) for y in range(0, 800, 40)]
+
+        start = time.perf_counter()
+        kept = analyzer._post_process_tables(tables)
+
+        assert len(kept) == len(tables) == 4000
+        assert time.perf_counter() - start < 2.0
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the financial token classifier
+"""
+
+import pytest
+import os
+import random
+import re
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from token_classifier import TokenFlag, classify_token
+from intelligent_financial_table_parser import LayoutDetectionEngine, PatternRecognitionBrain
+from working_universal_parser import UniversalSecurityRecord, WorkingUniversalParser
+
+
+# The patterns the parsers used to test one by one
+PATTERNS = {
+    TokenFlag.ISIN: r'^[A-Z]{2}\d{10}$',
+    TokenFlag.ISIN_LIKE: r'^[A-Z]{2}[A-Z0-9]{9}\d$',
+    TokenFlag.VALOR: r'^\d{6,12}$',
+    TokenFlag.AMOUNT: r"^\d{1,3}(?:[,']\d{3})*(?:\.\d{2})?$",
+    TokenFlag.US_AMOUNT: r'^\d{1,3}(?:,\d{3})*(?:\.\d{2})?$',
+    TokenFlag.QUANTITY: r"^\d{1,3}(?:[,']\d{3})*(?:\.\d+)?$",
+    TokenFlag.SWISS_QUANTITY: r"^\d{1,3}(?:'\d{3})*(?:\.\d+)?$",
+    TokenFlag.LOOSE_QUANTITY: r"^\d{1,3}(?:'?\d{3})*(?:\.\d+)?$",
+    TokenFlag.PRICE: r'^\d+\.\d{2,6}$',
+    TokenFlag.PERCENTAGE: r'^-?\d+\.\d+%$',
+    TokenFlag.DATE: r'^\d{2}\.\d{2}\.\d{4}$',
+    TokenFlag.DATE_US: r'^\d{2}/\d{2}/\d{4}$',
+    TokenFlag.MATURITY: r'^\d{2}\.\d{2}\.\d{2,4}$',
+    TokenFlag.ISIN_PREFIX: r'[A-Z]{2}\d{10}',
+    TokenFlag.CUSIP_PREFIX: r'[A-Z0-9]{9}',
+    TokenFlag.SEDOL_PREFIX: r'[A-Z0-9]{7}',
+    TokenFlag.WKN_PREFIX: r'[A-Z0-9]{6}',
+    TokenFlag.VALOR_PREFIX: r'\d{6,12}',
+    TokenFlag.TICKER_PREFIX: r'[A-Z]{1,5}'
+}
+
+
+def fuzz_tokens(count=40000, seed=1):
+    """Random strings over digits, separators, signs and letters, plus ISIN-shaped codes"""
+    rng = random.Random(seed)
+    alphabet = "0123456789" * 4 + ",'.-%/AXZb ١"
+    for i in range(count):
+        if i % 4 == 0:
+            yield "XS" + ''.join(rng.choice("0123456789A١") for _ in range(rng.randint(9, 11)))
+        else:
+            yield ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+
+
+class TestTokenClassifier:
+    """Test cases for classify_token"""
+
+    def test_flags_match_patterns(self):
+        """Test every flag agrees with its regular expression"""
+        for token in fuzz_tokens():
+            flags = classify_token.__wrapped__(token).flags
+            for flag, pattern in PATTERNS.items():
+                assert bool(flags & flag) == bool(re.match(pattern, token)), (token, pattern)
+
+    @pytest.mark.parametrize('token,kind,value', [
+        ('XS2530201644', 'isin', None),
+        ("100'000", 'currency', 100000.0),
+        ('1,234,567.891', 'quantity', 1234567.891),
+        ('-1.25%', 'percentage', -1.25),
+        ('31.12.2024', 'date', None),
+        ('99.1250', 'price', 99.125),
+        ('USD', 'text', None),
+        ('', 'text', None)
+    ])
+    def test_kind_and_value(self, token, kind, value):
+        """Test kind precedence and normalized numbers"""
+        info = classify_token(token)
+
+        assert (info.kind, info.value) == (kind, value)
+
+    def test_memoized(self):
+        """Test repeated tokens are served from the memo"""
+        classify_token.cache_clear()
+        for _ in range(3):
+            classify_token("200'000")
+
+        assert classify_token.cache_info().hits == 2
+
+
+class TestParserIntegration:
+    """Parsers give the same answers through the classifier"""
+
+    def test_classify_data_type(self):
+        """Test cell types, including Swiss apostrophes treated as currency"""
+        engine = LayoutDetectionEngine()
+
+        assert [engine.classify_data_type(text) for text in [' CH0244767585 ', "1'500.00", '12.5%', 'Total']] == \
+            ['isin', 'currency', 'percentage', 'text']
+
+    def test_extract_financial_data(self):
+        """Test anchored patterns match a whole text, allowing a trailing newline"""
+        brain = PatternRecognitionBrain()
+
+        assert brain.extract_financial_data("99.50\n") == {
+            'currency_amount': ['99.50'], 'price': ['99.50'], 'quantity': ['99.50']
+        }
+        assert brain.extract_financial_data("USD 99.50") == {'currency': ['USD']}
+
+    def test_edited_financial_patterns_are_honoured(self):
+        """Test an edited financial pattern is matched as written instead of by its default flag"""
+        brain = PatternRecognitionBrain()
+        brain.financial_patterns['price'] = r'^\d+,\d{2}$'
+
+        assert 'price' not in brain.extract_financial_data('99.50')
+        assert brain.extract_financial_data('99,50')['price'] == ['99,50']
+        assert PatternRecognitionBrain().extract_financial_data('99.50')['price'] == ['99.50']
+
+    def test_edited_identifier_patterns_are_honoured(self):
+        """Test an edited identifier pattern is matched as written instead of by its default flag"""
+        parser = WorkingUniversalParser()
+        parser.universal_patterns['identifiers']['ticker'] = r'[A-Z]{1,5}\.SW$'
+        security = UniversalSecurityRecord(name='Nestle SA')
+
+        parser.extract_financial_data_universal([{'text': 'NESN.SW'}, {'text': 'CHF'}], 'NESN.SW CHF', security,
+                                                {'detected_format': 'swiss_banks'})
+
+        assert security.ticker == 'NESN.SW'
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for IMS access token management
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from token_manager import TokenManager, FileTokenStore, AccessToken
+
+
+class CountingFetcher:
+    """Fake IMS endpoint that counts token requests"""
+
+    def __init__(self, expires_in=86400, delay=0.01):
+        self.calls = 0
+        self.expires_in = expires_in
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {'access_token': f"token-{self.calls}", 'expires_in': self.expires_in}
+
+
+class TestTokenManager:
+    """Test cases for TokenManager"""
+
+    def test_token_is_cached(self):
+        """Test repeated calls reuse the token until it nears expiry"""
+        fetcher = CountingFetcher()
+        manager = TokenManager("client-id", fetcher)
+
+        async def run():
+            tokens = [await manager.get_token() for _ in range(5)]
+            await manager.close()
+            return tokens
+
+        assert asyncio.run(run()) == ["token-1"] * 5
+        assert fetcher.calls == 1
+        assert manager.stats['cache_hits'] == 4
+
+    def test_concurrent_refreshes_are_single_flight(self):
+        """Test concurrent callers share one token request"""
+        fetcher = CountingFetcher(delay=0.05)
+        manager = TokenManager("client-id", fetcher)
+
+        async def run():
+            tokens = await asyncio.gather(*(manager.get_token() for _ in range(20)))
+            await manager.close()
+            return tokens
+
+        assert set(asyncio.run(run())) == {"token-1"}
+        assert fetcher.calls == 1
+
+    def test_background_refresh_before_expiry(self):
+        """Test the token is renewed ahead of expiry without a caller waiting"""
+        fetcher = CountingFetcher(expires_in=1.5)
+        manager = TokenManager("client-id", fetcher, refresh_margin=0.4)
+
+        async def run():
+            first = await manager.get_token()
+            await asyncio.sleep(1.3)
+            second = manager.token.access_token
+            await manager.close()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == "token-1"
+        assert second == "token-2"
+
+    def test_file_store_shares_token_between_managers(self):
+        """Test a second process reuses the token saved by the first"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FileTokenStore(os.path.join(temp_dir, "tokens.json"))
+            first_fetcher, second_fetcher = CountingFetcher(), CountingFetcher()
+
+            async def run():
+                first = TokenManager("client-id", first_fetcher, store=store, background_refresh=False)
+                second = TokenManager("client-id", second_fetcher, store=store, background_refresh=False)
+                return await first.get_token(), await second.get_token()
+
+            assert asyncio.run(run()) == ("token-1", "token-1")
+            assert second_fetcher.calls == 0
+            assert os.stat(store.path).st_mode & 0o777 == 0o600
+
+    def test_file_store_defaults_to_private_user_cache(self, monkeypatch):
+        """Test the default token file lives under the user's home and is private"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monkeypatch.setenv("HOME", temp_dir)
+            store = FileTokenStore()
+            directory = os.path.dirname(store.path)
+            os.makedirs(directory)
+            with open(store.path, 'w') as f:
+                f.write('{}')
+            os.chmod(store.path, 0o644)
+
+            store.save("key", AccessToken("secret", time.time() + 3600))
+
+            assert store.path.startswith(os.path.join(temp_dir, ".cache") + os.sep)
+            assert os.stat(store.path).st_mode & 0o777 == 0o600
+            assert store.load("key").access_token == "secret"
+
+    def test_invalidate_bypasses_shared_token(self):
+        """Test a rejected token is not reloaded from the store"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = FileTokenStore(os.path.join(temp_dir, "tokens.json"))
+            fetcher = CountingFetcher()
+            manager = TokenManager("client-id", fetcher, store=store, background_refresh=False)
+            store.save(manager.key, AccessToken("rejected", time.time() + 3600))
+
+            async def run():
+                manager.invalidate()
+                return await manager.get_token()
+
+            assert asyncio.run(run()) == "token-1"
+            assert store.load(manager.key).access_token == "token-1"
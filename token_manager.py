@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+IMS Access Token Management for Adobe PDF Services
+Caches tokens until shortly before expiry, refreshes them in the background
+and optionally shares them between processes through a file or Redis
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Dict, Optional
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Per-user location, outside any working tree the process runs in
+DEFAULT_TOKEN_FILE = "~/.cache/adobe_pdf_services/ims_tokens.json"
+
+
+@dataclass
+class AccessToken:
+    """An IMS access token and the time it stops being valid"""
+    access_token: str
+    expires_at: float  # Unix timestamp
+
+    @classmethod
+    def from_response(cls, token_data: Dict) -> 'AccessToken':
+        """Build from an IMS token response; expires_in is in seconds"""
+        return cls(token_data['access_token'], time.time() + float(token_data.get('expires_in', 3600)))
+
+    def is_valid(self, margin: float = 0.0) -> bool:
+        """Check whether the token stays valid for at least margin seconds"""
+        return time.time() + margin < self.expires_at
+
+
+class FileTokenStore:
+    """Token store shared by processes of one user on one host through a private JSON file"""
+
+    def __init__(self, path: str = DEFAULT_TOKEN_FILE):
+        self.path = os.path.expanduser(path)
+
+    def load(self, key: str) -> Optional[AccessToken]:
+        try:
+            with open(self.path, 'r') as f:
+                entry = json.load(f).get(key)
+        except (OSError, ValueError):
+            return None
+        return AccessToken(**entry) if entry else None
+
+    def save(self, key: str, token: AccessToken):
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        entries[key] = asdict(token)
+
+        # Write a private temporary file and rename it so readers never see a partial file
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # A leftover temporary file keeps its old mode through O_CREAT
+        os.chmod(temp_path, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.path)
+
+
+class RedisTokenStore:
+    """Token store shared by processes on many hosts through Redis"""
+
+    def __init__(self, redis_url: str = "redis://localhost:6379/0", prefix: str = "adobe_ims_token:"):
+        if redis is None:
+            raise ImportError("redis is required for RedisTokenStore")
+        self.client = redis.Redis.from_url(redis_url)
+        self.prefix = prefix
+
+    def load(self, key: str) -> Optional[AccessToken]:
+        entry = self.client.get(self.prefix + key)
+        return AccessToken(**json.loads(entry)) if entry else None
+
+    def save(self, key: str, token: AccessToken):
+        # Let Redis drop the entry when the token expires
+        ttl = max(1, int(token.expires_at - time.time()))
+        self.client.set(self.prefix + key, json.dumps(asdict(token)), ex=ttl)
+
+
+class TokenManager:
+    """
+    Cached IMS token with single-flight refresh
+
+    Concurrent callers that find the token missing or about to expire share
+    one refresh request. After each refresh a background task renews the
+    token refresh_margin seconds before it expires, so callers on the
+    critical path normally get the cached token without a network round trip.
+    """
+
+    def __init__(self, client_id: str, fetch_token: Callable[[], Awaitable[Dict]],
+                 store: Optional[object] = None, refresh_margin: float = 300.0,
+                 background_refresh: bool = True):
+        """
+        Initialize token manager
+
+        Args:
+            client_id: Adobe API client ID the tokens belong to
+            fetch_token: Coroutine function returning an IMS token response
+            store: Optional FileTokenStore or RedisTokenStore shared between processes
+            refresh_margin: Seconds before expiry at which a token is renewed
+            background_refresh: Renew tokens ahead of expiry without waiting for a caller
+        """
+        self.fetch_token = fetch_token
+        self.store = store
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+
+        # Store key identifies the client without exposing its ID
+        self.key = hashlib.sha256(client_id.encode()).hexdigest()[:16]
+
+        self.token: Optional[AccessToken] = None
+        self._rejected = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._background_task: Optional[asyncio.Task] = None
+
+        self.stats = {'cache_hits': 0, 'shared_hits': 0, 'refreshes': 0}
+
+    async def get_token(self) -> str:
+        """
+        Get a valid access token, refreshing it if needed
+
+        Returns:
+            Bearer access token
+        """
+        if self.token and self.token.is_valid(self.refresh_margin):
+            self.stats['cache_hits'] += 1
+            return self.token.access_token
+
+        # A rejected token may still sit in the shared store
+        shared = None if self._rejected else self._load_shared()
+        if shared and shared.is_valid(self.refresh_margin):
+            self.stats['shared_hits'] += 1
+            self._set_token(shared)
+            return shared.access_token
+
+        return (await self.refresh()).access_token
+
+    async def refresh(self) -> AccessToken:
+        """Fetch a new token; concurrent calls share one request"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.ensure_future(self._fetch())
+        # Shield so a cancelled caller does not cancel the refresh others wait on
+        return await asyncio.shield(self._refresh_task)
+
+    def invalidate(self):
+        """Drop the cached token, e.g. after the API rejected it"""
+        self.token = None
+        self._rejected = True
+
+    async def _fetch(self) -> AccessToken:
+        token = AccessToken.from_response(await self.fetch_token())
+        self.stats['refreshes'] += 1
+        self._rejected = False
+        logger.debug(f"IMS token refreshed, valid for {token.expires_at - time.time():.0f}s")
+
+        self._set_token(token)
+        if self.store is not None:
+            try:
+                self.store.save(self.key, token)
+            except Exception as e:
+                logger.warning(f"Could not share IMS token: {e}")
+        return token
+
+    def _load_shared(self) -> Optional[AccessToken]:
+        if self.store is None:
+            return None
+        try:
+            return self.store.load(self.key)
+        except Exception as e:
+            logger.warning(f"Could not read shared IMS token: {e}")
+            return None
+
+    def _set_token(self, token: AccessToken):
+        self.token = token
+        if self.background_refresh and (self._background_task is None or self._background_task.done()):
+            self._background_task = asyncio.ensure_future(self._refresh_ahead())
+
+    async def _refresh_ahead(self):
+        """Renew the token shortly before it expires"""
+        while self.token is not None:
+            # Short-lived tokens would otherwise be renewed in a tight loop
+            delay = self.token.expires_at - self.refresh_margin - time.time()
+            await asyncio.sleep(max(delay, 1.0))
+            try:
+                await self.refresh()
+            except Exception as e:
+                # Leave it to the next caller to retry on the critical path
+                logger.warning(f"Background IMS token refresh failed: {e}")
+                return
+
+    async def close(self):
+        """Stop background refresh"""
+        if self._background_task is not None:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._background_task = None
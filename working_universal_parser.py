@@ -8,10 +8,15 @@ import os
 import json
 import pandas as pd
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Union
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+from result_archive import result_exists
+from structured_data_reader import StructuredDataReader
+from element_table import ElementTable
+from token_classifier import TokenFlag, token_flags
+
 @dataclass
 class UniversalSecurityRecord:
     """Universal security record that works across all document types"""
@@ -38,6 +43,22 @@ class UniversalSecurityRecord:
     source_page: int = -1
     validation_flags: List[str] = field(default_factory=list)
 
+# Token classifier flag for each default identifier pattern, matched as a
+# prefix like re.match; an edited pattern is matched with re instead
+IDENTIFIER_FLAGS = {
+    'isin': (r'[A-Z]{2}\d{10}', TokenFlag.ISIN_PREFIX),
+    'cusip': (r'[A-Z0-9]{9}', TokenFlag.CUSIP_PREFIX),
+    'sedol': (r'[A-Z0-9]{7}', TokenFlag.SEDOL_PREFIX),
+    'valorn': (r'\d{6,12}', TokenFlag.VALOR_PREFIX),
+    'wkn': (r'[A-Z0-9]{6}', TokenFlag.WKN_PREFIX),
+    'ticker': (r'[A-Z]{1,5}', TokenFlag.TICKER_PREFIX)
+}
+
+LABELLED_ISIN = re.compile(r'ISIN:\s*([A-Z]{2}\d{10})')
+LABELLED_VALORN = re.compile(r'Valorn\.?:\s*(\d+)')
+COUPON_RATE = re.compile(r'\d+\.\d+%.*coupon', re.IGNORECASE)
+
+
 class WorkingUniversalParser:
     """Working universal parser using existing Adobe extraction"""
     
@@ -128,7 +149,7 @@ class WorkingUniversalParser:
             r'.*CREDIT LINKED.*NOTES'
         ]
     
-    def parse_any_financial_pdf(self, adobe_extraction_path: str) -> Dict[str, Any]:
+    def parse_any_financial_pdf(self, adobe_extraction_path: Union[str, ElementTable, Iterable[Dict]]) -> Dict[str, Any]:
         """Parse ANY financial PDF using universal logic"""
         
         print("🌍 **WORKING UNIVERSAL FINANCIAL PDF PARSER**")
@@ -157,18 +178,34 @@ class WorkingUniversalParser:
         
         return results
     
-    def load_adobe_extraction(self, extraction_path: str) -> List[Dict]:
-        """Load Adobe extraction results"""
-        
-        if not os.path.exists(extraction_path):
-            print(f"❌ Adobe extraction file not found: {extraction_path}")
-            return []
-        
-        with open(extraction_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def load_adobe_extraction(self, extraction_path: Union[str, ElementTable, Iterable[Dict]],
+                              pages: Optional[Iterable[int]] = None,
+                              path_prefix: Optional[str] = None) -> List[Dict]:
+        """Load Adobe extraction results from a file, result ZIP reference, ElementTable or element stream"""
+        
+        if isinstance(extraction_path, ElementTable):
+            table = extraction_path
+            rows = table.select(pages=pages, path_prefix=path_prefix)
+            return [
+                {'text': table.text(row), 'page': page, 'bounds': bounds if has_bounds else [],
+                 'path': table.path(row), 'font_size': size}
+                for row, page, bounds, has_bounds, size in zip(
+                    rows.tolist(), table.page[rows].tolist(), table.bounds[rows].tolist(),
+                    table.has_bounds[rows].tolist(), table.text_size[rows].tolist()
+                )
+            ]
+        
+        if isinstance(extraction_path, str):
+            if not result_exists(extraction_path):
+                print(f"❌ Adobe extraction file not found: {extraction_path}")
+                return []
+            element_stream = StructuredDataReader(extraction_path, pages=pages,
+                                                  path_prefix=path_prefix, text_only=True)
+        else:
+            element_stream = extraction_path
         
         elements = []
-        for element_data in data.get('elements', []):
+        for element_data in element_stream:
             element = {
                 'text': element_data.get('Text', '').strip(),
                 'page': element_data.get('Page', 0),
@@ -335,19 +372,21 @@ class WorkingUniversalParser:
         
         for element in row_elements:
             text = element['text'].strip()
+            flags = token_flags(text)
             
             # Extract identifiers using universal patterns
             for id_type, pattern in self.universal_patterns['identifiers'].items():
-                if re.match(pattern, text):
+                default_pattern, flag = IDENTIFIER_FLAGS.get(id_type, (None, None))
+                if (flags & flag) if pattern == default_pattern else re.match(pattern, text):
                     setattr(security, id_type, text)
             
             # Extract ISIN with label
-            isin_match = re.search(r'ISIN:\s*([A-Z]{2}\d{10})', text)
+            isin_match = LABELLED_ISIN.search(text)
             if isin_match:
                 security.isin = isin_match.group(1)
             
             # Extract Valorn (Swiss)
-            valorn_match = re.search(r'Valorn\.?:\s*(\d+)', text)
+            valorn_match = LABELLED_VALORN.search(text)
             if valorn_match:
                 security.valorn = valorn_match.group(1)
             
@@ -365,33 +404,33 @@ class WorkingUniversalParser:
             # Extract quantities based on detected format
             if detected_format == 'swiss_banks':
                 # Swiss format: 100'000
-                if re.match(r"^\d{1,3}(?:'\d{3})*(?:\.\d+)?$", text):
+                if flags & TokenFlag.SWISS_QUANTITY:
                     if not security.quantity:
                         security.quantity = text
                     elif not security.market_value:
                         security.market_value = text
             else:
                 # US/European format: 100,000
-                if re.match(r"^\d{1,3}(?:,\d{3})*(?:\.\d{2})?$", text):
+                if flags & TokenFlag.US_AMOUNT:
                     if not security.quantity:
                         security.quantity = text
                     elif not security.market_value:
                         security.market_value = text
             
             # Extract prices (decimal numbers)
-            if re.match(r'^\d+\.\d{2,6}$', text):
+            if flags & TokenFlag.PRICE:
                 if not security.unit_price:
                     security.unit_price = text
             
             # Extract performance (percentages)
-            if re.match(r'^-?\d+\.\d+%$', text):
+            if flags & TokenFlag.PERCENTAGE:
                 if not security.performance_ytd:
                     security.performance_ytd = text
                 elif not security.performance_total:
                     security.performance_total = text
             
             # Extract coupon rate
-            if re.search(r'\d+\.\d+%.*coupon', text, re.IGNORECASE):
+            if COUPON_RATE.search(text):
                 security.coupon_rate = text
         
         # Determine asset class